@@ -0,0 +1,94 @@
+"""add_member_row_hash
+
+Adds row_hash to members_raw and members_raw_stg so member upserts can skip
+unchanged rows, and inserted / updated / unchanged counts to
+ingestion_run_metrics. Existing members have no hash yet, so the first run
+after this rewrites each of them once.
+
+Revision ID: add_member_row_hash
+Revises: partition_court_availabilities
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from dotenv import load_dotenv
+from pathlib import Path
+import os
+
+
+# revision identifiers, used by Alembic.
+revision: str = "add_member_row_hash"
+down_revision: Union[str, None] = "partition_court_availabilities"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UPSERT_COUNT_COLUMNS = ("inserted", "updated", "unchanged")
+
+
+def _table_exists(table_name: str, schema: str = None) -> bool:
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        if schema:
+            return table_name in inspector.get_table_names(schema=schema)
+        return table_name in inspector.get_table_names()
+    except Exception:
+        return False
+
+
+def _column_exists(table_name: str, column_name: str, schema: str = None) -> bool:
+    """Check if a column exists in a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        if schema:
+            columns = [col["name"] for col in inspector.get_columns(table_name, schema=schema)]
+        else:
+            columns = [col["name"] for col in inspector.get_columns(table_name)]
+        return column_name in columns
+    except Exception:
+        return False
+
+
+def upgrade() -> None:
+    # Get schema from environment
+    env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+    load_dotenv(dotenv_path=env_path)
+    schema = os.getenv("PG_SCHEMA")
+
+    for table in ("members_raw", "members_raw_stg"):
+        if _table_exists(table, schema) and not _column_exists(table, "row_hash", schema):
+            op.add_column(
+                table,
+                sa.Column("row_hash", sa.Text(), nullable=True),
+                schema=schema,
+            )
+
+    if _table_exists("ingestion_run_metrics", schema):
+        for column in UPSERT_COUNT_COLUMNS:
+            if not _column_exists("ingestion_run_metrics", column, schema):
+                op.add_column(
+                    "ingestion_run_metrics",
+                    sa.Column(column, sa.Integer(), nullable=True),
+                    schema=schema,
+                )
+
+
+def downgrade() -> None:
+    env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+    load_dotenv(dotenv_path=env_path)
+    schema = os.getenv("PG_SCHEMA")
+
+    if _table_exists("ingestion_run_metrics", schema):
+        for column in UPSERT_COUNT_COLUMNS:
+            if _column_exists("ingestion_run_metrics", column, schema):
+                op.drop_column("ingestion_run_metrics", column, schema=schema)
+
+    for table in ("members_raw_stg", "members_raw"):
+        if _table_exists(table, schema) and _column_exists(table, "row_hash", schema):
+            op.drop_column(table, "row_hash", schema=schema)
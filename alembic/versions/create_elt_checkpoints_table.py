@@ -0,0 +1,71 @@
+"""create_elt_checkpoints_table
+
+Revision ID: create_elt_checkpoints
+Revises: add_skill_level_events_stg
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from dotenv import load_dotenv
+from pathlib import Path
+import os
+
+
+# revision identifiers, used by Alembic.
+revision: str = "create_elt_checkpoints"
+down_revision: Union[str, None] = "add_skill_level_events_stg"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str, schema: str = None) -> bool:
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        if schema:
+            return table_name in inspector.get_table_names(schema=schema)
+        return table_name in inspector.get_table_names()
+    except Exception:
+        return False
+
+
+def upgrade() -> None:
+    # Get schema from environment
+    env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+    load_dotenv(dotenv_path=env_path)
+    schema = os.getenv("PG_SCHEMA")
+
+    # One row per committed (or in-progress) date window of a windowed
+    # ingestion; rows are cleared once the client's watermark advances
+    if not _table_exists("elt_checkpoints", schema):
+        op.create_table(
+            "elt_checkpoints",
+            sa.Column("pipeline", sa.Text(), nullable=False),
+            sa.Column("client_code", sa.Text(), nullable=False),
+            sa.Column("window_start", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("window_end", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("page", sa.Integer(), nullable=True),
+            sa.Column("status", sa.Text(), nullable=False),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=True,
+            ),
+            sa.PrimaryKeyConstraint("pipeline", "client_code", "window_start"),
+            schema=schema,
+        )
+
+
+def downgrade() -> None:
+    env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+    load_dotenv(dotenv_path=env_path)
+    schema = os.getenv("PG_SCHEMA")
+
+    if _table_exists("elt_checkpoints", schema):
+        op.drop_table("elt_checkpoints", schema=schema)
@@ -0,0 +1,87 @@
+"""create_ingestion_run_metrics_table
+
+Revision ID: create_ingestion_run_metrics
+Revises: create_elt_checkpoints
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from dotenv import load_dotenv
+from pathlib import Path
+import os
+
+
+# revision identifiers, used by Alembic.
+revision: str = "create_ingestion_run_metrics"
+down_revision: Union[str, None] = "create_elt_checkpoints"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table_name: str, schema: str = None) -> bool:
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        if schema:
+            return table_name in inspector.get_table_names(schema=schema)
+        return table_name in inspector.get_table_names()
+    except Exception:
+        return False
+
+
+def upgrade() -> None:
+    # Get schema from environment
+    env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+    load_dotenv(dotenv_path=env_path)
+    schema = os.getenv("PG_SCHEMA")
+
+    # One row per (pipeline, client, stage) per ingestion run
+    if not _table_exists("ingestion_run_metrics", schema):
+        op.create_table(
+            "ingestion_run_metrics",
+            sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+            sa.Column("run_id", sa.Text(), nullable=False),
+            sa.Column("run_label", sa.Text(), nullable=False),
+            sa.Column("pipeline", sa.Text(), nullable=False),
+            sa.Column("client_code", sa.Text(), nullable=False),
+            sa.Column("stage", sa.Text(), nullable=False),
+            sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("duration_seconds", sa.Numeric(12, 4), nullable=False),
+            sa.Column("rows", sa.Integer(), nullable=False),
+            sa.Column("bytes", sa.BigInteger(), nullable=False),
+            sa.Column("api_calls", sa.Integer(), nullable=False),
+            sa.Column("calls", sa.Integer(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=True,
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema=schema,
+        )
+        op.create_index(
+            "ingestion_run_metrics_pipeline_client_started_idx",
+            "ingestion_run_metrics",
+            ["pipeline", "client_code", "started_at"],
+            schema=schema,
+        )
+
+
+def downgrade() -> None:
+    env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+    load_dotenv(dotenv_path=env_path)
+    schema = os.getenv("PG_SCHEMA")
+
+    if _table_exists("ingestion_run_metrics", schema):
+        op.drop_index(
+            "ingestion_run_metrics_pipeline_client_started_idx",
+            table_name="ingestion_run_metrics",
+            schema=schema,
+        )
+        op.drop_table("ingestion_run_metrics", schema=schema)
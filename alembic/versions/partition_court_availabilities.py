@@ -0,0 +1,189 @@
+"""partition_court_availabilities
+
+Converts facility_court_availabilities to LIST partitions on client_code, one
+partition per client (facility_court_availabilities_<client_code>) plus a
+default partition. Partitions are created for every client code in the table
+or in organizations; PostgresClient.ensure_client_partition adds new clients
+before their first load, and replacing a client's availability truncates its
+partition instead of deleting row by row.
+
+The primary key on a partitioned table has to include the partition key, so
+PRIMARY KEY (id) becomes PRIMARY KEY (id, client_code).
+
+Revision ID: partition_court_availabilities
+Revises: partition_reservation_tables
+Create Date: 2026-10-19 12:30:00.000000
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect, text
+from dotenv import load_dotenv
+from pathlib import Path
+import os
+
+
+# revision identifiers, used by Alembic.
+revision: str = "partition_court_availabilities"
+down_revision: Union[str, None] = "partition_reservation_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "facility_court_availabilities"
+
+
+def _table_exists(table_name: str, schema: str = None) -> bool:
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        if schema:
+            return table_name in inspector.get_table_names(schema=schema)
+        return table_name in inspector.get_table_names()
+    except Exception:
+        return False
+
+
+def _is_partitioned(table_name: str, schema: str) -> bool:
+    return bool(
+        op.get_bind()
+        .execute(
+            text(
+                """
+                SELECT 1
+                  FROM pg_partitioned_table pt
+                  JOIN pg_class c ON c.oid = pt.partrelid
+                  JOIN pg_namespace n ON n.oid = c.relnamespace
+                 WHERE n.nspname = :schema AND c.relname = :table
+                """
+            ),
+            {"schema": schema, "table": table_name},
+        )
+        .scalar()
+    )
+
+
+def _move_id_sequence(schema: str, source: str, target: str) -> None:
+    """Hand a serial id sequence to the new table so dropping the old one keeps it."""
+    sequence = (
+        op.get_bind()
+        .execute(
+            text("SELECT pg_get_serial_sequence(:table, 'id')"),
+            {"table": f'"{schema}"."{source}"'},
+        )
+        .scalar()
+    )
+    if sequence:
+        op.execute(f'ALTER SEQUENCE {sequence} OWNED BY "{schema}"."{target}".id')
+
+
+def _client_codes(schema: str, source: str) -> list:
+    """Lowercased client codes, as ingestion writes them."""
+    bind = op.get_bind()
+    codes = {
+        row[0].lower()
+        for row in bind.execute(
+            text(
+                f'SELECT DISTINCT client_code FROM "{schema}"."{source}" '
+                "WHERE client_code IS NOT NULL"
+            )
+        )
+    }
+    if _table_exists("organizations", schema):
+        codes |= {
+            row[0].lower()
+            for row in bind.execute(
+                text(
+                    f'SELECT DISTINCT client_code FROM "{schema}"."organizations" '
+                    "WHERE client_code IS NOT NULL"
+                )
+            )
+        }
+    return sorted(codes)
+
+
+def upgrade() -> None:
+    # Get schema from environment
+    env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+    load_dotenv(dotenv_path=env_path)
+    schema = os.getenv("PG_SCHEMA")
+
+    if not schema:
+        print("Warning: PG_SCHEMA not set, skipping migration")
+        return
+
+    if not _table_exists(TABLE, schema) or _is_partitioned(TABLE, schema):
+        return
+
+    legacy = f"{TABLE}_unpartitioned"
+    op.execute(f'ALTER TABLE "{schema}"."{TABLE}" RENAME TO "{legacy}"')
+    op.execute(
+        f"""
+        CREATE TABLE "{schema}"."{TABLE}" (
+            LIKE "{schema}"."{legacy}" INCLUDING DEFAULTS
+        ) PARTITION BY LIST (client_code)
+        """
+    )
+    op.execute(
+        f'CREATE TABLE "{schema}"."{TABLE}_default" PARTITION OF "{schema}"."{TABLE}" DEFAULT'
+    )
+
+    # Ingestion lowercases client codes (ensure_client_partition), so older
+    # mixed-case rows are normalized to land in the same partitions
+    op.execute(
+        f'UPDATE "{schema}"."{legacy}" SET client_code = lower(client_code) '
+        "WHERE client_code <> lower(client_code)"
+    )
+
+    # Same naming as ingestion.clients.postgres_mixins.client_partition_name;
+    # codes that collide after sanitizing stay in the default partition
+    partitions = {}
+    for code in _client_codes(schema, legacy):
+        partitions.setdefault(f"{TABLE}_{re.sub(r'[^a-z0-9_]', '_', code)}", code)
+    for partition, code in partitions.items():
+        op.get_bind().execute(
+            text(
+                f'CREATE TABLE "{schema}"."{partition}" '
+                f'PARTITION OF "{schema}"."{TABLE}" FOR VALUES IN (:code)'
+            ),
+            {"code": code},
+        )
+
+    op.execute(f'INSERT INTO "{schema}"."{TABLE}" SELECT * FROM "{schema}"."{legacy}"')
+    _move_id_sequence(schema, legacy, TABLE)
+    op.execute(f'DROP TABLE "{schema}"."{legacy}" CASCADE')
+    op.create_primary_key(
+        f"{TABLE}_pkey", TABLE, ["id", "client_code"], schema=schema
+    )
+    print(f"Partitioned {schema}.{TABLE} into {len(partitions)} client partitions")
+
+
+def downgrade() -> None:
+    env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+    load_dotenv(dotenv_path=env_path)
+    schema = os.getenv("PG_SCHEMA")
+
+    if not schema:
+        print("Warning: PG_SCHEMA not set, skipping migration")
+        return
+
+    if not _table_exists(TABLE, schema) or not _is_partitioned(TABLE, schema):
+        return
+
+    legacy = f"{TABLE}_partitioned"
+    op.execute(f'ALTER TABLE "{schema}"."{TABLE}" RENAME TO "{legacy}"')
+    op.execute(f'ALTER TABLE "{schema}"."{legacy}" RENAME CONSTRAINT "{TABLE}_pkey" TO "{legacy}_pkey"')
+    op.execute(
+        f"""
+        CREATE TABLE "{schema}"."{TABLE}" (
+            LIKE "{schema}"."{legacy}" INCLUDING DEFAULTS
+        )
+        """
+    )
+    op.execute(f'INSERT INTO "{schema}"."{TABLE}" SELECT * FROM "{schema}"."{legacy}"')
+    _move_id_sequence(schema, legacy, TABLE)
+    # Drops every partition with it
+    op.execute(f'DROP TABLE "{schema}"."{legacy}" CASCADE')
+    op.create_primary_key(f"{TABLE}_pkey", TABLE, ["id"], schema=schema)
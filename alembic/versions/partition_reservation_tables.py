@@ -0,0 +1,239 @@
+"""partition_reservation_tables
+
+Converts reservations_raw to RANGE partitions on reservation_start_at and
+reservation_cancellations_raw to RANGE partitions on cancelled_on, one
+partition per month plus a default partition (NULLs and anything outside the
+monthly partitions). Monthly partitions are created from the oldest row, but
+no further back than PARTITION_MONTHS_BACK months (older rows, e.g. bogus
+timestamps, stay in the default partition), to PARTITION_MONTHS_AHEAD months
+out; PostgresClient.ensure_monthly_partitions adds later months before
+loading rows into them.
+
+A unique index on a partitioned table has to include the partition key, so:
+  reservations_raw: PRIMARY KEY (client_code, reservation_id) is dropped (like
+    reservations_raw_stg) and the unique index (client_code, reservation_id,
+    member_id) becomes (client_code, reservation_id, member_id,
+    reservation_start_at)
+  reservation_cancellations_raw: PRIMARY KEY (id) becomes a unique index on
+    (id, cancelled_on)
+
+Views on these tables (dbt staging models) are dropped with the old tables;
+run dbt afterwards to recreate them.
+
+Revision ID: partition_reservation_tables
+Revises: create_ingestion_run_metrics
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect, text
+from dotenv import load_dotenv
+from pathlib import Path
+import os
+
+
+# revision identifiers, used by Alembic.
+revision: str = "partition_reservation_tables"
+down_revision: Union[str, None] = "create_ingestion_run_metrics"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITION_MONTHS_BACK = 60
+PARTITION_MONTHS_AHEAD = 24
+
+# table -> (partition column, unique index name, unique index columns,
+#           whether it has a serial id)
+PARTITIONED_TABLES = {
+    "reservations_raw": (
+        "reservation_start_at",
+        "reservations_raw_client_res_member_start_idx",
+        "client_code, reservation_id, member_id, reservation_start_at",
+        False,
+    ),
+    "reservation_cancellations_raw": (
+        "cancelled_on",
+        "reservation_cancellations_raw_id_cancelled_on_idx",
+        "id, cancelled_on",
+        True,
+    ),
+}
+
+
+def _table_exists(table_name: str, schema: str = None) -> bool:
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    try:
+        if schema:
+            return table_name in inspector.get_table_names(schema=schema)
+        return table_name in inspector.get_table_names()
+    except Exception:
+        return False
+
+
+def _is_partitioned(table_name: str, schema: str) -> bool:
+    return bool(
+        op.get_bind()
+        .execute(
+            text(
+                """
+                SELECT 1
+                  FROM pg_partitioned_table pt
+                  JOIN pg_class c ON c.oid = pt.partrelid
+                  JOIN pg_namespace n ON n.oid = c.relnamespace
+                 WHERE n.nspname = :schema AND c.relname = :table
+                """
+            ),
+            {"schema": schema, "table": table_name},
+        )
+        .scalar()
+    )
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _move_id_sequence(schema: str, source: str, target: str) -> None:
+    """Hand a serial id sequence to the new table so dropping the old one keeps it."""
+    sequence = (
+        op.get_bind()
+        .execute(
+            text("SELECT pg_get_serial_sequence(:table, 'id')"),
+            {"table": f'"{schema}"."{source}"'},
+        )
+        .scalar()
+    )
+    if sequence:
+        op.execute(f'ALTER SEQUENCE {sequence} OWNED BY "{schema}"."{target}".id')
+
+
+def _partition(schema: str, table: str) -> None:
+    column, index_name, index_columns, id_sequence = PARTITIONED_TABLES[table]
+    legacy = f"{table}_unpartitioned"
+    bind = op.get_bind()
+
+    op.execute(f'ALTER TABLE "{schema}"."{table}" RENAME TO "{legacy}"')
+    op.execute(
+        f"""
+        CREATE TABLE "{schema}"."{table}" (
+            LIKE "{schema}"."{legacy}" INCLUDING DEFAULTS
+        ) PARTITION BY RANGE ({column})
+        """
+    )
+    op.execute(
+        f'CREATE TABLE "{schema}"."{table}_default" PARTITION OF "{schema}"."{table}" DEFAULT'
+    )
+
+    oldest = bind.execute(
+        text(f'SELECT min({column}) FROM "{schema}"."{legacy}"')
+    ).scalar()
+    today = date.today().replace(day=1)
+    first = _add_months(today, -PARTITION_MONTHS_BACK)
+    month = max(date(oldest.year, oldest.month, 1), first) if oldest else today
+    last = _add_months(today, PARTITION_MONTHS_AHEAD)
+    while month <= last:
+        next_month = _add_months(month, 1)
+        op.execute(
+            f"""
+            CREATE TABLE "{schema}"."{table}_p{month:%Y_%m}"
+            PARTITION OF "{schema}"."{table}"
+            FOR VALUES FROM ('{month} 00:00:00+00') TO ('{next_month} 00:00:00+00')
+            """
+        )
+        month = next_month
+
+    op.execute(f'INSERT INTO "{schema}"."{table}" SELECT * FROM "{schema}"."{legacy}"')
+    if id_sequence:
+        _move_id_sequence(schema, legacy, table)
+    op.execute(f'DROP TABLE "{schema}"."{legacy}" CASCADE')
+    op.execute(
+        f'CREATE UNIQUE INDEX {index_name} ON "{schema}"."{table}" ({index_columns})'
+    )
+    print(f"Partitioned {schema}.{table} by month of {column}")
+
+
+def _unpartition(schema: str, table: str) -> None:
+    legacy = f"{table}_partitioned"
+    op.execute(f'ALTER TABLE "{schema}"."{table}" RENAME TO "{legacy}"')
+    op.execute(
+        f"""
+        CREATE TABLE "{schema}"."{table}" (
+            LIKE "{schema}"."{legacy}" INCLUDING DEFAULTS
+        )
+        """
+    )
+    op.execute(f'INSERT INTO "{schema}"."{table}" SELECT * FROM "{schema}"."{legacy}"')
+    if PARTITIONED_TABLES[table][3]:
+        _move_id_sequence(schema, legacy, table)
+    # Drops every partition with it
+    op.execute(f'DROP TABLE "{schema}"."{legacy}" CASCADE')
+    print(f"Reverted {schema}.{table} to a plain table")
+
+
+def upgrade() -> None:
+    # Get schema from environment
+    env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+    load_dotenv(dotenv_path=env_path)
+    schema = os.getenv("PG_SCHEMA")
+
+    if not schema:
+        print("Warning: PG_SCHEMA not set, skipping migration")
+        return
+
+    for table in PARTITIONED_TABLES:
+        if _table_exists(table, schema) and not _is_partitioned(table, schema):
+            _partition(schema, table)
+
+
+def downgrade() -> None:
+    env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+    load_dotenv(dotenv_path=env_path)
+    schema = os.getenv("PG_SCHEMA")
+
+    if not schema:
+        print("Warning: PG_SCHEMA not set, skipping migration")
+        return
+
+    if _table_exists("reservations_raw", schema) and _is_partitioned(
+        "reservations_raw", schema
+    ):
+        _unpartition(schema, "reservations_raw")
+        # A rescheduled reservation can't have two rows once the key drops
+        # reservation_start_at; keep the latest. The primary key is not
+        # restored: it never allowed more than one member per reservation
+        op.execute(
+            f"""
+            DELETE FROM "{schema}"."reservations_raw" a
+            USING (
+                SELECT ctid,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY client_code, reservation_id, member_id
+                           ORDER BY reservation_updated_at DESC NULLS LAST, created_at DESC
+                       ) AS rn
+                  FROM "{schema}"."reservations_raw"
+            ) b
+            WHERE a.ctid = b.ctid AND b.rn > 1
+            """
+        )
+        op.execute(
+            f"""
+            CREATE UNIQUE INDEX reservations_raw_client_res_member_idx
+            ON "{schema}"."reservations_raw" (client_code, reservation_id, member_id)
+            """
+        )
+
+    if _table_exists("reservation_cancellations_raw", schema) and _is_partitioned(
+        "reservation_cancellations_raw", schema
+    ):
+        _unpartition(schema, "reservation_cancellations_raw")
+        op.create_primary_key(
+            "reservation_cancellations_raw_pkey",
+            "reservation_cancellations_raw",
+            ["id"],
+            schema=schema,
+        )
@@ -0,0 +1,423 @@
+"""
+End-to-end ingestion benchmark against local Postgres and the mock API.
+
+Runs each refresh_* pipeline for a synthetic fleet (benchmarks.synthetic)
+served by benchmarks.mock_api, at one or more dataset scales, and reports
+per pipeline: records/s (API records fetched per second of wall time),
+p50/p95 API latency, DB load time (stage_load + dedupe + promote stages),
+peak RSS and wall time. Every pipeline runs in a fresh interpreter so RSS and
+cached module state don't carry over.
+
+Needs PG_DSN / PG_SCHEMA for a scratch database migrated to head
+(make migrate-upgrade). Rows, watermarks and checkpoints of the synthetic
+clients (codes starting with --prefix) are deleted before each scale.
+
+    python -m benchmarks.bench_e2e --scales 1,10 --facilities 4
+    python -m benchmarks.bench_e2e --save-baseline
+    python -m benchmarks.bench_e2e --max-regression 0.2
+
+Results are compared with the baseline JSON (--baseline); the run exits 1
+when a pipeline's records/s falls more than --max-regression below it, or
+its DB load time grows more than --max-regression above it. A missing
+baseline also exits 1 unless --allow-missing-baseline is passed. Record the
+baseline on the reference machine into benchmarks/baselines/ with
+--save-baseline and commit it.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.mock_api import MockApiConfig, credential_env, start_in_thread
+from benchmarks.synthetic import FleetSpec
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "e2e.json")
+DEFAULT_PIPELINES = (
+    "courtreserve_members",
+    "courtreserve_reservations",
+    "courtreserve_reservation_cancellations",
+    "courtreserve_events",
+    "courtreserve_court_availability",
+    "podplay_members",
+    "podplay_reservations",
+    "podplay_events",
+    "podplay_court_availability",
+)
+DB_STAGES = ("stage_load", "dedupe", "promote")
+# Baseline DB load times below this are too noisy to gate on
+MIN_GATED_DB_SECONDS = 0.1
+
+# Tables the pipelines write per client, cleared before each scale
+CLIENT_TABLES = (
+    "members_raw",
+    "reservations_raw",
+    "reservation_cancellations_raw",
+    "facility_events_raw",
+    "facility_court_availabilities",
+    "elt_checkpoints",
+)
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _fleet(args: argparse.Namespace, scale: float) -> FleetSpec:
+    return FleetSpec(
+        facilities=args.facilities,
+        members=args.members,
+        courts=args.courts,
+        reservations_per_day=args.reservations_per_day,
+        events_per_day=args.events_per_day,
+        history_days=args.history_days,
+        horizon_days=7,
+        seed=args.seed,
+        prefix=args.prefix,
+    ).scaled(scale)
+
+
+def _metadata(fleet: FleetSpec):
+    """Snapshot for the fleet: even facilities on CourtReserve, odd on Podplay."""
+    from ingestion.metadata import build_metadata_snapshot
+
+    hours = {"open": "07:00", "close": "23:00"}
+    organizations = []
+    courts = []
+    for index, spec in enumerate(fleet.facility_specs()):
+        is_courtreserve = index % 2 == 0
+        organizations.append(
+            {
+                "client_code": spec.code,
+                "source_system_code": "courtreserve" if is_courtreserve else "podplay",
+                "is_customer": True,
+                "podplay_pod_id": None if is_courtreserve else f"pod-{spec.code}",
+                "operating_hours": {
+                    "timezone": "America/New_York",
+                    **{
+                        day: hours
+                        for day in (
+                            "monday",
+                            "tuesday",
+                            "wednesday",
+                            "thursday",
+                            "friday",
+                            "saturday",
+                            "sunday",
+                        )
+                    },
+                },
+            }
+        )
+        if is_courtreserve:
+            courts.extend(
+                {
+                    "id": f"{spec.code}-{n}",
+                    "client_code": spec.code,
+                    "label": f"Court #{n}",
+                    "type_name": "Pickleball",
+                    "order_index": n,
+                }
+                for n in range(1, spec.courts + 1)
+            )
+    return build_metadata_snapshot(organizations, courts)
+
+
+def _reset(pg_client, prefix: str) -> None:
+    import psycopg2
+
+    pattern = f"{prefix}%"
+    conn = psycopg2.connect(pg_client.dsn)
+    try:
+        with conn, conn.cursor() as cur:
+            for table in CLIENT_TABLES:
+                cur.execute(
+                    f'DELETE FROM "{pg_client.schema}"."{table}" WHERE client_code LIKE %s',
+                    (pattern,),
+                )
+            # Watermark keys are "<pipeline>__<client_code>"
+            cur.execute(
+                f'DELETE FROM "{pg_client.schema}".elt_watermarks WHERE source_name LIKE %s',
+                (f"%\\_\\_{pattern}",),
+            )
+    finally:
+        conn.close()
+    print(f"[BENCH E2E] Cleared {prefix}* rows from {pg_client.schema}")
+
+
+def _run_pipeline(args: argparse.Namespace) -> dict:
+    """Worker: serve the fleet, run one pipeline, return its measurements."""
+    fleet = _fleet(args, args.worker_scale)
+    server = start_in_thread(
+        MockApiConfig(
+            fleet=fleet,
+            latency_ms=args.latency_ms,
+            error_rate=args.error_rate,
+            retry_after=0,
+            seed=args.seed,
+        )
+    )
+    codes = ",".join(fleet.code(i) for i in range(fleet.facilities))
+    os.environ.update(
+        {
+            "COURTRESERVE_BASE_URL": server.base_url,
+            "PODPLAY_BASE_URL": f"{server.base_url}/apis/v2",
+            "DEFAULT_LOOKBACK_DAYS": str(fleet.history_days),
+            "WRITE_TO_DB": "true",
+            "SAVE_TO_JSON": "false",
+        }
+    )
+    for variables in credential_env(fleet).values():
+        os.environ.update(variables)
+    # Pipelines take client lists from the snapshot, not CR_/PODPLAY_CLIENT_CODES
+    os.environ.pop("CR_CLIENT_CODES", None)
+    os.environ.pop("PODPLAY_CLIENT_CODES", None)
+
+    import ingestion.main as main
+    from ingestion import metrics
+
+    main._load_env()
+    snapshot = _metadata(fleet)
+    main._metadata = snapshot
+    if args.reset:
+        _reset(main._get_pg_client(), args.prefix)
+
+    latencies: List[float] = []
+    latency_lock = threading.Lock()
+
+    def record_latency(response, *_args, **_kwargs):
+        with latency_lock:
+            latencies.append(response.elapsed.total_seconds())
+        return response
+
+    for code in codes.split(","):
+        facility = snapshot.get(code)
+        if facility.source_system == "courtreserve":
+            client = main._get_courtreserve_client(code)
+        else:
+            client = main._get_podplay_client(code)
+        client.session.hooks["response"].append(record_latency)
+
+    pipeline, kwargs, _ = main.PIPELINES[args.worker_pipeline]
+    error = None
+    start = time.perf_counter()
+    try:
+        with metrics.pipeline_scope(args.worker_pipeline):
+            pipeline(snapshot, **kwargs)
+    except (Exception, SystemExit) as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    wall = time.perf_counter() - start
+
+    records = metrics.drain()
+    fetched = sum(record.rows for record in records if record.stage == metrics.FETCH)
+    db_seconds = sum(
+        record.duration_seconds for record in records if record.stage in DB_STAGES
+    )
+    server.shutdown()
+    # ru_maxrss is in KiB on Linux
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return {
+        "pipeline": args.worker_pipeline,
+        "ok": error is None,
+        "error": error,
+        "records": fetched,
+        "records_per_second": round(fetched / wall, 1) if wall else None,
+        "api_calls": len(latencies),
+        "api_p50_ms": _round_ms(_percentile(latencies, 50)),
+        "api_p95_ms": _round_ms(_percentile(latencies, 95)),
+        "rate_limited": server.state.rate_limited,
+        "db_seconds": round(db_seconds, 3),
+        "peak_rss_bytes": peak_rss,
+        "wall_seconds": round(wall, 3),
+    }
+
+
+def _round_ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def _spawn(args: argparse.Namespace, scale: float, pipeline: str, reset: bool, log) -> dict:
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as out:
+        out_path = out.name
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.bench_e2e",
+        "--worker-scale",
+        str(scale),
+        "--worker-pipeline",
+        pipeline,
+        "--worker-out",
+        out_path,
+        *args.passthrough,
+    ]
+    if reset:
+        command.append("--reset")
+    try:
+        subprocess.run(command, stdout=log, stderr=subprocess.STDOUT, check=False)
+        with open(out_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"pipeline": pipeline, "ok": False, "error": "worker crashed, see log"}
+    finally:
+        if os.path.exists(out_path):
+            os.remove(out_path)
+
+
+def _print_results(scale: str, results: List[dict]) -> None:
+    print(f"\nScale {scale}x")
+    print(
+        f"  {'pipeline':<40} {'records':>9} {'rec/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'db s':>8} {'rss MB':>8} {'wall s':>8}"
+    )
+    for result in results:
+        if not result.get("ok"):
+            print(f"  {result['pipeline']:<40} FAILED: {result.get('error')}")
+            continue
+        print(
+            f"  {result['pipeline']:<40} {result['records']:>9} "
+            f"{result['records_per_second'] or 0:>9.0f} {result['api_p50_ms'] or 0:>8.1f} "
+            f"{result['api_p95_ms'] or 0:>8.1f} {result['db_seconds']:>8.2f} "
+            f"{result['peak_rss_bytes'] / 1e6:>8.0f} {result['wall_seconds']:>8.2f}"
+        )
+
+
+def _compare(
+    report: Dict[str, List[dict]], baseline: dict, max_regression: float
+) -> List[str]:
+    """Pipelines whose records/s or DB load time regressed past the threshold."""
+    regressions = []
+    for scale, results in report.items():
+        baseline_results = {
+            result["pipeline"]: result for result in baseline.get("scales", {}).get(scale, [])
+        }
+        for result in results:
+            previous = baseline_results.get(result["pipeline"])
+            if not previous or not result.get("ok"):
+                continue
+            if previous.get("records_per_second"):
+                ratio = (result["records_per_second"] or 0) / previous["records_per_second"]
+                if ratio < 1 - max_regression:
+                    regressions.append(
+                        f"{scale}x {result['pipeline']}: {result['records_per_second']:.0f} rec/s "
+                        f"vs baseline {previous['records_per_second']:.0f} ({ratio:.0%})"
+                    )
+            if (previous.get("db_seconds") or 0) >= MIN_GATED_DB_SECONDS:
+                ratio = result["db_seconds"] / previous["db_seconds"]
+                if ratio > 1 + max_regression:
+                    regressions.append(
+                        f"{scale}x {result['pipeline']}: {result['db_seconds']:.2f} db s "
+                        f"vs baseline {previous['db_seconds']:.2f} ({ratio:.0%})"
+                    )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", default="1", help="Comma-separated scale factors")
+    parser.add_argument(
+        "--pipelines", default=",".join(DEFAULT_PIPELINES), help="Comma-separated pipelines"
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--allow-missing-baseline",
+        action="store_true",
+        help="Don't fail when there is no baseline to compare with",
+    )
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    parser.add_argument("--log", default=os.path.join("elt_output_jsons", "bench_e2e.log"))
+    parser.add_argument("--output", default=os.path.join("elt_output_jsons", "bench_e2e.json"))
+    # Fleet and mock API settings, passed through to the workers
+    fleet_args = parser.add_argument_group("fleet")
+    fleet_args.add_argument("--facilities", type=int, default=4)
+    fleet_args.add_argument("--members", type=int, default=1000)
+    fleet_args.add_argument("--courts", type=int, default=8)
+    fleet_args.add_argument("--reservations-per-day", type=int, default=60)
+    fleet_args.add_argument("--events-per-day", type=int, default=6)
+    fleet_args.add_argument("--history-days", type=int, default=30)
+    fleet_args.add_argument("--latency-ms", type=float, default=0.0)
+    fleet_args.add_argument("--error-rate", type=float, default=0.0)
+    fleet_args.add_argument("--seed", type=int, default=7)
+    fleet_args.add_argument("--prefix", default="bench")
+    # Internal: run one pipeline in this process
+    parser.add_argument("--worker-scale", type=float, help=argparse.SUPPRESS)
+    parser.add_argument("--worker-pipeline", help=argparse.SUPPRESS)
+    parser.add_argument("--worker-out", help=argparse.SUPPRESS)
+    parser.add_argument("--reset", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker_pipeline:
+        result = _run_pipeline(args)
+        with open(args.worker_out, "w") as f:
+            json.dump(result, f)
+        return
+
+    args.passthrough = [
+        f"--{action.dest.replace('_', '-')}={getattr(args, action.dest)}"
+        for action in fleet_args._group_actions
+    ]
+    pipelines = [name for name in args.pipelines.split(",") if name]
+    os.makedirs(os.path.dirname(args.log) or ".", exist_ok=True)
+
+    report: Dict[str, List[dict]] = {}
+    with open(args.log, "w") as log:
+        for scale in [value.strip() for value in args.scales.split(",") if value.strip()]:
+            results = [
+                _spawn(args, float(scale), pipeline, reset=index == 0, log=log)
+                for index, pipeline in enumerate(pipelines)
+            ]
+            report[scale] = results
+            _print_results(scale, results)
+
+    summary = {
+        "fleet": {arg.split("=", 1)[0][2:]: arg.split("=", 1)[1] for arg in args.passthrough},
+        "scales": report,
+    }
+    with open(args.output, "w") as f:
+        json.dump(summary, f, indent=2)
+    print(f"\n[BENCH E2E] Saved results to {args.output} (pipeline output in {args.log})")
+
+    failed = [
+        f"{scale}x {result['pipeline']}"
+        for scale, results in report.items()
+        for result in results
+        if not result.get("ok")
+    ]
+    if args.save_baseline:
+        if failed:
+            raise SystemExit(f"Not saving a baseline with failed pipelines: {', '.join(failed)}")
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"[BENCH E2E] Saved baseline to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"[BENCH E2E] No baseline at {args.baseline}; run with --save-baseline to create one")
+        if failed or not args.allow_missing_baseline:
+            raise SystemExit(1)
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = _compare(report, baseline, args.max_regression)
+    if regressions or failed:
+        print(f"\n[BENCH E2E] Regressions beyond {args.max_regression:.0%}:")
+        for line in regressions + [f"{name}: failed" for name in failed]:
+            print(f"  {line}")
+        raise SystemExit(1)
+    print(f"[BENCH E2E] Within {args.max_regression:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
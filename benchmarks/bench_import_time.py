@@ -0,0 +1,100 @@
+"""
+Benchmark cold-start import cost of ingestion.main.
+
+Every cron invocation pays this before doing any work. Runs
+`python -X importtime -c "import ingestion.main"` in a fresh interpreter
+(without PG_DSN/PG_SCHEMA, so it also proves import does no DB work), reports
+the slowest modules and exits 1 if the import is over budget or pulls in a
+module that should only load once a pipeline runs.
+
+    python -m benchmarks.bench_import_time --max-ms 150
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+# Loaded by the pipelines that need them, never by importing ingestion.main
+LAZY_MODULES = (
+    "requests",
+    "psycopg2",
+    "dotenv",
+    "ingestion.clients.courtreserve_client",
+    "ingestion.clients.podplay_client",
+    "ingestion.clients.postgres_client",
+    "ingestion.clients.google_places_client",
+)
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _import_once(module: str) -> list[tuple[str, int, int]]:
+    """Import module in a fresh interpreter; return (name, self_us, cumulative_us)."""
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in ("PG_DSN", "PG_SCHEMA")
+    }
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def run(module: str, repeat: int, top: int) -> tuple[float, list[str], list]:
+    totals = []
+    rows: list = []
+    for _ in range(repeat):
+        rows = _import_once(module)
+        totals.append(next(c for name, _, c in rows if name == module) / 1000)
+
+    imported = {name for name, _, _ in rows}
+    eager = [name for name in LAZY_MODULES if name in imported]
+    slowest = sorted(rows, key=lambda row: row[2], reverse=True)[:top]
+    return statistics.median(totals), eager, slowest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="ingestion.main")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--max-ms", type=float, default=150.0, help="Fail above this median"
+    )
+    args = parser.parse_args()
+
+    median_ms, eager, slowest = run(args.module, args.repeat, args.top)
+    print(f"import {args.module}: {median_ms:.1f} ms (median of {args.repeat})")
+    print("Slowest modules (cumulative):")
+    for name, self_us, cumulative_us in slowest:
+        print(f"  {name:<50} {cumulative_us / 1000:8.1f} ms  (self {self_us / 1000:.1f} ms)")
+
+    failed = False
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+        failed = True
+    if median_ms > args.max_ms:
+        print(f"FAIL: {median_ms:.1f} ms is over the {args.max_ms:.0f} ms budget")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+Compare bulk insert strategies (execute_values, execute_batch, COPY).
+
+Loads normalized members, reservations and court availability rows
+(benchmarks.synthetic through the real normalizers) into scratch copies of
+members_raw, reservations_raw and facility_court_availabilities with every
+strategy and page size in ingestion.clients.bulk_load, and reports rows/s and
+the WAL each load wrote (pg_current_wal_lsn before and after, so use an
+otherwise idle database). Members and reservations load with their
+production ON CONFLICT upserts, availability rows as plain inserts. With
+--passes 2 (default) the upserts load the same rows again over the first
+pass, which is the conflict path most runs take.
+
+Needs PG_DSN / PG_SCHEMA (or --dsn / --schema) for a database migrated to
+head. Scratch tables are named _bench_<table> and dropped afterwards.
+
+    python -m benchmarks.bench_insert --rows 100000 --page-sizes 500,1000,5000
+    python -m benchmarks.bench_insert --datasets members --strategies values,copy
+
+Put the winner in PG_LOAD_STRATEGY / PG_LOAD_PAGE_SIZE.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Callable, Dict, List
+
+from benchmarks.synthetic import FacilitySpec, SyntheticFacility
+
+CODE = "bench"
+NOW = datetime(2026, 1, 5, 12, tzinfo=timezone.utc)
+PASS_NAMES = ("insert", "reload")
+
+
+def _rows(records: List[dict], columns, key: tuple, count: int) -> List[tuple]:
+    """Row tuples in column order, unique on key (one upsert can't touch a row twice)."""
+    created_at = datetime.now(timezone.utc)
+    unique = {tuple(record[k] for k in key): record for record in records}
+    return [
+        tuple(created_at if c == "created_at" else record.get(c) for c in columns)
+        for record in islice(unique.values(), count)
+    ]
+
+
+def _grow(build: Callable[[int], List[dict]], count: int) -> List[dict]:
+    """Normalized records from ever larger synthetic facilities until there are enough."""
+    scale = 1
+    while True:
+        with contextlib.redirect_stdout(io.StringIO()):
+            records = build(scale)
+        if len(records) >= count:
+            return records
+        scale *= 2
+
+
+def _members(count: int) -> tuple:
+    from ingestion.clients.postgres_mixins import MEMBER_COLUMNS, MEMBER_UPSERT
+    from ingestion.courtreserve.member_mapper import map_member_to_row
+
+    facility = SyntheticFacility(FacilitySpec(code=CODE, members=count), now=NOW)
+    records = [
+        map_member_to_row(member, facility_code=CODE)
+        for member in facility.iter_courtreserve_members()
+    ]
+    rows = _rows(records, MEMBER_COLUMNS, ("client_code", "member_id"), count)
+    return MEMBER_COLUMNS, rows, MEMBER_UPSERT
+
+
+def _reservations(count: int) -> tuple:
+    from ingestion.clients.postgres_mixins import (
+        RESERVATION_COLUMNS,
+        RESERVATION_PROD_UPSERT,
+    )
+    from ingestion.courtreserve.reservation_helpers import normalize_reservations
+
+    def build(scale: int) -> List[dict]:
+        spec = FacilitySpec(
+            code=CODE,
+            members=1000,
+            reservations_per_day=count * scale // 60 + 1,
+            history_days=29,
+            horizon_days=0,
+        )
+        facility = SyntheticFacility(spec, now=NOW)
+        return normalize_reservations(
+            list(facility.iter_courtreserve_reservations()), facility_code=CODE
+        )
+
+    rows = _rows(
+        _grow(build, count),
+        RESERVATION_COLUMNS,
+        ("client_code", "reservation_id", "member_id"),
+        count,
+    )
+    return RESERVATION_COLUMNS, rows, RESERVATION_PROD_UPSERT
+
+
+def _availability(count: int) -> tuple:
+    from ingestion.clients.postgres_mixins import COURT_AVAILABILITY_COLUMNS
+    from ingestion.events.podplay_sessions import normalize_podplay_sessions
+
+    def build(scale: int) -> List[dict]:
+        days = count * scale // 150 + 1
+        facility = SyntheticFacility(
+            FacilitySpec(code=CODE, members=1, horizon_days=days), now=NOW
+        )
+        return normalize_podplay_sessions(
+            list(facility.iter_podplay_sessions()), CODE, NOW + timedelta(days=days + 1)
+        )
+
+    rows = _rows(
+        _grow(build, count),
+        COURT_AVAILABILITY_COLUMNS,
+        ("client_code", "source_system", "court_id", "slot_start"),
+        count,
+    )
+    return COURT_AVAILABILITY_COLUMNS, rows, ""
+
+
+# dataset -> (table, builder returning (columns, rows, conflict clause))
+DATASETS: Dict[str, tuple] = {
+    "members": ("members_raw", _members),
+    "reservations": ("reservations_raw", _reservations),
+    "availability": ("facility_court_availabilities", _availability),
+}
+
+
+def _wal_lsn(cur) -> str:
+    cur.execute("SELECT pg_current_wal_lsn()")
+    return cur.fetchone()[0]
+
+
+def _load(conn, table: str, columns, rows, conflict, strategy, page_size) -> dict:
+    from ingestion.clients.bulk_load import bulk_insert
+
+    with conn.cursor() as cur:
+        before = _wal_lsn(cur)
+        conn.commit()
+        start = time.perf_counter()
+        bulk_insert(
+            cur,
+            table,
+            columns,
+            rows,
+            conflict=conflict,
+            strategy=strategy,
+            page_size=page_size,
+        )
+        conn.commit()
+        seconds = time.perf_counter() - start
+        cur.execute("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), %s)", (before,))
+        wal_bytes = int(cur.fetchone()[0])
+        conn.commit()
+    return {
+        "rows_per_second": len(rows) / seconds if seconds else 0.0,
+        "wal_bytes": wal_bytes,
+        "wal_bytes_per_row": wal_bytes / len(rows) if rows else 0.0,
+        "seconds": seconds,
+    }
+
+
+def run(
+    dsn: str,
+    schema: str,
+    datasets: List[str],
+    strategies: List[str],
+    page_sizes: List[int],
+    rows: int,
+    passes: int,
+) -> List[dict]:
+    import psycopg2
+
+    results = []
+    conn = psycopg2.connect(dsn)
+    try:
+        for dataset in datasets:
+            table_name, build = DATASETS[dataset]
+            columns, data, conflict = build(rows)
+            # MEMBER_UPSERT names its target table in the row_hash predicate
+            conflict = conflict.format(table=f"_bench_{table_name}")
+            scratch = f'"{schema}"."_bench_{table_name}"'
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE IF EXISTS {scratch}")
+                cur.execute(
+                    f'CREATE TABLE {scratch} (LIKE "{schema}"."{table_name}" INCLUDING ALL)'
+                )
+            conn.commit()
+            try:
+                for strategy in strategies:
+                    for page_size in page_sizes:
+                        with conn.cursor() as cur:
+                            cur.execute(f"TRUNCATE {scratch}")
+                        conn.commit()
+                        # Reloading only means something for the upserts
+                        for pass_name in PASS_NAMES[: passes if conflict else 1]:
+                            result = {
+                                "dataset": dataset,
+                                "strategy": strategy,
+                                "page_size": page_size,
+                                "pass": pass_name,
+                                "rows": len(data),
+                                **_load(
+                                    conn,
+                                    scratch,
+                                    columns,
+                                    data,
+                                    conflict,
+                                    strategy,
+                                    page_size,
+                                ),
+                            }
+                            results.append(result)
+                            print(
+                                f"  {dataset:<13} {strategy:<7} {page_size:>7} {pass_name:<7}"
+                                f" {len(data):>8} {result['rows_per_second']:>10,.0f}"
+                                f" {result['wal_bytes'] / 1024 / 1024:>9.1f}"
+                                f" {result['wal_bytes_per_row']:>8.0f}"
+                            )
+            finally:
+                with conn.cursor() as cur:
+                    cur.execute(f"DROP TABLE IF EXISTS {scratch}")
+                conn.commit()
+    finally:
+        conn.close()
+    return results
+
+
+def _print_best(results: List[dict]) -> None:
+    print("\nFastest first-pass load per dataset")
+    for dataset in dict.fromkeys(result["dataset"] for result in results):
+        candidates = [
+            r for r in results if r["dataset"] == dataset and r["pass"] == "insert"
+        ]
+        best = max(candidates, key=lambda r: r["rows_per_second"])
+        print(
+            f"  {dataset:<13} PG_LOAD_STRATEGY={best['strategy']}"
+            f" PG_LOAD_PAGE_SIZE={best['page_size']}"
+            f" ({best['rows_per_second']:,.0f} rows/s,"
+            f" {best['wal_bytes_per_row']:.0f} WAL bytes/row)"
+        )
+
+
+def _ints(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def _names(value: str) -> List[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def main() -> None:
+    from ingestion.clients.bulk_load import LOAD_STRATEGIES
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dsn", default=os.getenv("PG_DSN"))
+    parser.add_argument("--schema", default=os.getenv("PG_SCHEMA"))
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--datasets", type=_names, default=list(DATASETS))
+    parser.add_argument("--strategies", type=_names, default=list(LOAD_STRATEGIES))
+    parser.add_argument("--page-sizes", type=_ints, default=[100, 1000, 5000, 20000])
+    parser.add_argument("--passes", type=int, choices=(1, 2), default=2)
+    parser.add_argument("--output", help="Also write results to this JSON file")
+    args = parser.parse_args()
+
+    if not args.dsn or not args.schema:
+        parser.error("set PG_DSN and PG_SCHEMA or pass --dsn and --schema")
+    unknown = (set(args.datasets) - set(DATASETS)) | (
+        set(args.strategies) - set(LOAD_STRATEGIES)
+    )
+    if unknown:
+        parser.error(f"unknown dataset(s)/strategy(ies): {', '.join(sorted(unknown))}")
+
+    print(f"Bulk insert into {args.schema} ({args.rows} rows per load)")
+    print(
+        f"  {'dataset':<13} {'strategy':<7} {'page':>7} {'pass':<7} {'rows':>8}"
+        f" {'rows/s':>10} {'WAL MB':>9} {'B/row':>8}"
+    )
+    results = run(
+        args.dsn,
+        args.schema,
+        args.datasets,
+        args.strategies,
+        args.page_sizes,
+        args.rows,
+        args.passes,
+    )
+    _print_best(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
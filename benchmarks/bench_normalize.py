@@ -0,0 +1,108 @@
+"""
+Benchmark phone/email normalization at member-refresh scale.
+
+Reports the per-record cost of normalize_phone_number / normalize_email for a
+synthetic member population, uncached vs. a cold cache (first run of the day)
+vs. a warm cache (values repeating between runs) vs. the batch API.
+
+    python -m benchmarks.bench_normalize --members 100000
+"""
+
+import argparse
+import random
+import time
+
+from ingestion.utils import normalize
+from ingestion.utils.normalize import (
+    normalize_email,
+    normalize_emails,
+    normalize_phone_number,
+    normalize_phone_numbers,
+)
+
+PHONE_FORMATS = [
+    "({area}) {prefix}-{line}",
+    "{area}-{prefix}-{line}",
+    "{area}.{prefix}.{line}",
+    "1{area}{prefix}{line}",
+    "+1{area}{prefix}{line}",
+    "+1 {area} {prefix} {line}",
+    "{area}{prefix}{line}",
+]
+
+
+def _build_members(count: int, seed: int) -> tuple[list[str], list[str]]:
+    rng = random.Random(seed)
+    phones = []
+    emails = []
+    for i in range(count):
+        phone_format = rng.choice(PHONE_FORMATS)
+        phones.append(
+            phone_format.format(
+                area=rng.randint(200, 999),
+                prefix=rng.randint(200, 999),
+                line=f"{rng.randint(0, 9999):04d}",
+            )
+        )
+        emails.append(f"  Member.{i}@Example{i % 50}.COM ")
+    return phones, emails
+
+
+def _clear_caches() -> None:
+    normalize._normalize_phone_number_cached.cache_clear()
+    normalize._normalize_email_cached.cache_clear()
+
+
+def _time_per_record(func, values: list) -> float:
+    start = time.perf_counter()
+    func(values)
+    elapsed = time.perf_counter() - start
+    return elapsed / len(values) * 1_000_000
+
+
+def run(members: int, seed: int) -> dict[str, float]:
+    phones, emails = _build_members(members, seed)
+
+    def uncached(values_phones, values_emails):
+        for phone in values_phones:
+            if phone:
+                normalize._normalize_phone_number(phone)
+        for email in values_emails:
+            if email:
+                normalize._normalize_email(email)
+
+    def single(values_phones, values_emails):
+        for phone in values_phones:
+            normalize_phone_number(phone)
+        for email in values_emails:
+            normalize_email(email)
+
+    def batch(values_phones, values_emails):
+        normalize_phone_numbers(values_phones)
+        normalize_emails(values_emails)
+
+    results = {}
+    results["uncached"] = _time_per_record(lambda _: uncached(phones, emails), phones)
+    _clear_caches()
+    results["cold_cache"] = _time_per_record(lambda _: single(phones, emails), phones)
+    results["warm_cache"] = _time_per_record(lambda _: single(phones, emails), phones)
+    results["warm_cache_batch"] = _time_per_record(
+        lambda _: batch(phones, emails), phones
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    results = run(args.members, args.seed)
+    print(f"Normalizing phone + email for {args.members} members")
+    for name, micros in results.items():
+        print(f"  {name:<18} {micros:8.3f} µs/member")
+
+
+if __name__ == "__main__":
+    main()
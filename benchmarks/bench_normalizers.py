@@ -0,0 +1,303 @@
+"""
+Micro-benchmarks for the API normalizers and the availability engine.
+
+Each normalizer runs on synthetic payloads (benchmarks.synthetic) at every
+fixture size and reports the best per-record cost over --repeat runs plus the
+peak traced memory of one run (tracemalloc, measured separately so it does
+not skew the timings). calculate_available_slots is timed over a grid of
+courts x days x bookings per court per day.
+
+The defaults finish in well under a minute; pass larger sizes and grids
+explicitly:
+
+    python -m benchmarks.bench_normalizers
+    python -m benchmarks.bench_normalizers --sizes 1000,10000,100000
+    python -m benchmarks.bench_normalizers --only calculate_available_slots \\
+        --courts 4,16,32 --days 7,14,30 --bookings 4,12
+"""
+
+import argparse
+import contextlib
+import io
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Callable, Dict, List
+
+from benchmarks.synthetic import EVENT_CATEGORIES, FacilitySpec, SyntheticFacility
+
+CODE = "bench"
+NOW = datetime(2026, 1, 5, 12, tzinfo=timezone.utc)
+DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+OPERATING_HOURS = {
+    "timezone": "America/New_York",
+    **{day: {"open": "07:00", "close": "23:00"} for day in DAYS},
+}
+CATEGORIES = {str(category_id): name for category_id, name in EVENT_CATEGORIES}
+SESSIONS_PER_DAY = 32
+
+
+def _map_courtreserve_members(records: List[dict]) -> list:
+    from ingestion.courtreserve.member_mapper import map_member_to_row
+
+    return [map_member_to_row(member, facility_code=CODE) for member in records]
+
+
+def _normalize_podplay_members(records: List[dict]) -> list:
+    from ingestion.podplay.members import normalize_members
+
+    return normalize_members(records, facility_code=CODE)
+
+
+def _normalize_courtreserve_reservations(records: List[dict]) -> list:
+    from ingestion.courtreserve.reservation_helpers import normalize_reservations
+
+    return normalize_reservations(records, facility_code=CODE)
+
+
+def _normalize_podplay_reservations(records: List[dict]) -> list:
+    from ingestion.podplay.reservations import normalize_event_reservations
+
+    return normalize_event_reservations(records, facility_code=CODE)
+
+
+def _normalize_courtreserve_cancellations(records: List[dict]) -> list:
+    from ingestion.courtreserve.reservation_cancellation_helpers import (
+        normalize_reservation_cancellations,
+    )
+
+    return normalize_reservation_cancellations(records, facility_code=CODE)
+
+
+def _normalize_courtreserve_events(records: List[dict]) -> list:
+    from ingestion.events.courtreserve_events import normalize_courtreserve_events
+
+    return normalize_courtreserve_events(records, CODE, event_categories=CATEGORIES)
+
+
+def _normalize_podplay_events(records: List[dict]) -> list:
+    from ingestion.events.podplay_events import normalize_podplay_events
+
+    return normalize_podplay_events(records, CODE)
+
+
+def _normalize_podplay_sessions(records: List[dict]) -> list:
+    from ingestion.events.podplay_sessions import normalize_podplay_sessions
+
+    return normalize_podplay_sessions(records, CODE, NOW + timedelta(days=len(records)))
+
+
+def _spec(size: int, scale: int) -> FacilitySpec:
+    """Facility producing roughly `size` records of every stream (times `scale`)."""
+    days = 30
+    return FacilitySpec(
+        code=CODE,
+        members=size * scale,
+        reservations_per_day=size * scale // days + 1,
+        events_per_day=size * scale // days + 1,
+        history_days=days - 1,
+        horizon_days=size * scale // SESSIONS_PER_DAY + 1,
+    )
+
+
+def _cancellations_spec(size: int, scale: int) -> FacilitySpec:
+    # Cancellations pick registrants from the member list; keep that small
+    spec = _spec(size, scale)
+    return FacilitySpec(
+        code=CODE,
+        members=500,
+        events_per_day=spec.events_per_day * 4,
+        history_days=spec.history_days,
+        horizon_days=0,
+    )
+
+
+# name -> (archive source, spec builder, normalizer)
+NORMALIZERS: Dict[str, tuple] = {
+    "map_member_to_row": ("courtreserve_members", _spec, _map_courtreserve_members),
+    "normalize_members": ("podplay_members", _spec, _normalize_podplay_members),
+    "normalize_reservations": (
+        "courtreserve_reservations",
+        _spec,
+        _normalize_courtreserve_reservations,
+    ),
+    "normalize_event_reservations": (
+        "podplay_reservations",
+        _spec,
+        _normalize_podplay_reservations,
+    ),
+    "normalize_reservation_cancellations": (
+        "courtreserve_reservation_cancellations",
+        _cancellations_spec,
+        _normalize_courtreserve_cancellations,
+    ),
+    "normalize_courtreserve_events": (
+        "courtreserve_events",
+        _spec,
+        _normalize_courtreserve_events,
+    ),
+    "normalize_podplay_events": ("podplay_events", _spec, _normalize_podplay_events),
+    "normalize_podplay_sessions": (
+        "podplay_court_availability",
+        _spec,
+        _normalize_podplay_sessions,
+    ),
+}
+AVAILABILITY = "calculate_available_slots"
+
+
+def _fixture(source: str, spec_for: Callable[[int, int], FacilitySpec], size: int) -> List[dict]:
+    """Exactly `size` raw records, growing the facility until the stream is long enough."""
+    scale = 1
+    while True:
+        facility = SyntheticFacility(spec_for(size, scale), now=NOW)
+        records = list(islice(facility.iter_source(source), size))
+        if len(records) == size:
+            return records
+        scale *= 2
+
+
+def _measure(func: Callable[[], list], repeat: int) -> tuple:
+    """(best seconds, rows returned, peak traced bytes); normalizer output is discarded."""
+    best = float("inf")
+    rows = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            rows = len(func())
+            best = min(best, time.perf_counter() - start)
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return best, rows, peak
+
+
+def run_normalizers(names: List[str], sizes: List[int], repeat: int) -> List[dict]:
+    results = []
+    for name in names:
+        source, spec_for, normalize = NORMALIZERS[name]
+        for size in sizes:
+            records = _fixture(source, spec_for, size)
+            seconds, rows, peak = _measure(lambda: normalize(records), repeat)
+            result = {
+                "name": name,
+                "records": size,
+                "rows": rows,
+                "us_per_record": seconds / size * 1_000_000,
+                "peak_mb": peak / 1024 / 1024,
+                "bytes_per_record": peak / size,
+            }
+            results.append(result)
+            print(
+                f"  {name:<38} {size:>8} {rows:>8} {result['us_per_record']:>10.2f}"
+                f" {result['peak_mb']:>9.1f} {result['bytes_per_record']:>9.0f}"
+            )
+    return results
+
+
+def run_availability(
+    courts: List[int], days: List[int], bookings: List[int], repeat: int
+) -> List[dict]:
+    from ingestion.events.courtreserve_court_availability import calculate_available_slots
+
+    results = []
+    for court_count in courts:
+        for day_count in days:
+            for per_court in bookings:
+                facility = SyntheticFacility(
+                    FacilitySpec(
+                        code=CODE,
+                        members=100,
+                        courts=court_count,
+                        reservations_per_day=court_count * per_court,
+                        events_per_day=max(1, court_count // 4),
+                        history_days=0,
+                        horizon_days=day_count,
+                    ),
+                    now=NOW,
+                )
+                court_rows = [
+                    {"id": f"{CODE}-{n}", "label": label}
+                    for n, label in enumerate(facility.court_labels, start=1)
+                ]
+                events = list(facility.iter_courtreserve_upcoming("events"))
+                reservations = list(facility.iter_courtreserve_upcoming("reservations"))
+                seconds, rows, peak = _measure(
+                    lambda: calculate_available_slots(
+                        client_code=CODE,
+                        courts=court_rows,
+                        operating_hours=OPERATING_HOURS,
+                        events=events,
+                        reservations=reservations,
+                        start_date=NOW,
+                        end_date=NOW + timedelta(days=day_count),
+                    ),
+                    repeat,
+                )
+                result = {
+                    "courts": court_count,
+                    "days": day_count,
+                    "bookings_per_court_day": per_court,
+                    "blocking_records": len(events) + len(reservations),
+                    "slots": rows,
+                    "ms": seconds * 1000,
+                    "peak_mb": peak / 1024 / 1024,
+                }
+                results.append(result)
+                print(
+                    f"  {court_count:>6} {day_count:>5} {per_court:>9}"
+                    f" {result['blocking_records']:>9} {rows:>9}"
+                    f" {result['ms']:>10.1f} {result['peak_mb']:>9.1f}"
+                )
+    return results
+
+
+def _ints(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=_ints, default=[1_000, 10_000])
+    parser.add_argument(
+        "--only",
+        default="",
+        help=f"Comma-separated subset of: {', '.join([*NORMALIZERS, AVAILABILITY])}",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--courts", type=_ints, default=[4, 16])
+    parser.add_argument("--days", type=_ints, default=[7, 14])
+    parser.add_argument(
+        "--bookings", type=_ints, default=[4], help="Bookings per court per day"
+    )
+    args = parser.parse_args()
+
+    selected = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = set(selected) - set(NORMALIZERS) - {AVAILABILITY}
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+    names = [name for name in NORMALIZERS if not selected or name in selected]
+
+    if names:
+        print(f"Normalizers (best of {args.repeat})")
+        print(
+            f"  {'normalizer':<38} {'records':>8} {'rows':>8} {'µs/record':>10}"
+            f" {'peak MB':>9} {'B/record':>9}"
+        )
+        run_normalizers(names, args.sizes, args.repeat)
+
+    if not selected or AVAILABILITY in selected:
+        print(f"\n{AVAILABILITY} (best of {args.repeat})")
+        print(
+            f"  {'courts':>6} {'days':>5} {'bookings':>9} {'blocking':>9} {'slots':>9}"
+            f" {'ms':>10} {'peak MB':>9}"
+        )
+        run_availability(args.courts, args.days, args.bookings, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
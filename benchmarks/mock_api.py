@@ -0,0 +1,428 @@
+"""
+Local stand-in for the CourtReserve and Podplay APIs.
+
+Serves synthetic payloads (benchmarks.synthetic) on the endpoints the
+ingestion calls, with the real APIs' pagination and date filters, so client
+concurrency, rate limiting and end-to-end throughput can be measured offline.
+Each credential (CourtReserve username, Podplay API key) is one facility of
+a synthetic fleet; its dataset is built on first use. The fleet's facility
+codes (synth001, synth002, ...) get the fleet's size spread, and the server
+prints the credential variables that point ingestion clients at them.
+
+    python -m benchmarks.mock_api --port 8765 --facilities 20 --members 5000 --latency-ms 80 --error-rate 0.05
+
+    COURTRESERVE_BASE_URL=http://127.0.0.1:8765
+    PODPLAY_BASE_URL=http://127.0.0.1:8765/apis/v2
+
+    CourtReserve  /api/v1/member/get                   pageNumber, pageSize, createdOrUpdatedFrom/To
+                  /api/v1/reservationreport/listactive  createdOrUpdatedOnFrom/To or reservationsFromDate/ToDate
+                  /api/v1/reservationreport/listcancelled  cancelledOnFrom/To
+                  /api/v1/eventcalendar/eventlist       startDate, endDate
+    Podplay       /apis/v2/users                        page, ipp, memberSince*/tenure* (on profile.memberSince)
+                  /apis/v2/events                       page, ipp, startTime, endTime, type
+                  /apis/v2/sessions                     startTime, endTime (no pagination)
+
+Rate limiting: --error-rate answers a random share of requests with 429, and
+--max-rps answers 429 once a credential exceeds that many requests per
+second; both send Retry-After: --retry-after.
+"""
+
+import argparse
+import base64
+import json
+import random
+import threading
+import time
+from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.synthetic import FleetSpec, SyntheticFacility
+
+MAX_CR_PAGE_SIZE = 500
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(value[:10]) if value else None
+
+
+def _in_range(
+    value: Optional[str], start: Optional[datetime], end: Optional[datetime]
+) -> bool:
+    dt = _parse_datetime(value)
+    if dt is None:
+        return False
+    return (start is None or dt >= start) and (end is None or dt < end)
+
+
+class MockApiConfig:
+    def __init__(
+        self,
+        fleet: Optional[FleetSpec] = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        max_rps: Optional[float] = None,
+        retry_after: float = 1.0,
+        seed: int = 7,
+    ):
+        self.fleet = fleet or FleetSpec()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.max_rps = max_rps
+        self.retry_after = retry_after
+        self.seed = seed
+
+
+class MockApiState:
+    """Datasets, rate-limit windows and request counters shared by handler threads."""
+
+    def __init__(self, config: MockApiConfig):
+        self.config = config
+        self.now = datetime.now(timezone.utc)
+        self.rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._facilities: Dict[str, SyntheticFacility] = {}
+        self._windows: Dict[str, Tuple[int, int]] = {}
+        self.requests = 0
+        self.rate_limited = 0
+
+    def facility(self, credential: str) -> SyntheticFacility:
+        with self._lock:
+            facility = self._facilities.get(credential)
+            if facility is None:
+                facility = SyntheticFacility(
+                    self.config.fleet.facility(credential), now=self.now
+                )
+                self._facilities[credential] = facility
+            return facility
+
+    def should_rate_limit(self, credential: str) -> bool:
+        with self._lock:
+            self.requests += 1
+            limited = self.rng.random() < self.config.error_rate
+            if not limited and self.config.max_rps:
+                second = int(time.monotonic())
+                window_second, count = self._windows.get(credential, (second, 0))
+                if window_second != second:
+                    window_second, count = second, 0
+                count += 1
+                self._windows[credential] = (window_second, count)
+                limited = count > self.config.max_rps
+            if limited:
+                self.rate_limited += 1
+            return limited
+
+    def latency(self) -> float:
+        with self._lock:
+            jitter = self.rng.random() * self.config.jitter_ms
+        return (self.config.latency_ms + jitter) / 1000
+
+
+def _cr_envelope(data) -> dict:
+    return {"ErrorMessage": None, "IsSuccessStatusCode": True, "Data": data}
+
+
+def _podplay_page(items: List[dict], params: Dict[str, List[str]]) -> dict:
+    page = max(1, int(params.get("page", ["1"])[0]))
+    ipp = max(1, int(params.get("ipp", ["100"])[0]))
+    chunk = items[(page - 1) * ipp : page * ipp]
+    return {
+        "items": chunk,
+        "_pagination": {"page": page, "ipp": ipp, "count": len(chunk), "total": len(items)},
+    }
+
+
+def cr_members(facility: SyntheticFacility, params: Dict[str, List[str]]) -> dict:
+    start = _parse_datetime(params.get("createdOrUpdatedFrom", [None])[0])
+    end = _parse_datetime(params.get("createdOrUpdatedTo", [None])[0])
+    page_number = max(1, int(params.get("pageNumber", ["1"])[0]))
+    page_size = max(1, min(int(params.get("pageSize", ["100"])[0]), MAX_CR_PAGE_SIZE))
+    members = [
+        member
+        for member in facility.courtreserve_members
+        if _in_range(member["UpdatedOnUtc"], start, end)
+    ]
+    total_pages = max(1, -(-len(members) // page_size))
+    return _cr_envelope(
+        {
+            "Members": members[(page_number - 1) * page_size : page_number * page_size],
+            "PageNumber": page_number,
+            "PageSize": page_size,
+            "TotalPages": total_pages,
+            "TotalRecords": len(members),
+        }
+    )
+
+
+def cr_reservations(facility: SyntheticFacility, params: Dict[str, List[str]]) -> dict:
+    if "reservationsFromDate" in params:
+        start_day = _parse_date(params["reservationsFromDate"][0])
+        end_day = _parse_date(params.get("reservationsToDate", [None])[0])
+        data = [
+            reservation
+            for reservation in facility.courtreserve_reservations
+            if start_day <= _parse_date(reservation["StartTime"])
+            and (end_day is None or _parse_date(reservation["StartTime"]) <= end_day)
+        ]
+    else:
+        start = _parse_datetime(params.get("createdOrUpdatedOnFrom", [None])[0])
+        end = _parse_datetime(params.get("createdOrUpdatedOnTo", [None])[0])
+        data = [
+            reservation
+            for reservation in facility.courtreserve_reservations
+            if _in_range(reservation["UpdatedOnUtc"], start, end)
+        ]
+    return _cr_envelope(data)
+
+
+def cr_cancellations(facility: SyntheticFacility, params: Dict[str, List[str]]) -> dict:
+    start = _parse_datetime(params.get("cancelledOnFrom", [None])[0])
+    end = _parse_datetime(params.get("cancelledOnTo", [None])[0])
+    return _cr_envelope(
+        [
+            cancellation
+            for cancellation in facility.courtreserve_cancellations
+            if _in_range(cancellation["CancelledOnUtc"], start, end)
+        ]
+    )
+
+
+def cr_events(facility: SyntheticFacility, params: Dict[str, List[str]]) -> dict:
+    start_day = _parse_date(params.get("startDate", [None])[0])
+    end_day = _parse_date(params.get("endDate", [None])[0])
+    return _cr_envelope(
+        [
+            event
+            for event in facility.courtreserve_events
+            if (start_day is None or _parse_date(event["StartDateTime"]) >= start_day)
+            and (end_day is None or _parse_date(event["StartDateTime"]) <= end_day)
+        ]
+    )
+
+
+def podplay_users(facility: SyntheticFacility, params: Dict[str, List[str]]) -> dict:
+    start = _parse_datetime(
+        (params.get("tenureMin") or params.get("memberSinceMin") or [None])[0]
+    )
+    end = _parse_datetime(
+        (params.get("tenureMax") or params.get("memberSinceMax") or [None])[0]
+    )
+    users = [
+        user
+        for user in facility.podplay_users
+        if (start is None and end is None)
+        or _in_range(user["profile"]["memberSince"], start, end)
+    ]
+    return _podplay_page(users, params)
+
+
+def podplay_events(facility: SyntheticFacility, params: Dict[str, List[str]]) -> dict:
+    start = _parse_datetime(params.get("startTime", [None])[0])
+    end = _parse_datetime(params.get("endTime", [None])[0])
+    types = set(params.get("type", []))
+    events = [
+        event
+        for event in facility.podplay_events
+        if _in_range(event["startTime"], start, end)
+        and (not types or event["type"] in types)
+    ]
+    return _podplay_page(events, params)
+
+
+def podplay_sessions(facility: SyntheticFacility, params: Dict[str, List[str]]) -> dict:
+    start = _parse_datetime(params.get("startTime", [None])[0])
+    end = _parse_datetime(params.get("endTime", [None])[0])
+    sessions = [
+        session
+        for session in facility.podplay_sessions
+        if _in_range(session["startTime"], start, end)
+    ]
+    return {"items": sessions, "_total": len(sessions)}
+
+
+ROUTES: Dict[str, Callable[[SyntheticFacility, Dict[str, List[str]]], dict]] = {
+    "/api/v1/member/get": cr_members,
+    "/api/v1/reservationreport/listactive": cr_reservations,
+    "/api/v1/reservationreport/listcancelled": cr_cancellations,
+    "/api/v1/eventcalendar/eventlist": cr_events,
+    "/apis/v2/users": podplay_users,
+    "/apis/v2/events": podplay_events,
+    "/apis/v2/sessions": podplay_sessions,
+}
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    server: "MockApiServer"
+    protocol_version = "HTTP/1.1"
+
+    def _credential(self) -> Optional[str]:
+        api_key = self.headers.get("x-api-key")
+        if api_key:
+            return api_key
+        auth = self.headers.get("Authorization") or ""
+        if auth.startswith("Basic "):
+            username = base64.b64decode(auth[6:]).decode().split(":", 1)[0]
+            return username or None
+        return None
+
+    def _send(self, status: int, body: dict, headers: Optional[dict] = None) -> None:
+        payload = json.dumps(body, separators=(",", ":")).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        state = self.server.state
+        url = urlsplit(self.path)
+        route = ROUTES.get(url.path.rstrip("/"))
+        if route is None:
+            self._send(404, {"error": f"unknown path {url.path}"})
+            return
+        credential = self._credential()
+        if credential is None:
+            self._send(401, {"error": "missing credentials"})
+            return
+
+        time.sleep(state.latency())
+        if state.should_rate_limit(credential):
+            self._send(
+                429,
+                {"error": "Too Many Requests"},
+                {"Retry-After": f"{state.config.retry_after:g}"},
+            )
+            return
+        try:
+            body = route(state.facility(credential), parse_qs(url.query))
+        except (TypeError, ValueError) as exc:
+            self._send(400, {"error": str(exc)})
+            return
+        self._send(200, body)
+
+    def log_message(self, format, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class MockApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, config: MockApiConfig, verbose: bool = False):
+        super().__init__(address, MockApiHandler)
+        self.state = MockApiState(config)
+        self.verbose = verbose
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def credential_env(fleet: FleetSpec) -> Dict[str, Dict[str, str]]:
+    """Per fleet facility, the env vars main.py reads for its credentials."""
+    return {
+        code: {
+            f"{code.upper()}_USERNAME": code,
+            f"{code.upper()}_PASSWORD": "mock",
+            f"{code.upper()}_API_KEY": code,
+        }
+        for code in (fleet.code(i) for i in range(fleet.facilities))
+    }
+
+
+def start_in_thread(
+    config: MockApiConfig, host: str = "127.0.0.1", port: int = 0
+) -> MockApiServer:
+    """Start a server on a background thread (port 0 picks a free port)."""
+    server = MockApiServer((host, port), config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--facilities", type=int, default=10)
+    parser.add_argument("--members", type=int, default=1000, help="Mean members per facility")
+    parser.add_argument("--courts", type=int, default=8, help="Mean courts per facility")
+    parser.add_argument("--reservations-per-day", type=int, default=60)
+    parser.add_argument("--events-per-day", type=int, default=6)
+    parser.add_argument("--history-days", type=int, default=30)
+    parser.add_argument("--horizon-days", type=int, default=7)
+    parser.add_argument("--size-spread", type=float, default=0.5)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply members, reservations and events per facility",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of requests answered 429"
+    )
+    parser.add_argument(
+        "--max-rps", type=float, default=None, help="Per-credential requests/second before 429"
+    )
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    fleet = FleetSpec(
+        facilities=args.facilities,
+        members=args.members,
+        courts=args.courts,
+        reservations_per_day=args.reservations_per_day,
+        events_per_day=args.events_per_day,
+        history_days=args.history_days,
+        horizon_days=args.horizon_days,
+        size_spread=args.size_spread,
+        seed=args.seed,
+    ).scaled(args.scale)
+    config = MockApiConfig(
+        fleet=fleet,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        max_rps=args.max_rps,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    server = MockApiServer((args.host, args.port), config, verbose=args.verbose)
+    print(f"[MOCK API] Serving on {server.base_url}")
+    print(f"  COURTRESERVE_BASE_URL={server.base_url}")
+    print(f"  PODPLAY_BASE_URL={server.base_url}/apis/v2")
+    print(f"  CR_CLIENT_CODES / PODPLAY_CLIENT_CODES={','.join(credential_env(fleet))}")
+    for code, variables in credential_env(fleet).items():
+        print(f"  {' '.join(f'{name}={value}' for name, value in variables.items())}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        state = server.state
+        print(
+            f"[MOCK API] {state.requests} requests, {state.rate_limited} rate limited"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,681 @@
+"""
+Synthetic CourtReserve and Podplay payloads at production scale and beyond.
+
+Records follow schemas/courtreserve_api_schemas.json and
+schemas/podplay_api_schemas.json plus the fields the normalizers read
+(memberships, invitations, availableTables, overlapping and multi-court
+reservations, non-court reservation types), so they go through the same code
+paths as real API responses. Output is deterministic for a given spec, seed
+and reference time.
+
+A FleetSpec describes N facilities whose sizes vary around the given means.
+The mock API (benchmarks.mock_api) serves one facility per credential, and
+the CLI writes a whole fleet as raw archives in the layout ingestion.archive
+uses, ready for ``python -m ingestion.main replay``:
+
+    python -m benchmarks.synthetic --facilities 50 --members 10000 \\
+        --reservations-per-day 400 --horizon-days 14 --out elt_output_jsons/raw
+
+Large record streams (reservations, events, cancellations) are generated
+lazily, so a 5M-row fleet is written without holding it in memory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import secrets
+import time
+import zlib
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from typing import Iterator, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+FACILITY_TZ = ZoneInfo("America/New_York")
+SLOT_MINUTES = 30
+OPEN_HOUR = 7
+CLOSE_HOUR = 23
+
+FIRST_NAMES = ("Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie")
+LAST_NAMES = ("Smith", "Lee", "Garcia", "Chen", "Patel", "Brown", "Kim", "Nguyen")
+CR_MEMBERSHIP_TYPES = ("Non-Member Account", "Premium", "Founder", "Junior")
+CR_OTHER_RESERVATION_TYPES = ((2, "Lesson"), (3, "Ball Machine"))
+PODPLAY_MEMBERSHIPS = (("mship-monthly", "MONTHLY"), ("mship-annual", "ANNUAL"))
+EVENT_CATEGORIES = ((101, "Open Play"), (102, "Clinic"), (103, "League"), (104, "Tournament"))
+PODPLAY_EVENT_SUBTYPES = ("OPERATIONS", "OPEN_PLAY", "CLINIC")
+
+# Shares of generated records with each trait
+OVERLAP_RATE = 0.1
+MULTI_COURT_RATE = 0.05
+OTHER_TYPE_RATE = 0.1
+CANCELLED_RATE = 0.05
+CANCELLATION_RATE = 0.3
+
+# Archive sources written per source system (see ingestion.main.REPLAY_SOURCES)
+COURTRESERVE_SOURCES = (
+    "courtreserve_members",
+    "courtreserve_reservations",
+    "courtreserve_reservation_cancellations",
+    "courtreserve_events",
+    "courtreserve_court_availability_events",
+    "courtreserve_court_availability_reservations",
+)
+PODPLAY_SOURCES = (
+    "podplay_members",
+    "podplay_reservations",
+    "podplay_events",
+    "podplay_court_availability",
+)
+
+
+@dataclass(frozen=True)
+class FacilitySpec:
+    code: str
+    members: int = 1000
+    courts: int = 8
+    reservations_per_day: int = 60
+    events_per_day: int = 6
+    history_days: int = 30
+    horizon_days: int = 7
+    seed: int = 7
+    # Keeps numeric ids unique across the facilities of a fleet
+    index: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class FleetSpec:
+    """
+    Facilities sharing mean sizes. Each facility's members and daily volume
+    are scaled by a lognormal factor (sigma = size_spread), so a fleet has a
+    few large and many small facilities like production.
+    """
+
+    facilities: int = 10
+    members: int = 1000
+    courts: int = 8
+    reservations_per_day: int = 60
+    events_per_day: int = 6
+    history_days: int = 30
+    horizon_days: int = 7
+    size_spread: float = 0.5
+    seed: int = 7
+    prefix: str = "synth"
+
+    def scaled(self, factor: float) -> "FleetSpec":
+        """Same fleet shape with factor x the members and daily volume."""
+        return replace(
+            self,
+            members=int(self.members * factor),
+            reservations_per_day=int(self.reservations_per_day * factor),
+            events_per_day=int(self.events_per_day * factor),
+        )
+
+    def code(self, index: int) -> str:
+        return f"{self.prefix}{index + 1:03d}"
+
+    def facility(self, code: str) -> FacilitySpec:
+        """Spec for one facility; codes outside the fleet get a stable size too."""
+        index = next(
+            (i for i in range(self.facilities) if self.code(i) == code),
+            None,
+        )
+        rng = random.Random(zlib.crc32(f"{self.seed}:size:{code}".encode()))
+        factor = rng.lognormvariate(0, self.size_spread) if self.size_spread else 1.0
+        return FacilitySpec(
+            code=code,
+            members=max(1, int(self.members * factor)),
+            courts=max(1, round(self.courts * min(factor, 2.0))),
+            reservations_per_day=max(1, int(self.reservations_per_day * factor)),
+            events_per_day=max(1, int(self.events_per_day * factor)),
+            history_days=self.history_days,
+            horizon_days=self.horizon_days,
+            seed=self.seed,
+            index=index,
+        )
+
+    def facility_specs(self) -> List[FacilitySpec]:
+        return [self.facility(self.code(i)) for i in range(self.facilities)]
+
+
+def _utc(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _local(dt: datetime) -> str:
+    """CourtReserve reports reservation times as naive facility-local times."""
+    return dt.astimezone(FACILITY_TZ).replace(tzinfo=None).isoformat()
+
+
+class SyntheticFacility:
+    """
+    One facility's payloads. ``iter_*`` methods stream records; the
+    properties build (and keep) full lists for the mock API.
+    """
+
+    def __init__(self, spec: FacilitySpec, now: Optional[datetime] = None):
+        self.spec = spec
+        self.now = (now or datetime.now(timezone.utc)).replace(microsecond=0)
+        self.seed = zlib.crc32(f"{spec.seed}:{spec.code}".encode())
+        self.id_base = (
+            spec.index if spec.index is not None else 1000 + self.seed % 9000
+        ) * 1_000_000_000
+
+    def _rng(self, stream: str) -> random.Random:
+        return random.Random(self.seed ^ zlib.crc32(stream.encode()))
+
+    def _id(self, kind: int, i: int) -> int:
+        # Stable numeric ids that don't collide across kinds or fleet facilities
+        return self.id_base + kind * 100_000_000 + i
+
+    def _days(self) -> range:
+        return range(-self.spec.history_days, self.spec.horizon_days + 1)
+
+    def _person(self, rng: random.Random, i: int) -> dict:
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        return {
+            "first": first,
+            "last": last,
+            "email": f"{first}.{last}.{self.spec.code}.{i}@example.com",
+            "phone": f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(0, 9999):04d}",
+            "gender": rng.choice(("Male", "Female", None)),
+            "birthday": datetime(rng.randint(1950, 2010), rng.randint(1, 12), rng.randint(1, 28)),
+        }
+
+    def _slot_start(self, rng: random.Random, day_offset: int, slots: int = 2) -> datetime:
+        """Random slot on a day that leaves room for a booking of `slots` slots."""
+        day = (self.now + timedelta(days=day_offset)).astimezone(FACILITY_TZ).date()
+        slot = rng.randrange((CLOSE_HOUR - OPEN_HOUR) * 60 // SLOT_MINUTES - slots)
+        start = datetime(day.year, day.month, day.day, OPEN_HOUR, tzinfo=FACILITY_TZ)
+        return start + timedelta(minutes=slot * SLOT_MINUTES)
+
+    @property
+    def court_labels(self) -> List[str]:
+        return [f"Court #{n}" for n in range(1, self.spec.courts + 1)]
+
+    # -- CourtReserve ------------------------------------------------------
+
+    def iter_courtreserve_members(self) -> Iterator[dict]:
+        rng = self._rng("cr_members")
+        history = timedelta(days=self.spec.history_days)
+        for i in range(self.spec.members):
+            person = self._person(rng, i)
+            updated = self.now - history * rng.random()
+            created = updated - timedelta(days=rng.randint(0, 720))
+            yield {
+                "OrganizationMemberId": self._id(1, i),
+                "MembershipNumber": self._id(1, i),
+                "FirstName": person["first"],
+                "LastName": person["last"],
+                "Email": person["email"],
+                # Some members only have a mobile number
+                "PhoneNumber": person["phone"] if rng.random() < 0.8 else None,
+                "MobilePhone": person["phone"],
+                "Gender": person["gender"],
+                "DateOfBirth": person["birthday"].isoformat(),
+                "MembershipTypeName": rng.choice(CR_MEMBERSHIP_TYPES),
+                "MembershipStartDate": created.date().isoformat(),
+                "IsStaff": rng.random() < 0.01,
+                "CreatedOnUtc": _utc(created),
+                "UpdatedOnUtc": _utc(updated),
+            }
+
+    @cached_property
+    def courtreserve_members(self) -> List[dict]:
+        return list(self.iter_courtreserve_members())
+
+    def _cr_players(self, rng: random.Random, count: int) -> List[dict]:
+        members = self.courtreserve_members
+        return [
+            {
+                "OrganizationMemberId": member["OrganizationMemberId"],
+                "FirstName": member["FirstName"],
+                "LastName": member["LastName"],
+            }
+            for member in rng.sample(members, k=min(len(members), count))
+        ]
+
+    def iter_courtreserve_reservations(self) -> Iterator[dict]:
+        """
+        listactive rows: court bookings (some overlapping the previous booking
+        on the same court, some spanning two courts) plus lessons and ball
+        machine bookings that the normalizer filters out.
+        """
+        rng = self._rng("cr_reservations")
+        i = 0
+        previous: Optional[Tuple[datetime, str]] = None
+        for day_offset in self._days():
+            for _ in range(self.spec.reservations_per_day):
+                slots = rng.choice((2, 3))
+                if previous and rng.random() < OVERLAP_RATE:
+                    start = previous[0] + timedelta(minutes=SLOT_MINUTES)
+                    courts = previous[1]
+                else:
+                    start = self._slot_start(rng, day_offset, slots)
+                    courts = rng.choice(self.court_labels)
+                    if self.spec.courts > 1 and rng.random() < MULTI_COURT_RATE:
+                        courts = ", ".join(rng.sample(self.court_labels, k=2))
+                end = start + timedelta(minutes=SLOT_MINUTES * slots)
+                previous = (start, courts)
+
+                type_id, type_name = 1, "Court Reservation"
+                if rng.random() < OTHER_TYPE_RATE:
+                    type_id, type_name = rng.choice(CR_OTHER_RESERVATION_TYPES)
+                created = min(self.now, start) - timedelta(days=rng.randint(0, 14))
+                updated = min(self.now, created + timedelta(minutes=rng.randint(0, 600)))
+                yield {
+                    "Id": self._id(2, i),
+                    "ReservationTypeId": type_id,
+                    "ReservationTypeName": type_name,
+                    "StartTime": _local(start),
+                    "EndTime": _local(end),
+                    "Courts": courts,
+                    "CreatedOnUtc": _utc(created),
+                    "UpdatedOnUtc": _utc(updated),
+                    "Players": self._cr_players(rng, rng.choice((1, 2, 4))),
+                }
+                i += 1
+
+    @cached_property
+    def courtreserve_reservations(self) -> List[dict]:
+        return list(self.iter_courtreserve_reservations())
+
+    def iter_courtreserve_cancellations(self) -> Iterator[dict]:
+        """listcancelled rows: registrants dropping out of past and upcoming events."""
+        rng = self._rng("cr_cancellations")
+        members = self.courtreserve_members
+        for i, event in enumerate(self.iter_courtreserve_events()):
+            if not members or rng.random() > CANCELLATION_RATE:
+                continue
+            member = rng.choice(members)
+            signed_up = self.now - timedelta(
+                days=rng.randint(1, max(1, self.spec.history_days))
+            )
+            yield {
+                "EventId": event["EventId"],
+                "EventDateId": self._id(3, i),
+                "EventName": event["EventName"],
+                "EventCategoryId": event["EventCategoryId"],
+                "EventCategoryName": event["EventCategoryName"],
+                "StartTime": _local(datetime.fromisoformat(event["StartDateTime"])),
+                "EndTime": _local(datetime.fromisoformat(event["EndDateTime"])),
+                "OrganizationMemberId": member["OrganizationMemberId"],
+                "FirstName": member["FirstName"],
+                "LastName": member["LastName"],
+                "Email": member["Email"],
+                "Phone": member["MobilePhone"],
+                "PriceToPay": rng.choice((0, 15, 25)),
+                "IsTeamEvent": event["EventCategoryName"] == "League",
+                "SignedUpOnUtc": _utc(signed_up),
+                "CancelledOnUtc": _utc(signed_up + (self.now - signed_up) * rng.random()),
+            }
+
+    @cached_property
+    def courtreserve_cancellations(self) -> List[dict]:
+        return list(self.iter_courtreserve_cancellations())
+
+    def iter_courtreserve_events(self) -> Iterator[dict]:
+        rng = self._rng("cr_events")
+        i = 0
+        for day_offset in self._days():
+            for _ in range(self.spec.events_per_day):
+                slots = rng.choice((2, 4))
+                start = self._slot_start(rng, day_offset, slots)
+                end = start + timedelta(minutes=SLOT_MINUTES * slots)
+                category_id, category_name = rng.choice(EVENT_CATEGORIES)
+                max_registrants = rng.choice((8, 12, 16))
+                courts = rng.sample(
+                    range(1, self.spec.courts + 1), k=min(self.spec.courts, rng.choice((1, 2, 4)))
+                )
+                yield {
+                    "EventId": self._id(4, i),
+                    "EventName": f"{category_name} {i}",
+                    "EventCategoryId": category_id,
+                    "EventCategoryName": category_name,
+                    "StartDateTime": start.isoformat(),
+                    "EndDateTime": end.isoformat(),
+                    "ReservationId": self._id(5, i),
+                    "MaxRegistrants": max_registrants,
+                    "RegisteredCount": rng.randint(0, max_registrants),
+                    "PriceInfo": [
+                        {
+                            "MembershipTypeName": membership_type,
+                            "DailyPrice": 0,
+                            "EntireEventPrice": price,
+                        }
+                        for membership_type, price in (("Premium", 15), ("Non-Member Account", 25))
+                    ],
+                    "RatingRestrictions": [
+                        {
+                            "CategoryName": "DUPR",
+                            "SystemName": "DUPR",
+                            "MinDoubles": 3.0,
+                            "MaxDoubles": 3.5,
+                        }
+                    ]
+                    if category_name == "League"
+                    else [],
+                    "TagsInfo": [],
+                    "Courts": [
+                        {
+                            "Id": self._id(6, n),
+                            "Label": f"Court #{n}",
+                            "TypeName": "Pickleball",
+                            "OrderIndex": n,
+                        }
+                        for n in sorted(courts)
+                    ],
+                }
+                i += 1
+
+    @cached_property
+    def courtreserve_events(self) -> List[dict]:
+        return list(self.iter_courtreserve_events())
+
+    def iter_courtreserve_upcoming(self, source: str) -> Iterator[dict]:
+        """Events / reservations starting in the next horizon_days (court availability)."""
+        if source == "events":
+            records, field = self.iter_courtreserve_events(), "StartDateTime"
+        else:
+            records, field = self.iter_courtreserve_reservations(), "StartTime"
+        today = self.now.astimezone(FACILITY_TZ).date()
+        last_day = today + timedelta(days=self.spec.horizon_days)
+        for record in records:
+            if today <= datetime.fromisoformat(record[field]).date() <= last_day:
+                yield record
+
+    # -- Podplay -----------------------------------------------------------
+
+    def iter_podplay_users(self) -> Iterator[dict]:
+        rng = self._rng("podplay_users")
+        history = timedelta(days=self.spec.history_days)
+        for i in range(self.spec.members):
+            person = self._person(rng, i)
+            member_since = self.now - history * rng.random()
+            memberships = []
+            for n in range(rng.choice((0, 0, 1, 2))):
+                membership_id, name = rng.choice(PODPLAY_MEMBERSHIPS)
+                started = member_since + timedelta(days=30 * n)
+                memberships.append(
+                    {
+                        "id": f"user-membership-{self._id(7, i)}-{n}",
+                        "membership": {"id": membership_id, "name": name},
+                        "createdAt": _utc(started),
+                        "startedAt": _utc(started),
+                        "status": "ACTIVE" if n else "EXPIRED",
+                    }
+                )
+            yield {
+                "id": f"user-{self._id(1, i)}",
+                "firstName": person["first"],
+                "lastName": person["last"],
+                "email": person["email"],
+                # The API returns either a plain string or a phone object
+                "phoneNumber": (
+                    person["phone"]
+                    if rng.random() < 0.7
+                    else {"id": f"phone-{i}", "phoneNumber": person["phone"]}
+                ),
+                "gender": person["gender"],
+                "birthday": _utc(person["birthday"].replace(tzinfo=timezone.utc)),
+                "membershipType": (
+                    memberships[-1]["membership"]["name"] if memberships else "NONE"
+                ),
+                "memberships": {"items": memberships, "_total": len(memberships)},
+                "profile": {"memberSince": _utc(member_since)},
+            }
+
+    @cached_property
+    def podplay_users(self) -> List[dict]:
+        return list(self.iter_podplay_users())
+
+    def _invitations(self, rng: random.Random, count: int) -> List[dict]:
+        users = self.podplay_users
+        invitations = []
+        for user in rng.sample(users, k=min(len(users), count)):
+            status = rng.choices(("ACCEPTED", "PENDING", "DECLINED", "CANCELLED"), (80, 10, 5, 5))[0]
+            if rng.random() < 0.1:
+                # Guests invited by email have no profile yet
+                invitations.append(
+                    {"status": status, "invitee": {"email": user["email"]}}
+                )
+            else:
+                invitations.append(
+                    {
+                        "status": status,
+                        "inviteeProfile": {"id": user["id"]},
+                        "invitee": {"email": user["email"]},
+                    }
+                )
+        return invitations
+
+    def iter_podplay_events(self) -> Iterator[dict]:
+        """
+        /events items: REGULAR court bookings with reservations and invitations
+        (overlapping like CourtReserve's) plus CLASS / EVENT programs.
+        """
+        rng = self._rng("podplay_events")
+        users = self.podplay_users
+        i = 0
+        previous: Optional[datetime] = None
+        per_day = self.spec.reservations_per_day + self.spec.events_per_day
+        for day_offset in self._days():
+            for n in range(per_day):
+                slots = rng.choice((2, 3))
+                if previous and rng.random() < OVERLAP_RATE:
+                    start = previous + timedelta(minutes=SLOT_MINUTES)
+                else:
+                    start = self._slot_start(rng, day_offset, slots)
+                end = start + timedelta(minutes=SLOT_MINUTES * slots)
+                previous = start
+                created = min(self.now, start) - timedelta(days=rng.randint(0, 14))
+                is_booking = n < self.spec.reservations_per_day
+                invitations = self._invitations(rng, rng.choice((1, 3)) if is_booking else rng.randint(4, 12))
+                booker = rng.choice(users) if users else None
+
+                reservations = []
+                if is_booking:
+                    reservations.append(
+                        {
+                            "id": f"reservation-{self._id(3, i)}",
+                            "startTime": _utc(start),
+                            "endTime": _utc(end),
+                            "createdAt": _utc(created),
+                            "updatedAt": _utc(created + timedelta(minutes=rng.randint(0, 600))),
+                            "cancelledAt": (
+                                _utc(created + timedelta(hours=1))
+                                if rng.random() < CANCELLED_RATE
+                                else None
+                            ),
+                            "tableAssignment": "ASSIGNED",
+                            "table": {"id": f"table-{rng.randint(1, self.spec.courts)}"},
+                            "bookedBy": {"id": booker["id"]} if booker else {},
+                        }
+                    )
+                yield {
+                    "id": f"event-{self._id(2, i)}",
+                    "type": "REGULAR" if is_booking else rng.choice(("CLASS", "EVENT")),
+                    "subtype": rng.choice(PODPLAY_EVENT_SUBTYPES),
+                    "name": f"Booking {i}" if is_booking else f"Program {i}",
+                    "description": None,
+                    "startTime": _utc(start),
+                    "endTime": _utc(end),
+                    "totalTeams": None if is_booking else rng.choice((None, 4, 8)),
+                    "teamSize": None if is_booking else 2,
+                    "admissionRate": {"regular": 2000, "member": 1500},
+                    "signups": {"_total": len(invitations)},
+                    "reservations": {"items": reservations, "_total": len(reservations)},
+                    "invitations": {"items": invitations, "_total": len(invitations)},
+                }
+                i += 1
+
+    @cached_property
+    def podplay_events(self) -> List[dict]:
+        return list(self.iter_podplay_events())
+
+    def iter_podplay_sessions(self) -> Iterator[dict]:
+        """/sessions items: one per 30-minute slot over the horizon, FULL when no court is free."""
+        rng = self._rng("podplay_sessions")
+        for day_offset in range(self.spec.horizon_days + 1):
+            day = (self.now + timedelta(days=day_offset)).astimezone(FACILITY_TZ).date()
+            start = datetime(day.year, day.month, day.day, OPEN_HOUR, tzinfo=FACILITY_TZ)
+            while start.hour < CLOSE_HOUR:
+                end = start + timedelta(minutes=SLOT_MINUTES)
+                free = [n for n in range(1, self.spec.courts + 1) if rng.random() < 0.6]
+                tables = [
+                    {
+                        "id": f"available-table-{n}",
+                        "type": "FIXED_TABLE",
+                        "table": {
+                            "id": f"table-{n}",
+                            "displayName": f"Court #{n}",
+                            "displayNameShort": f"C{n}",
+                        },
+                        "rate": 4000,
+                        "lessonRate": 6000,
+                    }
+                    for n in free
+                ]
+                if free:
+                    # "Any court" entries carry no table and are skipped
+                    tables.append({"id": "available-table-auto", "type": "AUTO", "table": None, "rate": 4000})
+                yield {
+                    "id": f"session-{self.spec.code}-{_utc(start)}",
+                    "pod": {},
+                    "startTime": _utc(start),
+                    "endTime": _utc(end),
+                    "periodType": "PEAK" if start.hour >= 17 else "OFF_PEAK",
+                    "tablesLeft": len(free),
+                    "status": "AVAILABLE" if free else "FULL",
+                    "availableTables": {"items": tables, "_total": len(tables)},
+                }
+                start = end
+
+    @cached_property
+    def podplay_sessions(self) -> List[dict]:
+        return list(self.iter_podplay_sessions())
+
+    # -- Archives ----------------------------------------------------------
+
+    def iter_source(self, source: str) -> Iterator[dict]:
+        """Records of one raw archive source (see ingestion.main.REPLAY_SOURCES)."""
+        return {
+            "courtreserve_members": self.iter_courtreserve_members,
+            "courtreserve_reservations": self.iter_courtreserve_reservations,
+            "courtreserve_reservation_cancellations": self.iter_courtreserve_cancellations,
+            "courtreserve_events": self.iter_courtreserve_events,
+            "courtreserve_court_availability_events": lambda: self.iter_courtreserve_upcoming("events"),
+            "courtreserve_court_availability_reservations": lambda: self.iter_courtreserve_upcoming(
+                "reservations"
+            ),
+            "podplay_members": self.iter_podplay_users,
+            "podplay_reservations": lambda: (
+                event for event in self.iter_podplay_events() if event["type"] == "REGULAR"
+            ),
+            "podplay_events": lambda: (
+                event for event in self.iter_podplay_events() if event["type"] != "REGULAR"
+            ),
+            "podplay_court_availability": self.iter_podplay_sessions,
+        }[source]()
+
+
+def _batches(records: Iterator[dict], size: int = 5000) -> Iterator[List[dict]]:
+    batch: List[dict] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_archives(
+    fleet: FleetSpec,
+    root: str,
+    source_system: str = "both",
+    run_id: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> Tuple[str, dict]:
+    """
+    Write every facility of the fleet as raw archives under root.
+
+    Args:
+        fleet: Facilities to generate
+        root: Archive root (what ``replay --dir`` reads)
+        source_system: "courtreserve", "podplay" or "both" (half the fleet each)
+        run_id: Run id for the file names (default: now, like a live run)
+        now: Reference time; defaults to the time encoded in run_id
+
+    Returns:
+        (run_id, {source: record count})
+    """
+    from ingestion.archive import RawArchiveWriter, run_started_at
+
+    now = now or datetime.now(timezone.utc)
+    run_id = run_id or f"{now.strftime('%Y%m%dT%H%M%SZ')}-{secrets.token_hex(4)}"
+    now = run_started_at(run_id) or now
+
+    counts: dict = {}
+    for index, spec in enumerate(fleet.facility_specs()):
+        if source_system == "both":
+            sources = COURTRESERVE_SOURCES if index % 2 == 0 else PODPLAY_SOURCES
+        elif source_system == "courtreserve":
+            sources = COURTRESERVE_SOURCES
+        else:
+            sources = PODPLAY_SOURCES
+        facility = SyntheticFacility(spec, now=now)
+        for source in sources:
+            with RawArchiveWriter.open(root, source, spec.code, run_id) as archive:
+                for batch in _batches(facility.iter_source(source)):
+                    archive.write(batch)
+                counts[source] = counts.get(source, 0) + archive.count
+    return run_id, counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--facilities", type=int, default=10)
+    parser.add_argument("--members", type=int, default=1000, help="Mean members per facility")
+    parser.add_argument("--courts", type=int, default=8, help="Mean courts per facility")
+    parser.add_argument("--reservations-per-day", type=int, default=60)
+    parser.add_argument("--events-per-day", type=int, default=6)
+    parser.add_argument("--history-days", type=int, default=30)
+    parser.add_argument("--horizon-days", type=int, default=7)
+    parser.add_argument("--size-spread", type=float, default=0.5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiply members and daily volume"
+    )
+    parser.add_argument(
+        "--source-system", choices=("courtreserve", "podplay", "both"), default="both"
+    )
+    parser.add_argument("--out", default="elt_output_jsons/raw", help="Archive root")
+    parser.add_argument("--run-id", default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    fleet = FleetSpec(
+        facilities=args.facilities,
+        members=args.members,
+        courts=args.courts,
+        reservations_per_day=args.reservations_per_day,
+        events_per_day=args.events_per_day,
+        history_days=args.history_days,
+        horizon_days=args.horizon_days,
+        size_spread=args.size_spread,
+        seed=args.seed,
+    ).scaled(args.scale)
+
+    start = time.perf_counter()
+    run_id, counts = write_archives(fleet, args.out, args.source_system, args.run_id)
+    elapsed = time.perf_counter() - start
+    print(f"[SYNTHETIC] {args.facilities} facilities, run {run_id}, {elapsed:.1f}s")
+    for source, count in sorted(counts.items()):
+        print(f"  {source:<48} {count:>10}")
+    print(f"[SYNTHETIC] Replay with: python -m ingestion.main replay all --dir {args.out} --run {run_id}")
+
+
+if __name__ == "__main__":
+    main()
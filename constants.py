@@ -10,5 +10,8 @@ class Tables:
     RESERVATION_CANCELLATIONS_RAW = "reservation_cancellations_raw"
     RESERVATION_CANCELLATIONS_RAW_STG = "reservation_cancellations_raw_stg"
     ELT_WATERMARKS = "elt_watermarks"
+    ELT_CHECKPOINTS = "elt_checkpoints"
+    INGESTION_RUN_METRICS = "ingestion_run_metrics"
     MEMBERS_RAW = "members_raw"
     MEMBERS_RAW_STG = "members_raw_stg"
+    FACILITY_COURT_AVAILABILITIES = "facility_court_availabilities"
@@ -0,0 +1,199 @@
+"""Streaming, compressed archive of raw API payloads.
+
+Workers write each page (or date window) of raw records as it arrives, one
+JSON object per line, instead of collecting every client's payloads in memory
+and dumping them with ``json.dump(..., indent=2)`` at the end of the run.
+Files are partitioned by source, client and run:
+
+    elt_output_jsons/raw/<source>/<client_code>/<run_id>.ndjson.gz
+
+Archives are written when SAVE_TO_JSON is on, located with
+``find_archives`` and read back with ``iter_records``
+(``python -m ingestion.main replay`` reprocesses them).
+
+    RAW_ARCHIVE_COMPRESSION  zstd | gzip | none (default: zstd if the
+                             zstandard package is installed, else gzip)
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import io
+import json
+import os
+from datetime import datetime, timezone
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+COMPRESSIONS = ("zstd", "gzip", "none")
+EXTENSIONS = {"zstd": ".ndjson.zst", "gzip": ".ndjson.gz", "none": ".ndjson"}
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def _zstd_available() -> bool:
+    return importlib.util.find_spec("zstandard") is not None
+
+
+def get_compression() -> str:
+    raw = os.getenv("RAW_ARCHIVE_COMPRESSION", "").strip().lower()
+    if raw == "zstd" and not _zstd_available():
+        print("[RAW ARCHIVE] zstandard is not installed, falling back to gzip")
+        return "gzip"
+    if raw in COMPRESSIONS:
+        return raw
+    return "zstd" if _zstd_available() else "gzip"
+
+
+def archive_path(
+    root: str, source: str, client_code: str, run_id: str, compression: str
+) -> str:
+    return os.path.join(
+        root, source, client_code.lower(), f"{run_id}{EXTENSIONS[compression]}"
+    )
+
+
+def run_started_at(run_id: str) -> Optional[datetime]:
+    """UTC start time encoded in a run id (``20260101T020000Z-ab12cd34``)."""
+    try:
+        return datetime.strptime(run_id.split("-", 1)[0], "%Y%m%dT%H%M%SZ").replace(
+            tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
+
+
+def run_id_of(path: str) -> str:
+    name = os.path.basename(path)
+    for extension in EXTENSIONS.values():
+        if name.endswith(extension):
+            return name[: -len(extension)]
+    return name
+
+
+def find_archives(
+    root: str,
+    source: str,
+    run_id: Optional[str] = None,
+    client_codes: Optional[Sequence[str]] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Locate archives of one source.
+
+    Args:
+        root: Archive root (elt_output_jsons/raw)
+        source: Source directory, e.g. "courtreserve_members"
+        run_id: Only this run; default is each client's latest run
+        client_codes: Only these clients
+
+    Returns:
+        (client_code, path) per client, sorted by client code
+    """
+    source_dir = os.path.join(root, source)
+    if not os.path.isdir(source_dir):
+        return []
+    wanted = {code.lower() for code in client_codes} if client_codes else None
+
+    found = []
+    for client_code in sorted(os.listdir(source_dir)):
+        client_dir = os.path.join(source_dir, client_code)
+        if not os.path.isdir(client_dir) or (wanted and client_code not in wanted):
+            continue
+        # Run ids start with the UTC start time, so name order is run order
+        paths = sorted(
+            os.path.join(client_dir, name)
+            for name in os.listdir(client_dir)
+            if name.endswith(tuple(EXTENSIONS.values()))
+        )
+        if run_id:
+            paths = [path for path in paths if run_id_of(path) == run_id]
+        if paths:
+            found.append((client_code, paths[-1]))
+    return found
+
+
+def _open_write(path: str, compression: str) -> IO[bytes]:
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=GZIP_LEVEL)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(
+            open(path, "wb"), closefd=True
+        )
+    return open(path, "wb")
+
+
+def _open_read(path: str) -> IO[bytes]:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".zst"):
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return open(path, "rb")
+
+
+class RawArchiveWriter:
+    """
+    Append raw records to one archive file. The file is created on the first
+    write, so clients with no data leave nothing behind. A writer without a
+    path (``RawArchiveWriter.disabled()``) accepts and drops everything.
+    """
+
+    def __init__(self, path: Optional[str], compression: str = "gzip"):
+        self.path = path
+        self.compression = compression
+        self.count = 0
+        self._file: Optional[IO[bytes]] = None
+
+    @classmethod
+    def open(
+        cls,
+        root: str,
+        source: str,
+        client_code: str,
+        run_id: str,
+        compression: Optional[str] = None,
+    ) -> "RawArchiveWriter":
+        compression = compression or get_compression()
+        return cls(archive_path(root, source, client_code, run_id, compression), compression)
+
+    @classmethod
+    def disabled(cls) -> "RawArchiveWriter":
+        return cls(None)
+
+    def write(self, records: Iterable[dict]) -> None:
+        if self.path is None:
+            return
+        lines = [
+            json.dumps(record, separators=(",", ":"), default=str) for record in records
+        ]
+        if not lines:
+            return
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = _open_write(self.path, self.compression)
+        self._file.write(("\n".join(lines) + "\n").encode("utf-8"))
+        self.count += len(lines)
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        print(f"[RAW ARCHIVE] Saved {self.count} records to {self.path}")
+
+    def __enter__(self) -> "RawArchiveWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def iter_records(path: str) -> Iterator[dict]:
+    """Stream the records of one archive file (.ndjson, .ndjson.gz or .ndjson.zst)."""
+    with _open_read(path) as raw:
+        for line in io.TextIOWrapper(raw, encoding="utf-8"):
+            if line.strip():
+                yield json.loads(line)
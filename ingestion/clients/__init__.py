@@ -1,6 +1,20 @@
-from .courtreserve_client import CourtReserveClient
-from .podplay_client import PodplayClient
-from .postgres_client import PostgresClient
-from .google_places_client import GooglePlacesClient
+from importlib import import_module
+
+# Clients are imported on first attribute access so that importing one client
+# (or ingestion.main) doesn't pull in requests, psycopg2 and every other client
+_CLIENT_MODULES = {
+    "CourtReserveClient": ".courtreserve_client",
+    "PodplayClient": ".podplay_client",
+    "PostgresClient": ".postgres_client",
+    "GooglePlacesClient": ".google_places_client",
+}
 
 __all__ = ["CourtReserveClient", "PodplayClient", "PostgresClient", "GooglePlacesClient"]
+
+
+def __getattr__(name):
+    if name in _CLIENT_MODULES:
+        value = getattr(import_module(_CLIENT_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,169 @@
+"""Bulk row loading for PostgresClient.
+
+Every batch insert goes through ``bulk_insert``, which loads rows with one of
+three psycopg2 strategies:
+
+    values  execute_values: multi-row INSERT ... VALUES per page (default)
+    batch   execute_batch: single-row INSERTs sent page_size at a time
+    copy    COPY FROM STDIN per page; with a conflict clause the page is
+            copied into a temp table and INSERT ... SELECTed from there
+
+``python -m benchmarks.bench_insert`` measures rows/s and WAL bytes of each
+strategy and page size against a local database.
+
+    PG_LOAD_STRATEGY   values | batch | copy (default values)
+    PG_LOAD_PAGE_SIZE  Rows per statement / COPY (default 1000)
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+from datetime import date, datetime, time
+from typing import Optional, Sequence
+
+from psycopg2.extras import execute_batch, execute_values
+
+from ingestion import log
+
+LOAD_STRATEGIES = ("values", "batch", "copy")
+DEFAULT_LOAD_STRATEGY = "values"
+DEFAULT_LOAD_PAGE_SIZE = 1000
+COPY_STAGE_TABLE = "_bulk_load_stage"
+
+logger = log.get_logger("postgres")
+
+
+def get_load_strategy() -> str:
+    strategy = os.getenv("PG_LOAD_STRATEGY", "").strip().lower()
+    return strategy if strategy in LOAD_STRATEGIES else DEFAULT_LOAD_STRATEGY
+
+
+def get_load_page_size() -> int:
+    raw = os.getenv("PG_LOAD_PAGE_SIZE")
+    if not raw:
+        return DEFAULT_LOAD_PAGE_SIZE
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_LOAD_PAGE_SIZE
+    return max(1, value)
+
+
+def _copy_value(value) -> str:
+    """One field in COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        value = json.dumps(value)
+    elif isinstance(value, (list, tuple)):
+        raise TypeError(
+            "Array values are not supported by PG_LOAD_STRATEGY=copy; use values"
+        )
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_page(cur, table: str, column_list: str, page: Sequence[tuple]) -> None:
+    buffer = io.StringIO(
+        "".join("\t".join(_copy_value(v) for v in row) + "\n" for row in page)
+    )
+    cur.copy_expert(f"COPY {table} ({column_list}) FROM STDIN", buffer)
+
+
+def bulk_insert(
+    cur,
+    table: str,
+    columns: Sequence[str],
+    rows: Sequence[tuple],
+    conflict: str = "",
+    strategy: Optional[str] = None,
+    page_size: Optional[int] = None,
+) -> int:
+    """
+    Insert rows into a table inside the cursor's transaction.
+
+    Args:
+        cur: Open cursor; the caller commits
+        table: Quoted, schema-qualified table name ('"schema"."table"')
+        columns: Column names, in row order
+        rows: Row tuples
+        conflict: Optional "ON CONFLICT ..." clause
+        strategy: values | batch | copy (default PG_LOAD_STRATEGY)
+        page_size: Rows per statement (default PG_LOAD_PAGE_SIZE)
+
+    Returns:
+        Rows inserted or updated, or -1 when the strategy can't tell (batch)
+    """
+    strategy = strategy or get_load_strategy()
+    page_size = page_size or get_load_page_size()
+    column_list = ", ".join(columns)
+    total_pages = (len(rows) + page_size - 1) // page_size
+    affected = 0
+
+    if strategy == "copy" and conflict:
+        # COPY has no ON CONFLICT; land each page in a temp table first
+        cur.execute(f'DROP TABLE IF EXISTS "{COPY_STAGE_TABLE}"')
+        cur.execute(
+            f"""
+            CREATE TEMP TABLE "{COPY_STAGE_TABLE}" ON COMMIT DROP AS
+            SELECT {column_list} FROM {table} WITH NO DATA
+            """
+        )
+
+    for i in range(0, len(rows), page_size):
+        page = rows[i : i + page_size]
+        if strategy == "copy" and conflict:
+            cur.execute(f'TRUNCATE "{COPY_STAGE_TABLE}"')
+            _copy_page(cur, f'"{COPY_STAGE_TABLE}"', column_list, page)
+            cur.execute(
+                f"""
+                INSERT INTO {table} ({column_list})
+                SELECT {column_list} FROM "{COPY_STAGE_TABLE}"
+                {conflict}
+                """
+            )
+            affected += cur.rowcount
+        elif strategy == "copy":
+            _copy_page(cur, table, column_list, page)
+            affected += len(page)
+        elif strategy == "batch":
+            placeholders = ", ".join(["%s"] * len(columns))
+            execute_batch(
+                cur,
+                f"INSERT INTO {table} ({column_list}) VALUES ({placeholders}) {conflict}",
+                page,
+                page_size=page_size,
+            )
+            affected = -1
+        else:
+            execute_values(
+                cur,
+                f"INSERT INTO {table} ({column_list}) VALUES %s {conflict}",
+                page,
+                page_size=page_size,
+            )
+            affected += cur.rowcount
+        if log.sampled(logger, "bulk_insert"):
+            logger.info(
+                "[BULK INSERT] Page %s/%s (%s rows) into %s via %s",
+                i // page_size + 1,
+                total_pages,
+                len(page),
+                table,
+                strategy,
+            )
+
+    if strategy == "copy" and conflict:
+        cur.execute(f'DROP TABLE IF EXISTS "{COPY_STAGE_TABLE}"')
+    return affected
@@ -1,7 +1,11 @@
-import requests
 from requests.auth import HTTPBasicAuth
 from datetime import date, datetime, timedelta, timezone
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Tuple
+
+from ingestion import log
+from ingestion.clients.http import build_session, get_base_url
+
+logger = log.get_logger("courtreserve")
 
 
 class CourtReserveClient:
@@ -9,6 +13,11 @@ class CourtReserveClient:
 
     def __init__(self, username: str, password: str):
         self.auth = HTTPBasicAuth(username, password)
+        # COURTRESERVE_BASE_URL points the client at a local mock (benchmarks.mock_api)
+        self.BASE_URL = get_base_url("COURTRESERVE_BASE_URL", self.BASE_URL)
+        # Reuse TCP/TLS connections across requests (and runs, in daemon mode)
+        self.session = build_session()
+        self.session.auth = self.auth
 
     def _get_utc_datetime(self, d) -> date:
         if d.tzinfo is None:
@@ -37,10 +46,12 @@ class CourtReserveClient:
         url = f"{self.BASE_URL}/api/v1/member/get"
         start = self._get_utc_datetime(start)
         end = self._get_utc_datetime(end)
-        print(
-            f"[API CALL] GET /api/v1/member/get | "
-            f"window={start.date()} to {end.date()} | "
-            f"page={page_number} | page_size={page_size}"
+        logger.debug(
+            "[API CALL] GET /api/v1/member/get | window=%s to %s | page=%s | page_size=%s",
+            start.date(),
+            end.date(),
+            page_number,
+            page_size,
         )
         params = {
             "pageNumber": page_number,
@@ -50,7 +61,7 @@ class CourtReserveClient:
             "createdOrUpdatedFrom": start.isoformat(),
             "createdOrUpdatedTo": end.isoformat(),
         }
-        resp = requests.get(url, params=params, auth=self.auth)
+        resp = self.session.get(url, params=params)
         resp.raise_for_status()
         error_message = resp.json().get("ErrorMessage")
         success_status = resp.json().get("IsSuccessStatusCode")
@@ -59,15 +70,19 @@ class CourtReserveClient:
         data = resp.json()["Data"]
         members_count = len(data.get("Members", []))
         total_pages = data.get("TotalPages", 1)
-        print(
-            f"[API RESPONSE] GET /api/v1/member/get | "
-            f"window={start.date()} to {end.date()} | "
-            f"page={page_number} | records_returned={members_count} | "
-            f"total_pages={total_pages}"
-        )
+        if log.sampled(logger, "courtreserve_members_page"):
+            logger.info(
+                "[API RESPONSE] GET /api/v1/member/get | window=%s to %s | "
+                "page=%s | records_returned=%s | total_pages=%s",
+                start.date(),
+                end.date(),
+                page_number,
+                members_count,
+                total_pages,
+            )
         return data
 
-    def get_members_since(
+    def iter_member_windows(
         self,
         start: datetime,
         *,
@@ -76,11 +91,15 @@ class CourtReserveClient:
         include_user_defined_fields: bool = True,
         include_ratings: bool = True,
         max_results: Optional[int] = None,
-    ) -> list[dict]:
+    ) -> Iterator[Tuple[datetime, datetime, list[dict], int]]:
+        """
+        Yield (window_start, window_end, members, pages) one date window at a
+        time, so callers can load and checkpoint each window before the next.
+        """
         start = self._get_utc_datetime(start)
         now = self._get_utc_datetime(datetime.now())
 
-        members: list[dict] = []
+        total = 0
         window_num = 0
         for window_start in self._generate_date(start, record_window_days):
             if window_start > now:
@@ -94,9 +113,10 @@ class CourtReserveClient:
             print(
                 f"\n[COURTRESERVE MEMBERS] Processing date window {window_num}: "
                 f"{window_start.date()} to {window_end.date()} "
-                f"(so far {len(members)} total members)"
+                f"(so far {total} total members)"
             )
 
+            members: list[dict] = []
             page_number = 1
             while True:
                 page = self.get_members_page(
@@ -110,31 +130,58 @@ class CourtReserveClient:
                 page_members = page.get("Members", [])
                 members.extend(page_members)
 
-                print(
-                    f"[COURTRESERVE MEMBERS] Window {window_num} page {page_number}: "
-                    f"added {len(page_members)} members | "
-                    f"total so far: {len(members)}"
+                logger.debug(
+                    "[COURTRESERVE MEMBERS] Window %s page %s: added %s members | "
+                    "total so far: %s",
+                    window_num,
+                    page_number,
+                    len(page_members),
+                    total + len(members),
                 )
 
-                if max_results and len(members) >= max_results:
+                if max_results and total + len(members) >= max_results:
                     print(
                         f"[COURTRESERVE MEMBERS] Reached max_results={max_results}, "
                         f"stopping pagination"
                     )
-                    return members[:max_results]
+                    yield window_start, window_end, members[: max_results - total], page_number
+                    return
 
                 total_pages = page.get("TotalPages") or 1
                 if page_number >= total_pages:
-                    print(
-                        f"[COURTRESERVE MEMBERS] Window {window_num} complete: "
-                        f"reached last page ({total_pages})"
+                    logger.debug(
+                        "[COURTRESERVE MEMBERS] Window %s complete: reached last page (%s)",
+                        window_num,
+                        total_pages,
                     )
                     break
                 page_number += 1
 
-        print(
-            f"\n[COURTRESERVE MEMBERS] All windows complete: {len(members)} total members"
-        )
+            total += len(members)
+            yield window_start, window_end, members, page_number
+
+        print(f"\n[COURTRESERVE MEMBERS] All windows complete: {total} total members")
+
+    def get_members_since(
+        self,
+        start: datetime,
+        *,
+        record_window_days: int = 21,
+        page_size: int = 500,
+        include_user_defined_fields: bool = True,
+        include_ratings: bool = True,
+        max_results: Optional[int] = None,
+    ) -> list[dict]:
+        members: list[dict] = []
+        for _, _, window_members, _ in self.iter_member_windows(
+            start,
+            record_window_days=record_window_days,
+            page_size=page_size,
+            include_user_defined_fields=include_user_defined_fields,
+            include_ratings=include_ratings,
+            max_results=max_results,
+        ):
+            members.extend(window_members)
         return members
 
     # Non-Event Reservations
@@ -152,16 +199,24 @@ class CourtReserveClient:
             include_user_defined_fields: Include user defined fields
         """
         print("Get reservations by updated date")
-        url = f"{self.BASE_URL}/api/v1/reservationreport/listactive"
-
         reservations = []
-        record_window_days = 7
-        watermark = watermark.replace(hour=0, minute=0, second=0, microsecond=0)
+        for _, _, data in self.iter_reservation_windows(
+            watermark, include_user_defined_fields=include_user_defined_fields
+        ):
+            reservations.extend(data)
+        return reservations
+
+    def iter_reservation_windows(
+        self,
+        watermark: date,
+        include_user_defined_fields: bool = False,
+        record_window_days: int = 7,
+    ) -> Iterator[Tuple[datetime, datetime, list[dict]]]:
+        """Yield (window_start, window_end, reservations) per createdOrUpdatedOn window."""
+        url = f"{self.BASE_URL}/api/v1/reservationreport/listactive"
 
         for start_date in self._generate_date(watermark, record_window_days):
-            print(f"Start date {start_date}")
             if start_date > datetime.now(timezone.utc):
-                print("break")
                 break
             end_date = min(
                 self._get_utc_datetime(datetime.now()),
@@ -172,15 +227,18 @@ class CourtReserveClient:
                 "createdOrUpdatedOnTo": end_date.isoformat(),
                 "includeUserDefinedFields": include_user_defined_fields,
             }
-            resp = requests.get(url, params=params, auth=self.auth)
+            resp = self.session.get(url, params=params)
             resp.raise_for_status()
             data = resp.json().get("Data") or []
-            reservations.extend(data)
-            print(
-                f"Start date {start_date} End date {end_date} Appended {len(data)} rows"
-            )
-
-        return reservations
+            if log.sampled(logger, "courtreserve_reservation_window"):
+                logger.info(
+                    "[API RESPONSE] GET /api/v1/reservationreport/listactive | "
+                    "window=%s to %s | records_returned=%s",
+                    start_date,
+                    end_date,
+                    len(data),
+                )
+            yield start_date, end_date, data
 
     def get_reservations_by_start_date(
         self,
@@ -217,7 +275,7 @@ class CourtReserveClient:
             f"reservationsToDate={params['reservationsToDate']}"
         )
 
-        resp = requests.get(url, params=params, auth=self.auth)
+        resp = self.session.get(url, params=params)
         resp.raise_for_status()
         data = resp.json().get("Data") or []
 
@@ -238,7 +296,7 @@ class CourtReserveClient:
             "cancelledOnFrom": elt_watermark_event_cancellations.isoformat(),
             "cancelledOnTo": datetime.now(timezone.utc).isoformat(),
         }
-        resp = requests.get(url, params=params, auth=self.auth)
+        resp = self.session.get(url, params=params)
         resp.raise_for_status()
         return resp.json().get("Data") or []
 
@@ -307,7 +365,7 @@ class CourtReserveClient:
         if tag_ids:
             params["tagIds"] = tag_ids
 
-        resp = requests.get(url, params=params, auth=self.auth)
+        resp = self.session.get(url, params=params)
         resp.raise_for_status()
 
         error_message = resp.json().get("ErrorMessage")
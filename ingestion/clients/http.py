@@ -0,0 +1,67 @@
+"""Shared requests.Session setup for the CourtReserve and Podplay clients.
+
+GETs that come back 429 (Too Many Requests) are retried with exponential
+backoff, honouring Retry-After, before the response reaches the caller; once
+retries run out the last 429 is returned and raise_for_status() raises as
+before.
+
+    INGEST_HTTP_MAX_RETRIES  Retries per request on 429 (default 3, 0 = off)
+    INGEST_HTTP_BACKOFF      Backoff factor in seconds (default 0.5)
+"""
+
+from __future__ import annotations
+
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+
+
+def get_max_retries() -> int:
+    raw = os.getenv("INGEST_HTTP_MAX_RETRIES")
+    if not raw:
+        return DEFAULT_MAX_RETRIES
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_MAX_RETRIES
+    return max(0, value)
+
+
+def get_backoff() -> float:
+    raw = os.getenv("INGEST_HTTP_BACKOFF")
+    if not raw:
+        return DEFAULT_BACKOFF
+    try:
+        value = float(raw)
+    except ValueError:
+        return DEFAULT_BACKOFF
+    return max(0.0, value)
+
+
+def build_session() -> requests.Session:
+    """Session that retries rate-limited GETs."""
+    retry = Retry(
+        total=get_max_retries(),
+        connect=0,
+        read=0,
+        status_forcelist=(429,),
+        allowed_methods=frozenset({"GET"}),
+        backoff_factor=get_backoff(),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_base_url(env_var: str, default: str) -> str:
+    """API base URL, overridable for local mocks (no trailing slash)."""
+    return (os.getenv(env_var) or default).rstrip("/")
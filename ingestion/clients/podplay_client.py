@@ -4,7 +4,10 @@ from datetime import datetime, timezone
 from typing import Dict, Iterable, List, Optional
 import time
 
-import requests
+from ingestion import log
+from ingestion.clients.http import build_session, get_base_url
+
+logger = log.get_logger("podplay")
 
 
 class PodplayClient:
@@ -17,7 +20,9 @@ class PodplayClient:
         if not api_key:
             raise ValueError("Podplay API key is required")
 
-        self.session = requests.Session()
+        # PODPLAY_BASE_URL points the client at a local mock (benchmarks.mock_api)
+        self.BASE_URL = get_base_url("PODPLAY_BASE_URL", self.BASE_URL)
+        self.session = build_session()
         self.session.headers.update(
             {
                 "x-api-key": api_key,
@@ -59,106 +64,54 @@ class PodplayClient:
 
         while True:
             page_params = {**base_params, "page": page}
-            # Log key params for debugging (don't log full expand array)
-            log_params = {k: v for k, v in page_params.items() if k != "expand"}
-
-            # Build clearer log message
-            log_parts = [
-                f"[API CALL] GET {path}",
-                f"page={page_params.get('page')}",
-                f"ipp={page_params.get('ipp')}",
-            ]
-
-            # Show date range more clearly
-            start_time = log_params.get("startTime")
-            end_time = log_params.get("endTime")
-            if start_time and end_time:
-                log_parts.append(f"dateWindow=[{start_time} → {end_time}]")
-            elif start_time:
-                log_parts.append(f"startTime={start_time} (API default: +30 days)")
-
-            if log_params.get("podId"):
-                log_parts.append(f"podId={log_params.get('podId')}")
-
-            log_parts.append(f"total_yielded={yielded}")
-
-            print(" | ".join(log_parts))
+            if logger.isEnabledFor(log.DEBUG):
+                logger.debug(
+                    "[API CALL] GET %s | page=%s | ipp=%s | startTime=%s | "
+                    "endTime=%s | podId=%s | total_yielded=%s",
+                    path,
+                    page,
+                    page_params.get("ipp"),
+                    page_params.get("startTime"),
+                    page_params.get("endTime") or "(API default: +30 days)",
+                    page_params.get("podId"),
+                    yielded,
+                )
             payload = self._request("GET", path, params=page_params)
             items = payload.get("items", [])
             items_count = len(items)
 
-            # Debug: Check if API is respecting ipp parameter
+            # Check if API is respecting ipp parameter
             requested_ipp = page_params.get("ipp")
-            if items_count > requested_ipp:
-                print(
-                    f"[API WARNING] Requested ipp={requested_ipp} but got {items_count} items! "
-                    f"API may not be respecting pagination parameter."
+            if requested_ipp and items_count > requested_ipp:
+                logger.warning(
+                    "[API WARNING] Requested ipp=%s but got %s items! "
+                    "API may not be respecting pagination parameter.",
+                    requested_ipp,
+                    items_count,
                 )
 
-            # Debug: Check date ranges in response (for sessions endpoint)
-            if path == "/sessions" and items:
-                from datetime import datetime, timezone
-
-                start_times = []
-                for item in items:
-                    item_start = item.get("startTime")
-                    if item_start:
-                        try:
-                            if isinstance(item_start, str):
-                                if item_start.endswith("Z"):
-                                    item_start_dt = datetime.fromisoformat(
-                                        item_start.replace("Z", "+00:00")
-                                    )
-                                else:
-                                    item_start_dt = datetime.fromisoformat(item_start)
-                            else:
-                                item_start_dt = item_start
-                            start_times.append(item_start_dt)
-                        except Exception:
-                            pass
-
-                if start_times:
-                    earliest = min(start_times)
-                    latest = max(start_times)
-                    print(
-                        f"[API DATE RANGE] Page {page} | earliest startTime: {earliest.isoformat()} | "
-                        f"latest startTime: {latest.isoformat()} | requested endTime: {page_params.get('endTime')}"
-                    )
-
-                    # Check if latest exceeds our endTime
-                    end_time_str = page_params.get("endTime")
-                    if end_time_str:
-                        try:
-                            if isinstance(end_time_str, str):
-                                if end_time_str.endswith("Z"):
-                                    end_time_dt = datetime.fromisoformat(
-                                        end_time_str.replace("Z", "+00:00")
-                                    )
-                                else:
-                                    end_time_dt = datetime.fromisoformat(end_time_str)
-                            else:
-                                end_time_dt = end_time_str
-
-                            if latest > end_time_dt:
-                                print(
-                                    f"[API DATE WARNING] Latest startTime {latest.isoformat()} EXCEEDS "
-                                    f"requested endTime {end_time_str}! API may not be filtering by dates."
-                                )
-                        except Exception:
-                            pass
-
-            print(
-                f"[API RESPONSE] GET {path} | page={page} | "
-                f"records_returned={items_count} | total_yielded={yielded + items_count} | "
-                f"requested_ipp={requested_ipp}"
-            )
+            # Date range of the page (sessions endpoint); parsing every item's
+            # startTime is only worth it when someone is reading debug output
+            if path == "/sessions" and items and logger.isEnabledFor(log.DEBUG):
+                self._log_sessions_date_range(items, page, page_params.get("endTime"))
+
+            if log.sampled(logger, f"podplay_page:{path}"):
+                logger.info(
+                    "[API RESPONSE] GET %s | page=%s | records_returned=%s | "
+                    "total_yielded=%s | requested_ipp=%s",
+                    path,
+                    page,
+                    items_count,
+                    yielded + items_count,
+                    requested_ipp,
+                )
 
             # Small delay between API calls to avoid rate limiting (0.1s = ~10 req/sec max)
             if page > 1:  # Don't delay before first call
                 time.sleep(0.1)
 
             if not items:
-                print(f"[API PAGINATION] No more items returned, stopping pagination")
+                logger.debug("[API PAGINATION] No more items returned, stopping pagination")
                 break
 
             # For sessions endpoint, check if items exceed date range before yielding
@@ -179,8 +132,9 @@ class PodplayClient:
                         else:
                             end_time_dt = end_time_str
                 except Exception as e:
-                    print(
-                        f"[API PAGINATION] Warning: Could not parse endTime for date filtering: {e}"
+                    logger.warning(
+                        "[API PAGINATION] Warning: Could not parse endTime for date filtering: %s",
+                        e,
                     )
 
             for item in items:
@@ -200,9 +154,11 @@ class PodplayClient:
                                 item_start_dt = item_start
 
                             if item_start_dt > end_time_dt:
-                                print(
-                                    f"[API PAGINATION] Found item with startTime {item_start} "
-                                    f"exceeding endTime {base_params.get('endTime')}, stopping pagination"
+                                logger.info(
+                                    "[API PAGINATION] Found item with startTime %s "
+                                    "exceeding endTime %s, stopping pagination",
+                                    item_start,
+                                    base_params.get("endTime"),
                                 )
                                 return
                         except Exception:
@@ -211,9 +167,9 @@ class PodplayClient:
                 yield item
                 yielded += 1
                 if max_results and yielded >= max_results:
-                    print(
-                        f"[API PAGINATION] Reached max_results={max_results}, "
-                        f"stopping pagination"
+                    logger.info(
+                        "[API PAGINATION] Reached max_results=%s, stopping pagination",
+                        max_results,
                     )
                     return
 
@@ -227,27 +183,74 @@ class PodplayClient:
                 or pagination.get("pages")
             )
 
-            print(
-                f"[API PAGINATION] page={page} | total={total} | count={count} | "
-                f"ipp={ipp} | total_pages={total_pages}"
+            logger.debug(
+                "[API PAGINATION] page=%s | total=%s | count=%s | ipp=%s | total_pages=%s",
+                page,
+                total,
+                count,
+                ipp,
+                total_pages,
             )
 
             if total_pages and page >= total_pages:
-                print(f"[API PAGINATION] Reached last page ({total_pages}), stopping")
+                logger.debug("[API PAGINATION] Reached last page (%s), stopping", total_pages)
                 break
             if total and ipp and page * ipp >= total:
-                print(f"[API PAGINATION] Reached total records ({total}), stopping")
+                logger.debug("[API PAGINATION] Reached total records (%s), stopping", total)
                 break
             if count is not None and ipp and count < ipp:
-                print(
-                    f"[API PAGINATION] Last page detected (count={count} < ipp={ipp}), "
-                    f"stopping"
+                logger.debug(
+                    "[API PAGINATION] Last page detected (count=%s < ipp=%s), stopping",
+                    count,
+                    ipp,
                 )
                 break
 
             page += 1
 
-        print(f"[API SUMMARY] Total records yielded from {path}: {yielded}")
+        logger.info("[API SUMMARY] Total records yielded from %s: %s", path, yielded)
+
+    @staticmethod
+    def _parse_time(value) -> datetime:
+        if isinstance(value, str):
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return value
+
+    def _log_sessions_date_range(
+        self, items: List[Dict], page: int, end_time: Optional[str]
+    ) -> None:
+        """Debug check that /sessions honours endTime (it has not always)."""
+        start_times = []
+        for item in items:
+            if item.get("startTime"):
+                try:
+                    start_times.append(self._parse_time(item["startTime"]))
+                except (TypeError, ValueError):
+                    pass
+        if not start_times:
+            return
+
+        earliest = min(start_times)
+        latest = max(start_times)
+        logger.debug(
+            "[API DATE RANGE] Page %s | earliest startTime: %s | "
+            "latest startTime: %s | requested endTime: %s",
+            page,
+            earliest.isoformat(),
+            latest.isoformat(),
+            end_time,
+        )
+        if end_time:
+            try:
+                if latest > self._parse_time(end_time):
+                    logger.debug(
+                        "[API DATE WARNING] Latest startTime %s EXCEEDS requested "
+                        "endTime %s! API may not be filtering by dates.",
+                        latest.isoformat(),
+                        end_time,
+                    )
+            except (TypeError, ValueError):
+                pass
 
     def get_reservations(
         self,
@@ -1,36 +1,148 @@
 import psycopg2
 from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from contextlib import contextmanager
 from datetime import date, datetime, timezone
 from typing import Optional, Tuple
 from constants import Tables, EltWatermarks
+from ingestion import metrics
 import json
 import logging
 import os
-from .postgres_mixins import DedupeMixin, InsertMixin
+import threading
+from . import bulk_load
+from .postgres_mixins import DedupeMixin, InsertMixin, PartitionMixin
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 logs_dir = os.path.join(BASE_DIR, "logs")
-os.makedirs(logs_dir, exist_ok=True)
-
 log_path = os.path.join(logs_dir, "dedupe.log")
 
-logging.basicConfig(
-    filename=log_path,
-    filemode="a",
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    level=logging.INFO,
-)
 logger = logging.getLogger(__name__)
 
+_logging_configured = False
+
+
+def _configure_logging() -> None:
+    """Send logs to logs/dedupe.log; done on first client, not on import."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    os.makedirs(logs_dir, exist_ok=True)
+    logging.basicConfig(
+        filename=log_path,
+        filemode="a",
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        level=logging.INFO,
+    )
+    _logging_configured = True
+
 
-class PostgresClient(DedupeMixin, InsertMixin):
-    def __init__(self, dsn, schema):
+class PostgresClient(DedupeMixin, InsertMixin, PartitionMixin):
+    def __init__(
+        self,
+        dsn,
+        schema,
+        pool_size: Optional[int] = None,
+        load_strategy: Optional[str] = None,
+        load_page_size: Optional[int] = None,
+    ):
+        _configure_logging()
         self.dsn = dsn
         self.schema = schema
+        # When pool_size is set, connections are borrowed from a run-wide
+        # ThreadedConnectionPool (created on first use) instead of a new
+        # handshake per query. getconn raises PoolError when the pool is
+        # empty, so borrowers wait on _pool_slots for a free connection; a
+        # thread must not borrow a second connection while holding one
+        self.pool_size = pool_size
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pool_slots: Optional[threading.BoundedSemaphore] = None
+        self._pool_pid: Optional[int] = None
+        self._pool_lock = threading.Lock()
+        # How batch inserts load rows (see ingestion.clients.bulk_load);
+        # defaults come from PG_LOAD_STRATEGY / PG_LOAD_PAGE_SIZE
+        self.load_strategy = load_strategy or bulk_load.get_load_strategy()
+        self.load_page_size = load_page_size or bulk_load.get_load_page_size()
 
     def _connect(self):
-        dsn = self.dsn
-        return psycopg2.connect(dsn)
+        if not self.pool_size:
+            dsn = self.dsn
+            return psycopg2.connect(dsn)
+        return self._pooled_connection()
+
+    def _get_pool(self) -> ThreadedConnectionPool:
+        with self._pool_lock:
+            # Connections must not be shared across a fork (process executor)
+            if self._pool is None or self._pool.closed or self._pool_pid != os.getpid():
+                self._pool = ThreadedConnectionPool(1, self.pool_size, self.dsn)
+                self._pool_slots = threading.BoundedSemaphore(self.pool_size)
+                self._pool_pid = os.getpid()
+            return self._pool
+
+    @contextmanager
+    def _pooled_connection(self):
+        """
+        Borrow a pooled connection, waiting for one if all are in use;
+        commits on success, rolls back on error.
+        """
+        pool = self._get_pool()
+        slots = self._pool_slots
+        slots.acquire()
+        try:
+            conn = pool.getconn()
+            broken = False
+            try:
+                with conn:
+                    yield conn
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                broken = True
+                raise
+            finally:
+                pool.putconn(conn, close=broken or conn.closed != 0)
+        finally:
+            slots.release()
+
+    @contextmanager
+    def stg_lock(self, table_name: str):
+        """
+        Serialize loads that share a staging table.
+
+        Holds a session-level advisory lock on a dedicated connection, so it
+        also covers worker processes and overlapping runs. Closing the session
+        releases the lock.
+        """
+        conn = psycopg2.connect(self.dsn)
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT pg_advisory_lock(hashtext(%s))",
+                    (f"{self.schema}.{table_name}",),
+                )
+            yield
+        finally:
+            conn.close()
+
+    def bulk_insert(
+        self, cur, table_name: str, columns, rows: list, conflict: str = ""
+    ) -> int:
+        """Load rows into a table of this schema with the client's load strategy."""
+        return bulk_load.bulk_insert(
+            cur,
+            f'"{self.schema}"."{table_name}"',
+            columns,
+            rows,
+            conflict=conflict,
+            strategy=self.load_strategy,
+            page_size=self.load_page_size,
+        )
+
+    def close(self) -> None:
+        """Close every pooled connection (no-op without a pool)."""
+        with self._pool_lock:
+            if self._pool is not None and not self._pool.closed:
+                self._pool.closeall()
+            self._pool = None
 
     def get_current_member_count(self):
         with self._connect() as conn, conn.cursor() as cur:
@@ -42,6 +154,46 @@ class PostgresClient(DedupeMixin, InsertMixin):
         else:
             return None
 
+    def get_organizations(self) -> list[dict]:
+        with self._connect() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT client_code, source_system_code, is_customer, podplay_pod_id,
+                       operating_hours, peak_hours, google_place_id
+                  FROM "{self.schema}".organizations
+                 ORDER BY client_code
+                """
+            )
+            cols = [desc[0] for desc in cur.description]
+            return [dict(zip(cols, row)) for row in cur.fetchall()]
+
+    def get_courts(self) -> list[dict]:
+        with self._connect() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT id, client_code, label, type_name, order_index
+                  FROM "{self.schema}".courts
+                 ORDER BY client_code, order_index
+                """
+            )
+            cols = [desc[0] for desc in cur.description]
+            return [dict(zip(cols, row)) for row in cur.fetchall()]
+
+    def get_event_categories(
+        self, client_code: str, source_system: str = "courtreserve"
+    ) -> dict[str, str]:
+        """Return category_id -> event_category_name for a facility."""
+        with self._connect() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT id, event_category_name
+                  FROM "{self.schema}".facility_event_categories
+                 WHERE client_code = %s AND source_system = %s
+                """,
+                (client_code.lower(), source_system.lower()),
+            )
+            return {str(row[0]): row[1] for row in cur.fetchall()}
+
     def get_elt_watermark(
         self, source_name: str
     ) -> Optional[Tuple[Optional[datetime], Optional[datetime]]]:
@@ -62,6 +214,10 @@ class PostgresClient(DedupeMixin, InsertMixin):
     def update_elt_watermark(
         self, source_name: str, last_record_created_at: Optional[datetime] = None
     ) -> None:
+        """
+        Record a finished load. last_record_created_at is the newest source
+        timestamp seen (the high-water mark); it never moves backwards.
+        """
         now_ts = datetime.now(timezone.utc)
 
         if last_record_created_at:
@@ -73,7 +229,10 @@ class PostgresClient(DedupeMixin, InsertMixin):
                 ) VALUES (%s, %s, %s)
                 ON CONFLICT (source_name) DO UPDATE
                 SET last_loaded_at = EXCLUDED.last_loaded_at,
-                    last_record_created_at = EXCLUDED.last_record_created_at
+                    last_record_created_at = GREATEST(
+                        "{Tables.ELT_WATERMARKS}".last_record_created_at,
+                        EXCLUDED.last_record_created_at
+                    )
             """
             params = (source_name, now_ts, last_record_created_at)
         else:
@@ -90,6 +249,91 @@ class PostgresClient(DedupeMixin, InsertMixin):
         with self._connect() as conn, conn.cursor() as cur:
             cur.execute(query, params)
 
+    def get_resume_point(self, pipeline: str, client_code: str) -> Optional[datetime]:
+        """End of the last committed window of an unfinished run, if any."""
+        with self._connect() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT max(window_end)
+                  FROM "{self.schema}"."{Tables.ELT_CHECKPOINTS}"
+                 WHERE pipeline = %s AND client_code = %s AND status = 'committed'
+                """,
+                (pipeline, client_code.lower()),
+            )
+            row = cur.fetchone()
+        return row[0] if row else None
+
+    def save_checkpoint(
+        self,
+        pipeline: str,
+        client_code: str,
+        window_start: datetime,
+        window_end: datetime,
+        status: str,
+        page: Optional[int] = None,
+    ) -> None:
+        with self._connect() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                INSERT INTO "{self.schema}"."{Tables.ELT_CHECKPOINTS}" (
+                    pipeline, client_code, window_start, window_end, page, status, updated_at
+                ) VALUES (%s, %s, %s, %s, %s, %s, now())
+                ON CONFLICT (pipeline, client_code, window_start) DO UPDATE
+                SET window_end = EXCLUDED.window_end,
+                    page = EXCLUDED.page,
+                    status = EXCLUDED.status,
+                    updated_at = EXCLUDED.updated_at
+                """,
+                (pipeline, client_code.lower(), window_start, window_end, page, status),
+            )
+
+    def clear_checkpoints(self, pipeline: str, client_code: str) -> None:
+        """Drop a client's checkpoints once its watermark has advanced."""
+        with self._connect() as conn, conn.cursor() as cur:
+            cur.execute(
+                f"""
+                DELETE FROM "{self.schema}"."{Tables.ELT_CHECKPOINTS}"
+                 WHERE pipeline = %s AND client_code = %s
+                """,
+                (pipeline, client_code.lower()),
+            )
+
+    def insert_run_metrics(self, run_id: str, run_label: str, records) -> None:
+        """Persist the per-stage StageMetrics collected during one run."""
+        if not records:
+            return
+        rows = [
+            (
+                run_id,
+                run_label,
+                record.pipeline,
+                record.client_code,
+                record.stage,
+                record.started_at,
+                round(record.duration_seconds, 4),
+                record.rows,
+                record.bytes,
+                record.api_calls,
+                record.calls,
+                record.inserted,
+                record.updated,
+                record.unchanged,
+            )
+            for record in records
+        ]
+        with self._connect() as conn, conn.cursor() as cur:
+            execute_values(
+                cur,
+                f"""
+                INSERT INTO "{self.schema}"."{Tables.INGESTION_RUN_METRICS}" (
+                    run_id, run_label, pipeline, client_code, stage, started_at,
+                    duration_seconds, rows, bytes, api_calls, calls,
+                    inserted, updated, unchanged
+                ) VALUES %s
+                """,
+                rows,
+            )
+
     def truncate_table(self, table_name):
         """Truncate a table in the given schema."""
         with self._connect() as conn, conn.cursor() as cur:
@@ -173,7 +417,8 @@ class PostgresClient(DedupeMixin, InsertMixin):
         
         # Step 2: Insert into STG
         print(f"[REPLACE MEMBERS] Step 2: Inserting {len(members)} members into STG")
-        self.insert_members(members, Tables.MEMBERS_RAW_STG)
+        with metrics.stage(metrics.STAGE_LOAD, rows=len(members)):
+            self.insert_members(members, Tables.MEMBERS_RAW_STG)
         
         # Step 3: Check STG count before moving to PROD
         with self._connect() as conn, conn.cursor() as cur:
@@ -192,9 +437,10 @@ class PostgresClient(DedupeMixin, InsertMixin):
             prod_count_before = cur.fetchone()[0]
             print(f"[REPLACE MEMBERS] PROD table currently has {prod_count_before} records for {client_code}")
         
-        # Step 4: Move from STG to PROD (with deduplication via ON CONFLICT)
+        # Step 4: Move from STG to PROD (with deduplication via ON CONFLICT);
+        # members whose row_hash is unchanged are skipped
         print(f"[REPLACE MEMBERS] Step 3: Moving records from STG to PROD (deduplication via ON CONFLICT)")
-        with self._connect() as conn, conn.cursor() as cur:
+        with metrics.stage(metrics.PROMOTE) as stage, self._connect() as conn, conn.cursor() as cur:
             cur.execute(
                 f"""
                 INSERT INTO "{self.schema}"."{Tables.MEMBERS_RAW}" (
@@ -209,6 +455,7 @@ class PostgresClient(DedupeMixin, InsertMixin):
                     membership_type_name,
                     is_premium_member,
                     member_since,
+                    row_hash,
                     created_at
                 )
                 SELECT
@@ -223,6 +470,7 @@ class PostgresClient(DedupeMixin, InsertMixin):
                     membership_type_name,
                     is_premium_member,
                     member_since,
+                    row_hash,
                     created_at
                 FROM "{self.schema}"."{Tables.MEMBERS_RAW_STG}"
                 WHERE client_code = %s
@@ -236,11 +484,14 @@ class PostgresClient(DedupeMixin, InsertMixin):
                     membership_type_name = EXCLUDED.membership_type_name,
                     is_premium_member = EXCLUDED.is_premium_member,
                     member_since = EXCLUDED.member_since,
+                    row_hash = EXCLUDED.row_hash,
                     created_at = EXCLUDED.created_at
+                WHERE {Tables.MEMBERS_RAW}.row_hash IS DISTINCT FROM EXCLUDED.row_hash
                 """,
                 (client_code,),
             )
             rows_affected = cur.rowcount
+            stage.rows = rows_affected
             print(f"[REPLACE MEMBERS] PROD insert/update complete: {rows_affected} rows affected")
             
             # Check PROD count after insert
@@ -254,18 +505,15 @@ class PostgresClient(DedupeMixin, InsertMixin):
                 f"(was {prod_count_before}, change: {prod_count_after - prod_count_before})"
             )
             
-            # Calculate new vs updated
-            # Since we can't easily distinguish inserts from updates with ON CONFLICT,
-            # we'll estimate: if prod_count increased, those are new; otherwise mostly updates
-            if prod_count_after > prod_count_before:
-                estimated_new = prod_count_after - prod_count_before
-                estimated_updates = rows_affected - estimated_new
-                print(
-                    f"[REPLACE MEMBERS] Estimated: ~{estimated_new} new records, "
-                    f"~{estimated_updates} updated records"
-                )
-            else:
-                print(f"[REPLACE MEMBERS] All {rows_affected} records were updates (no new records)")
+            # Every STG row either inserts a member, updates a changed one or
+            # is skipped by the row_hash predicate (rowcount excludes those)
+            stage.inserted = prod_count_after - prod_count_before
+            stage.updated = rows_affected - stage.inserted
+            stage.unchanged = stg_count_after_insert - rows_affected
+            print(
+                f"[REPLACE MEMBERS] {stage.inserted} inserted, {stage.updated} updated, "
+                f"{stage.unchanged} unchanged"
+            )
 
         # Step 5: Clean up STG
         print(f"[REPLACE MEMBERS] Step 4: Cleaning up STG table")
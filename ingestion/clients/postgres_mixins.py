@@ -1,7 +1,302 @@
 from datetime import date, datetime, timezone
 from constants import Tables, EltWatermarks
+import psycopg2
 from psycopg2.extras import execute_values
 import json
+import re
+
+from ingestion import log, metrics
+from ingestion.utils.row_hash import event_row_hash, member_row_hash
+from ingestion.clients.prod_key_index import (
+    RESERVATION_CANCELLATION_KEY,
+    RESERVATION_KEY,
+    ProdKeyIndex,
+)
+
+logger = log.get_logger("postgres")
+
+# Column order of the row tuples each insert builds
+MEMBER_COLUMNS = (
+    "client_code",
+    "member_id",
+    "first_name",
+    "last_name",
+    "gender",
+    "phone_number",
+    "date_of_birth",
+    "email",
+    "membership_type_name",
+    "is_premium_member",
+    "member_since",
+    "row_hash",
+    "created_at",
+)
+RESERVATION_COLUMNS = (
+    "client_code",
+    "event_id",
+    "reservation_id",
+    "reservation_created_at",
+    "reservation_updated_at",
+    "reservation_start_at",
+    "reservation_end_at",
+    "reservation_cancelled_at",
+    "member_id",
+    "created_at",
+)
+RESERVATION_CANCELLATION_COLUMNS = (
+    "client_code",
+    "source_system",
+    "event_id",
+    "reservation_id",
+    "reservation_type",
+    "reservation_created_at",
+    "reservation_start_at",
+    "reservation_end_at",
+    "cancelled_on",
+    "day_of_week",
+    "is_program",
+    "program_name",
+    "player_name",
+    "player_first_name",
+    "player_last_name",
+    "player_email",
+    "player_phone",
+    "fee",
+    "is_team_event",
+    "event_category_name",
+    "event_category_id",
+    "member_id",
+    "created_at",
+)
+EVENT_COLUMNS = (
+    "client_code",
+    "source_system",
+    "event_id",
+    "event_name",
+    "event_description",
+    "event_type",
+    "event_start_time",
+    "event_end_time",
+    "num_registrants",
+    "max_registrants",
+    "admission_rate_regular",
+    "admission_rate_member",
+    "skill_level",
+    "row_hash",
+    "created_at",
+)
+COURT_AVAILABILITY_COLUMNS = (
+    "client_code",
+    "source_system",
+    "court_id",
+    "court_name",
+    "slot_start",
+    "slot_end",
+    "period_type",
+    "created_at",
+)
+
+# Format with table= (unqualified target table name); rows whose row_hash
+# didn't change are left alone
+MEMBER_UPSERT = """
+    ON CONFLICT (client_code, member_id) DO UPDATE SET
+        first_name = EXCLUDED.first_name,
+        last_name = EXCLUDED.last_name,
+        gender = EXCLUDED.gender,
+        phone_number = EXCLUDED.phone_number,
+        date_of_birth = EXCLUDED.date_of_birth,
+        email = EXCLUDED.email,
+        membership_type_name = EXCLUDED.membership_type_name,
+        is_premium_member = EXCLUDED.is_premium_member,
+        member_since = EXCLUDED.member_since,
+        row_hash = EXCLUDED.row_hash,
+        created_at = EXCLUDED.created_at
+    WHERE "{table}".row_hash IS DISTINCT FROM EXCLUDED.row_hash
+"""
+RESERVATION_UPSERT = """
+    ON CONFLICT (client_code, reservation_id, member_id) DO UPDATE SET
+        event_id = EXCLUDED.event_id,
+        reservation_created_at = EXCLUDED.reservation_created_at,
+        reservation_updated_at = EXCLUDED.reservation_updated_at,
+        reservation_start_at = EXCLUDED.reservation_start_at,
+        reservation_end_at = EXCLUDED.reservation_end_at,
+        reservation_cancelled_at = EXCLUDED.reservation_cancelled_at,
+        created_at = EXCLUDED.created_at
+"""
+# reservations_raw is partitioned on reservation_start_at, so its unique key
+# has to include it (see the partition_reservation_tables migration)
+RESERVATION_PROD_UPSERT = """
+    ON CONFLICT (client_code, reservation_id, member_id, reservation_start_at) DO UPDATE SET
+        event_id = EXCLUDED.event_id,
+        reservation_created_at = EXCLUDED.reservation_created_at,
+        reservation_updated_at = EXCLUDED.reservation_updated_at,
+        reservation_end_at = EXCLUDED.reservation_end_at,
+        reservation_cancelled_at = EXCLUDED.reservation_cancelled_at,
+        created_at = EXCLUDED.created_at
+"""
+
+
+def month_start(value: datetime) -> date:
+    """First day of the (UTC) month a timestamp falls in."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return date(value.year, value.month, 1)
+
+
+def monthly_partition_name(table_name: str, month: date) -> str:
+    return f"{table_name}_p{month:%Y_%m}"
+
+
+def client_partition_name(table_name: str, client_code: str) -> str:
+    return f"{table_name}_{re.sub(r'[^a-z0-9_]', '_', client_code.lower())}"
+
+
+def _range_filter(cur, stg_table_sql: str, column: str, prod_alias: str):
+    """
+    SQL predicate (and params) bounding prod.<column> to the range present in
+    staging, so anti-joins against a range-partitioned table only scan the
+    partitions staging can match. Range partitions keep NULLs in the default
+    partition, which is included when staging has NULLs.
+    """
+    cur.execute(
+        f"""
+        SELECT min({column}), max({column}), bool_or({column} IS NULL)
+          FROM {stg_table_sql}
+        """
+    )
+    low, high, has_null = cur.fetchone()
+    clauses = []
+    params: tuple = ()
+    if low is not None:
+        clauses.append(f"{prod_alias}.{column} BETWEEN %s AND %s")
+        params = (low, high)
+    if has_null:
+        clauses.append(f"{prod_alias}.{column} IS NULL")
+    if not clauses:
+        return "FALSE", params
+    return "(" + " OR ".join(clauses) + ")", params
+
+
+class PartitionMixin:
+    """
+    Partition upkeep for the tables the partition_* migrations converted:
+    reservations_raw / reservation_cancellations_raw by month (RANGE) and
+    facility_court_availabilities by client (LIST). Partitions are created
+    before rows for them are loaded; rows without one land in the table's
+    default partition.
+    """
+
+    def get_partitions(self, table_name: str, cur=None) -> set[str]:
+        """
+        Names of a table's partitions. Pass the caller's cursor when it already
+        holds a (pooled) connection rather than borrowing a second one.
+        """
+        if cur is None:
+            with self._connect() as conn, conn.cursor() as cur:
+                return self.get_partitions(table_name, cur)
+        cur.execute(
+            """
+            SELECT child.relname
+              FROM pg_inherits i
+              JOIN pg_class child ON child.oid = i.inhrelid
+              JOIN pg_class parent ON parent.oid = i.inhparent
+              JOIN pg_namespace n ON n.oid = parent.relnamespace
+             WHERE n.nspname = %s AND parent.relname = %s
+            """,
+            (self.schema, table_name),
+        )
+        return {row[0] for row in cur.fetchall()}
+
+    def _create_partition(self, table_name: str, partition: str, bounds: str, params) -> None:
+        try:
+            with self._connect() as conn, conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS "{self.schema}"."{partition}"
+                    PARTITION OF "{self.schema}"."{table_name}" {bounds}
+                    """,
+                    params,
+                )
+            print(f"[PARTITIONS] Created {self.schema}.{partition}")
+        except psycopg2.Error as e:
+            # Typically the default partition already holds rows for these
+            # bounds; they keep loading there until it is split by hand
+            print(f"[PARTITIONS] Could not create {self.schema}.{partition}: {e}")
+
+    def ensure_monthly_partitions(self, table_name: str, timestamps) -> None:
+        """Create the missing monthly partitions covering these timestamps."""
+        months = {month_start(ts) for ts in timestamps if isinstance(ts, datetime)}
+        if not months:
+            return
+        existing = self.get_partitions(table_name)
+        # Months before the first monthly partition live in the default
+        # partition (the migration clamps how far back it goes); creating one
+        # would fail once the default holds rows for it
+        monthly = [
+            name for name in existing
+            if re.fullmatch(rf"{re.escape(table_name)}_p\d{{4}}_\d{{2}}", name)
+        ]
+        first = min(monthly, default=None)
+        for month in sorted(months):
+            partition = monthly_partition_name(table_name, month)
+            if partition in existing or (first and partition < first):
+                continue
+            next_month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+            self._create_partition(
+                table_name,
+                partition,
+                "FOR VALUES FROM (%s) TO (%s)",
+                (f"{month} 00:00:00+00", f"{next_month} 00:00:00+00"),
+            )
+
+    def ensure_client_partition(self, table_name: str, client_code: str) -> str:
+        """Create a client's list partition if missing; returns its name."""
+        client_code = client_code.lower()
+        partition = client_partition_name(table_name, client_code)
+        if partition not in self.get_partitions(table_name):
+            self._create_partition(
+                table_name, partition, "FOR VALUES IN (%s)", (client_code,)
+            )
+        return partition
+
+    def clear_client_partition(
+        self, cur, table_name: str, client_code: str, source_system: str
+    ) -> int:
+        """
+        Remove a client's rows for one source system inside the caller's
+        transaction: TRUNCATE the client's partition when that is all it
+        holds, otherwise DELETE. Returns the number of rows removed.
+        """
+        partition = client_partition_name(table_name, client_code)
+        if partition not in self.get_partitions(table_name, cur):
+            cur.execute(
+                f"""
+                DELETE FROM "{self.schema}"."{table_name}"
+                WHERE client_code = %s AND source_system = %s
+                """,
+                (client_code, source_system),
+            )
+            return cur.rowcount
+
+        cur.execute(
+            f"""
+            SELECT count(*), count(*) FILTER (WHERE source_system <> %s)
+              FROM "{self.schema}"."{partition}"
+            """,
+            (source_system,),
+        )
+        total, other_sources = cur.fetchone()
+        if other_sources:
+            cur.execute(
+                f"""
+                DELETE FROM "{self.schema}"."{partition}"
+                WHERE source_system = %s
+                """,
+                (source_system,),
+            )
+            return cur.rowcount
+        cur.execute(f'TRUNCATE TABLE "{self.schema}"."{partition}"')
+        return total
 
 
 class DedupeMixin:
@@ -41,12 +336,20 @@ class DedupeMixin:
             duplicates_removed = cur.rowcount
             print(f"[DEDUPE] Removed {duplicates_removed} duplicate records within STG")
 
-            # 2. Remove anything in staging that also exists in prod
+            # 2. Remove anything in staging that also exists in prod, looking
+            # only at the prod partitions staging's start times fall in
+            in_range, params = _range_filter(
+                cur,
+                f'"{self.schema}"."{stg_table}"',
+                "reservation_start_at",
+                "prod",
+            )
             cur.execute(
                 f"""
                 DELETE FROM "{self.schema}"."{stg_table}" stg
                 USING "{self.schema}"."{prod_table}" prod
-                WHERE (
+                WHERE {in_range}
+                  AND (
                     stg.event_id,
                     stg.reservation_start_at,
                     stg.reservation_created_at,
@@ -57,7 +360,8 @@ class DedupeMixin:
                     prod.reservation_created_at,
                     prod.member_id
                 )
-                """
+                """,
+                params,
             )
             existing_removed = cur.rowcount
             print(
@@ -100,12 +404,17 @@ class DedupeMixin:
                 """
             )
 
-            # 2. Remove anything in staging that also exists in prod
+            # 2. Remove anything in staging that also exists in prod, looking
+            # only at the prod partitions staging's cancellations fall in
+            in_range, params = _range_filter(
+                cur, f'"{self.schema}"."{stg_table}"', "cancelled_on", "prod"
+            )
             cur.execute(
                 f"""
                 DELETE FROM "{self.schema}"."{stg_table}" stg
                 USING "{self.schema}"."{prod_table}" prod
-                WHERE (
+                WHERE {in_range}
+                  AND (
                     stg.client_code,
                     stg.event_id,
                     stg.reservation_start_at,
@@ -118,8 +427,53 @@ class DedupeMixin:
                     prod.cancelled_on,
                     prod.member_id
                 )
-                """
+                """,
+                params,
+            )
+
+    def load_prod_key_index(
+        self, prod_table: str, client_code: str, since: datetime
+    ) -> ProdKeyIndex:
+        """
+        Dedupe keys of a client's PROD reservations / cancellations in the
+        watermark window, for dropping known rows before they are staged.
+        Reservations are windowed on start time (Podplay pulls) or last
+        update (CourtReserve pulls), cancellations on cancelled_on.
+        """
+        if prod_table == Tables.RESERVATIONS_RAW:
+            columns = RESERVATION_KEY
+            window = (
+                "(reservation_start_at >= %s "
+                "OR COALESCE(reservation_updated_at, reservation_created_at) >= %s)"
             )
+            params = (client_code, since, since)
+        elif prod_table == Tables.RESERVATION_CANCELLATIONS_RAW:
+            columns = RESERVATION_CANCELLATION_KEY
+            window = "cancelled_on >= %s"
+            params = (client_code, since)
+        else:
+            raise ValueError(f"No dedupe key for {prod_table}")
+
+        index = ProdKeyIndex(columns)
+        with self._connect() as conn:
+            # Server-side cursor: stream the keys instead of fetching them all
+            with conn.cursor(name="prod_key_index") as cur:
+                cur.itersize = 10000
+                cur.execute(
+                    f"""
+                    SELECT {", ".join(columns)}
+                    FROM "{self.schema}"."{prod_table}"
+                    WHERE client_code = %s AND {window}
+                    """,
+                    params,
+                )
+                for row in cur:
+                    index.add(row)
+        print(
+            f"[PROD KEY INDEX] Loaded {len(index)} {prod_table} keys for "
+            f"{client_code} since {since}"
+        )
+        return index
 
     def remove_records_from_before_timestamp(
         self,
@@ -162,8 +516,11 @@ class DedupeMixin:
             duplicates = cur.fetchall()
 
             for event_id, program_date_time, count in duplicates:
-                print(
-                    f"{count} records for event {event_id} with timestamp {program_date_time}, cleaning up"
+                logger.debug(
+                    "%s records for event %s with timestamp %s, cleaning up",
+                    count,
+                    event_id,
+                    program_date_time,
                 )
 
             # Delete all but one matching row in the staging table
@@ -208,6 +565,7 @@ class DedupeMixin:
         source_name: str,
         stg_table: str,
         prod_table: str,
+        update_watermark: bool = True,
     ):
         print(f"[CLEAN STG → PROD] Starting for {source_name}")
         print(f"[CLEAN STG → PROD] STG table: {stg_table}, PROD table: {prod_table}")
@@ -217,10 +575,12 @@ class DedupeMixin:
         if base_source_name == EltWatermarks.RESERVATIONS:
             timestamp_col_name = "reservation_updated_at"
             print(f"[CLEAN STG → PROD] Running deduplication for reservations...")
-            self.dedupe_reservation_records(stg_table, prod_table)
+            with metrics.stage(metrics.DEDUPE):
+                self.dedupe_reservation_records(stg_table, prod_table)
         elif base_source_name == EltWatermarks.RESERVATION_CANCELLATIONS:
             print(f"[CLEAN STG → PROD] Running deduplication for cancellations...")
-            self.dedupe_reservation_cancellation_records(stg_table, prod_table)
+            with metrics.stage(metrics.DEDUPE):
+                self.dedupe_reservation_cancellation_records(stg_table, prod_table)
             timestamp_col_name = "cancelled_on"
         # -------------------------------------------------------------------
 
@@ -252,7 +612,8 @@ class DedupeMixin:
         # insert into production
         if records:
             print(f"[CLEAN STG → PROD] Inserting {len(records)} records into PROD...")
-            self.insert_records_into_prod_db(prod_table, records)
+            with metrics.stage(metrics.PROMOTE, rows=len(records)):
+                self.insert_records_into_prod_db(prod_table, records)
 
             # Check PROD count after insert
             with self._connect() as conn, conn.cursor() as cur:
@@ -265,9 +626,11 @@ class DedupeMixin:
         else:
             print(f"[CLEAN STG → PROD] No records to insert, skipping PROD insert")
 
-        # update watermark using last_loaded_at only
-        print(f"[CLEAN STG → PROD] Updating watermark for {source_name}")
-        self.update_elt_watermark(source_name)
+        # update watermark using last_loaded_at only; windowed loads advance it
+        # themselves once every window is committed
+        if update_watermark:
+            print(f"[CLEAN STG → PROD] Updating watermark for {source_name}")
+            self.update_elt_watermark(source_name)
 
         print(f"[CLEAN STG → PROD] Truncating STG table: {stg_table}")
         self.truncate_table(stg_table)
@@ -302,56 +665,27 @@ class InsertMixin:
                 m.get("membership_type_name"),
                 m.get("is_premium_member"),
                 m.get("member_since"),
+                m.get("row_hash") or member_row_hash(m),
                 datetime.now(timezone.utc),
             )
             for m in members
         ]
 
-        BATCH_SIZE = 1000
-        total_batches = (len(rows) + BATCH_SIZE - 1) // BATCH_SIZE
         with self._connect() as conn, conn.cursor() as cur:
-            for i in range(0, len(rows), BATCH_SIZE):
-                batch = rows[i : i + BATCH_SIZE]
-                batch_num = i // BATCH_SIZE + 1
-                print(
-                    f"[INSERT MEMBERS] Inserting batch {batch_num}/{total_batches} "
-                    f"({len(batch)} records) into {table_name}"
-                )
-                execute_values(
-                    cur,
-                    f"""
-                    INSERT INTO "{self.schema}"."{table_name}" (
-                        client_code,
-                        member_id,
-                        first_name,
-                        last_name,
-                        gender,
-                        phone_number,
-                        date_of_birth,
-                        email,
-                        membership_type_name,
-                        is_premium_member,
-                        member_since,
-                        created_at
-                    ) VALUES %s
-                    ON CONFLICT (client_code, member_id) DO UPDATE SET
-                        first_name = EXCLUDED.first_name,
-                        last_name = EXCLUDED.last_name,
-                        gender = EXCLUDED.gender,
-                        phone_number = EXCLUDED.phone_number,
-                        date_of_birth = EXCLUDED.date_of_birth,
-                        email = EXCLUDED.email,
-                        membership_type_name = EXCLUDED.membership_type_name,
-                        is_premium_member = EXCLUDED.is_premium_member,
-                        member_since = EXCLUDED.member_since,
-                        created_at = EXCLUDED.created_at
-                    """,
-                    batch,
-                )
-                print(
-                    f"[INSERT MEMBERS] Batch {batch_num} complete: "
-                    f"{cur.rowcount} rows affected (inserts + updates)"
-                )
+            affected = self.bulk_insert(
+                cur,
+                table_name,
+                MEMBER_COLUMNS,
+                rows,
+                conflict=MEMBER_UPSERT.format(table=table_name),
+            )
+        if affected >= 0:
+            logger.info(
+                "[INSERT MEMBERS] %s rows inserted or changed, %s unchanged in %s",
+                affected,
+                len(rows) - affected,
+                table_name,
+            )
 
         print(
             f"[INSERT MEMBERS] Completed insert of {total_members} members into {table_name}"
@@ -395,43 +729,18 @@ class InsertMixin:
             for m in cancellations
         ]
 
-        BATCH_SIZE = 1000
+        if table_name == Tables.RESERVATION_CANCELLATIONS_RAW:
+            self.ensure_monthly_partitions(
+                table_name, [m["cancelled_on"] for m in cancellations]
+            )
         with self._connect() as conn, conn.cursor() as cur:
-            for i in range(0, len(rows), BATCH_SIZE):
-                batch = rows[i : i + BATCH_SIZE]
-                execute_values(
-                    cur,
-                    f"""
-                    INSERT INTO "{self.schema}"."{table_name}" (
-                        client_code,
-                        source_system,
-                        event_id,
-                        reservation_id,
-                        reservation_type,
-                        reservation_created_at,
-                        reservation_start_at,
-                        reservation_end_at,
-                        cancelled_on,
-                        day_of_week,
-                        is_program,
-                        program_name,
-                        player_name,
-                        player_first_name,
-                        player_last_name,
-                        player_email,
-                        player_phone,
-                        fee,
-                        is_team_event,
-                        event_category_name,
-                        event_category_id,
-                        member_id,
-                        created_at
-                    ) VALUES %s
-                    ON CONFLICT DO NOTHING
-                    """,
-                    batch,
-                )
-                print(f"Inserted batch {i // BATCH_SIZE + 1}")
+            self.bulk_insert(
+                cur,
+                table_name,
+                RESERVATION_CANCELLATION_COLUMNS,
+                rows,
+                conflict="ON CONFLICT DO NOTHING",
+            )
 
     def insert_event_summaries(self, events: list[dict], table_name: str):
         print(f"About to insert {len(events)} rows into {table_name}")
@@ -502,7 +811,7 @@ class InsertMixin:
                     """,
                     batch,
                 )
-                print(f"Inserted batch {i // BATCH_SIZE + 1}")
+                logger.debug("Inserted batch %s into %s", i // BATCH_SIZE + 1, table_name)
 
     def insert_reservations(self, reservations: list[dict], table_name: str) -> None:
         total_reservations = len(reservations)
@@ -549,78 +858,55 @@ class InsertMixin:
             for m in deduplicated_reservations
         ]
 
-        BATCH_SIZE = 1000
-        total_batches = (len(rows) + BATCH_SIZE - 1) // BATCH_SIZE
+        # Rows key on (client_code, reservation_id, member_id), which allows
+        # multiple people with the same reservation_id; conflicts take the
+        # latest data. PROD is partitioned by month of reservation_start_at
+        # and its key includes the start time.
         is_prod_table = table_name == Tables.RESERVATIONS_RAW
+        if is_prod_table:
+            self.ensure_monthly_partitions(
+                table_name,
+                [m["reservation_start_at"] for m in deduplicated_reservations],
+            )
         with self._connect() as conn, conn.cursor() as cur:
-            for i in range(0, len(rows), BATCH_SIZE):
-                batch = rows[i : i + BATCH_SIZE]
-                batch_num = i // BATCH_SIZE + 1
-                print(
-                    f"[INSERT RESERVATIONS] Inserting batch {batch_num}/{total_batches} "
-                    f"({len(batch)} records) into {table_name}"
+            if is_prod_table:
+                # A rescheduled reservation would otherwise keep its old row
+                # (in its old partition) next to the new one
+                cur.execute(
+                    f"""
+                    DELETE FROM "{self.schema}"."{table_name}" prod
+                    USING unnest(%s::text[], %s::text[], %s::text[], %s::timestamptz[])
+                        AS new (client_code, reservation_id, member_id, reservation_start_at)
+                    WHERE prod.client_code = new.client_code
+                      AND prod.reservation_id = new.reservation_id
+                      AND prod.member_id = new.member_id
+                      AND (
+                        prod.reservation_start_at IS DISTINCT FROM new.reservation_start_at
+                        OR new.reservation_start_at IS NULL
+                      )
+                    """,
+                    (
+                        [m["client_code"] for m in deduplicated_reservations],
+                        [m["reservation_id"] for m in deduplicated_reservations],
+                        [m["member_id"] for m in deduplicated_reservations],
+                        [m["reservation_start_at"] for m in deduplicated_reservations],
+                    ),
                 )
-                if is_prod_table:
-                    execute_values(
-                        cur,
-                        f"""
-                        INSERT INTO "{self.schema}"."{table_name}" (
-                            client_code,
-                            event_id,
-                            reservation_id,
-                            reservation_created_at,
-                            reservation_updated_at,
-                            reservation_start_at,
-                            reservation_end_at,
-                            reservation_cancelled_at,
-                            member_id,
-                            created_at
-                        ) VALUES %s
-                        ON CONFLICT (client_code, reservation_id, member_id) DO UPDATE SET
-                            event_id = EXCLUDED.event_id,
-                            reservation_created_at = EXCLUDED.reservation_created_at,
-                            reservation_updated_at = EXCLUDED.reservation_updated_at,
-                            reservation_start_at = EXCLUDED.reservation_start_at,
-                            reservation_end_at = EXCLUDED.reservation_end_at,
-                            reservation_cancelled_at = EXCLUDED.reservation_cancelled_at,
-                            created_at = EXCLUDED.created_at
-                        """,
-                        batch,
-                    )
-                else:
-                    # Staging table: handle conflicts on (client_code, reservation_id, member_id)
-                    # This allows multiple people with the same reservation_id
-                    # Update with latest data to ensure we have the most recent information
-                    execute_values(
-                        cur,
-                        f"""
-                        INSERT INTO "{self.schema}"."{table_name}" (
-                            client_code,
-                            event_id,
-                            reservation_id,
-                            reservation_created_at,
-                            reservation_updated_at,
-                            reservation_start_at,
-                            reservation_end_at,
-                            reservation_cancelled_at,
-                            member_id,
-                            created_at
-                        ) VALUES %s
-                        ON CONFLICT (client_code, reservation_id, member_id) DO UPDATE SET
-                            event_id = EXCLUDED.event_id,
-                            reservation_created_at = EXCLUDED.reservation_created_at,
-                            reservation_updated_at = EXCLUDED.reservation_updated_at,
-                            reservation_start_at = EXCLUDED.reservation_start_at,
-                            reservation_end_at = EXCLUDED.reservation_end_at,
-                            reservation_cancelled_at = EXCLUDED.reservation_cancelled_at,
-                            created_at = EXCLUDED.created_at
-                        """,
-                        batch,
+                if cur.rowcount:
+                    print(
+                        f"[INSERT RESERVATIONS] Removed {cur.rowcount} rows superseded "
+                        f"by a new start time"
                     )
-                print(
-                    f"[INSERT RESERVATIONS] Batch {batch_num} complete: "
-                    f"{cur.rowcount} rows affected"
-                )
+            affected = self.bulk_insert(
+                cur,
+                table_name,
+                RESERVATION_COLUMNS,
+                rows,
+                conflict=RESERVATION_PROD_UPSERT if is_prod_table else RESERVATION_UPSERT,
+            )
+        logger.info(
+            "[INSERT RESERVATIONS] %s rows affected in %s", affected, table_name
+        )
 
         print(
             f"[INSERT RESERVATIONS] Completed insert of {len(deduplicated_reservations)} reservations into {table_name}"
@@ -630,8 +916,10 @@ class InsertMixin:
         self, events: list[dict], table_name: str = "facility_events_raw"
     ) -> None:
         """
-        Replace all events for each client_code + source_system combination.
-        This ensures deleted events are removed from the database.
+        Merge the full set of events for each client_code + source_system into
+        PROD: new events are inserted, events whose row_hash changed are
+        updated, and events the API no longer returns are deleted. Unchanged
+        events (and their skill_level) are left alone.
         """
         if not events:
             print("[REPLACE EVENTS] No events to insert")
@@ -692,6 +980,8 @@ class InsertMixin:
                     m.get("max_registrants"),
                     m.get("admission_rate_regular"),
                     m.get("admission_rate_member"),
+                    m.get("skill_level"),
+                    m.get("row_hash") or event_row_hash(m),
                     datetime.now(timezone.utc),
                 )
                 for m in client_events
@@ -700,7 +990,9 @@ class InsertMixin:
             staging_table = f"{table_name}_stg"
             prod_table = table_name
 
-            with self._connect() as conn, conn.cursor() as cur:
+            # The staging table is shared by every client/source, so concurrent
+            # pipelines take turns from truncate through swap
+            with self.stg_lock(staging_table), self._connect() as conn, conn.cursor() as cur:
                 # Step 1: Create staging table if it doesn't exist
                 cur.execute(
                     f"""
@@ -714,31 +1006,10 @@ class InsertMixin:
                 cur.execute(f'TRUNCATE TABLE "{self.schema}"."{staging_table}"')
 
                 # Step 3: Insert new data into staging table
-                BATCH_SIZE = 1000
-                for i in range(0, len(rows), BATCH_SIZE):
-                    batch = rows[i : i + BATCH_SIZE]
-                    batch_num = i // BATCH_SIZE + 1
-                    execute_values(
-                        cur,
-                        f"""
-                        INSERT INTO "{self.schema}"."{staging_table}" (
-                            client_code,
-                            source_system,
-                            event_id,
-                            event_name,
-                            event_description,
-                            event_type,
-                            event_start_time,
-                            event_end_time,
-                            num_registrants,
-                            max_registrants,
-                            admission_rate_regular,
-                            admission_rate_member,
-                            created_at
-                        ) VALUES %s
-                        """,
-                        batch,
-                    )
+                with metrics.stage(
+                    metrics.STAGE_LOAD, rows=len(rows), client_code=client_code
+                ):
+                    self.bulk_insert(cur, staging_table, EVENT_COLUMNS, rows)
 
                 # Step 4: Get row counts before swap
                 cur.execute(
@@ -755,66 +1026,112 @@ class InsertMixin:
                 # Step 5: Commit staging inserts
                 conn.commit()
 
-                # Step 6: Replace data atomically in a transaction
-                cur.execute("BEGIN")
-                try:
-                    # Delete existing records for this client_code + source_system
-                    cur.execute(
-                        f"""
-                        DELETE FROM "{self.schema}"."{prod_table}"
-                        WHERE client_code = %s AND source_system = %s
-                        """,
-                        (client_code, source_system),
-                    )
-
-                    # Copy all data from staging to production
-                    cur.execute(
-                        f"""
-                        INSERT INTO "{self.schema}"."{prod_table}" (
-                            client_code,
-                            source_system,
-                            event_id,
-                            event_name,
-                            event_description,
-                            event_type,
-                            event_start_time,
-                            event_end_time,
-                            num_registrants,
-                            max_registrants,
-                            admission_rate_regular,
-                            admission_rate_member,
-                            created_at
+                # Step 6: Merge into PROD atomically in a transaction
+                with metrics.stage(
+                    metrics.PROMOTE, rows=new_count, client_code=client_code
+                ) as stage:
+                    cur.execute("BEGIN")
+                    try:
+                        # Delete events that no longer come back from the API
+                        cur.execute(
+                            f"""
+                            DELETE FROM "{self.schema}"."{prod_table}" prod
+                            WHERE prod.client_code = %s
+                              AND prod.source_system = %s
+                              AND NOT EXISTS (
+                                  SELECT 1
+                                  FROM "{self.schema}"."{staging_table}" stg
+                                  WHERE stg.event_id = prod.event_id
+                                    AND stg.event_start_time = prod.event_start_time
+                              )
+                            """,
+                            (client_code, source_system),
                         )
-                        SELECT 
-                            client_code,
-                            source_system,
-                            event_id,
-                            event_name,
-                            event_description,
-                            event_type,
-                            event_start_time,
-                            event_end_time,
-                            num_registrants,
-                            max_registrants,
-                            admission_rate_regular,
-                            admission_rate_member,
-                            created_at
-                        FROM "{self.schema}"."{staging_table}"
-                    """
-                    )
-
-                    cur.execute("COMMIT")
-
-                    print(
-                        f"[REPLACE EVENTS] ✓ Complete for {client_code}/{source_system}: "
-                        f"Replaced {old_count} rows with {new_count} rows"
-                    )
-                except Exception as e:
-                    cur.execute("ROLLBACK")
-                    print(
-                        f"[REPLACE EVENTS] Error during replacement for {client_code}/{source_system}: {e}"
-                    )
-                    raise
+                        deleted = cur.rowcount
+
+                        # Insert new events and update changed ones; the
+                        # classifier may not know an event the backfill
+                        # script tagged, so a NULL never clears skill_level
+                        cur.execute(
+                            f"""
+                            INSERT INTO "{self.schema}"."{prod_table}" AS prod (
+                                client_code,
+                                source_system,
+                                event_id,
+                                event_name,
+                                event_description,
+                                event_type,
+                                event_start_time,
+                                event_end_time,
+                                num_registrants,
+                                max_registrants,
+                                admission_rate_regular,
+                                admission_rate_member,
+                                skill_level,
+                                row_hash,
+                                created_at
+                            )
+                            SELECT
+                                client_code,
+                                source_system,
+                                event_id,
+                                event_name,
+                                event_description,
+                                event_type,
+                                event_start_time,
+                                event_end_time,
+                                num_registrants,
+                                max_registrants,
+                                admission_rate_regular,
+                                admission_rate_member,
+                                skill_level,
+                                row_hash,
+                                created_at
+                            FROM "{self.schema}"."{staging_table}"
+                            ON CONFLICT (client_code, source_system, event_id, event_start_time)
+                            DO UPDATE SET
+                                event_name = EXCLUDED.event_name,
+                                event_description = EXCLUDED.event_description,
+                                event_type = EXCLUDED.event_type,
+                                event_end_time = EXCLUDED.event_end_time,
+                                num_registrants = EXCLUDED.num_registrants,
+                                max_registrants = EXCLUDED.max_registrants,
+                                admission_rate_regular = EXCLUDED.admission_rate_regular,
+                                admission_rate_member = EXCLUDED.admission_rate_member,
+                                skill_level = COALESCE(EXCLUDED.skill_level, prod.skill_level),
+                                row_hash = EXCLUDED.row_hash,
+                                created_at = EXCLUDED.created_at
+                            WHERE prod.row_hash IS DISTINCT FROM EXCLUDED.row_hash
+                            """
+                        )
+                        upserted = cur.rowcount
+
+                        cur.execute(
+                            f"""
+                            SELECT COUNT(*) FROM "{self.schema}"."{prod_table}"
+                            WHERE client_code = %s AND source_system = %s
+                            """,
+                            (client_code, source_system),
+                        )
+                        merged_count = cur.fetchone()[0]
+
+                        cur.execute("COMMIT")
+
+                        stage.inserted = merged_count - (old_count - deleted)
+                        stage.updated = upserted - stage.inserted
+                        stage.unchanged = new_count - upserted
+                        print(
+                            f"[REPLACE EVENTS] ✓ Complete for {client_code}/{source_system}: "
+                            f"{stage.inserted} inserted, {stage.updated} updated, "
+                            f"{stage.unchanged} unchanged, {deleted} deleted "
+                            f"({old_count} → {merged_count} rows)"
+                        )
+                    except Exception as e:
+                        cur.execute("ROLLBACK")
+                        print(
+                            f"[REPLACE EVENTS] Error during replacement for {client_code}/{source_system}: {e}"
+                        )
+                        raise
 
         print(
             f"[REPLACE EVENTS] Completed replacement for {len(events_by_client)} client/system combinations"
@@ -823,7 +1140,7 @@ class InsertMixin:
     def replace_court_availabilities(
         self,
         availabilities: list[dict],
-        table_name: str = "facility_court_availabilities",
+        table_name: str = Tables.FACILITY_COURT_AVAILABILITIES,
     ) -> None:
         """
         Replace all court availabilities for each client_code + source_system combination.
@@ -864,6 +1181,9 @@ class InsertMixin:
                 for m in client_availabilities
             ]
 
+            # Each client's rows live in their own list partition
+            self.ensure_client_partition(prod_table, client_code)
+
             with self._connect() as conn, conn.cursor() as cur:
                 # Step 1: Create staging table if it doesn't exist
                 cur.execute(
@@ -878,31 +1198,9 @@ class InsertMixin:
                 cur.execute(f'TRUNCATE TABLE "{self.schema}"."{staging_table}"')
 
                 # Step 3: Insert new data into staging table
-                BATCH_SIZE = 1000
-                total_batches = (len(rows) + BATCH_SIZE - 1) // BATCH_SIZE
-                for i in range(0, len(rows), BATCH_SIZE):
-                    batch = rows[i : i + BATCH_SIZE]
-                    batch_num = i // BATCH_SIZE + 1
-                    print(
-                        f"[REPLACE COURT AVAILABILITIES] Inserting batch {batch_num}/{total_batches} "
-                        f"({len(batch)} records) into staging for {client_code}/{source_system}"
-                    )
-                    execute_values(
-                        cur,
-                        f"""
-                        INSERT INTO "{self.schema}"."{staging_table}" (
-                            client_code,
-                            source_system,
-                            court_id,
-                            court_name,
-                            slot_start,
-                            slot_end,
-                            period_type,
-                            created_at
-                        ) VALUES %s
-                        """,
-                        batch,
-                    )
+                self.bulk_insert(
+                    cur, staging_table, COURT_AVAILABILITY_COLUMNS, rows
+                )
 
                 # Step 4: Get row counts before swap
                 cur.execute(
@@ -922,13 +1220,9 @@ class InsertMixin:
                 # Step 6: Replace data atomically in a transaction
                 cur.execute("BEGIN")
                 try:
-                    # Delete existing records for this client_code + source_system
-                    cur.execute(
-                        f"""
-                        DELETE FROM "{self.schema}"."{prod_table}"
-                        WHERE client_code = %s AND source_system = %s
-                        """,
-                        (client_code, source_system),
+                    # Clear existing records for this client_code + source_system
+                    self.clear_client_partition(
+                        cur, prod_table, client_code, source_system
                     )
 
                     # Copy all data from staging to production
@@ -1035,7 +1329,7 @@ class InsertMixin:
                     """,
                     batch,
                 )
-                print(f"Inserted batch {i // BATCH_SIZE + 1}")
+                logger.debug("Inserted batch %s into %s", i // BATCH_SIZE + 1, table_name)
                 total_inserted += cur.rowcount
         print(
             f"Transactions received: {total_incoming}, inserted: {total_inserted}, skipped: {total_incoming - total_inserted}"
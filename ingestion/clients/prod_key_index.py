@@ -0,0 +1,96 @@
+"""Client-side index of the PROD dedupe keys for reservations and cancellations.
+
+The STG → PROD dedupe deletes every staged row whose key already exists in
+PROD (an IS NOT DISTINCT FROM anti-join). With the watermark overlap most of
+a run's rows are such repeats, so they are written to STG only to be deleted
+again. With PG_PROD_KEY_INDEX enabled, the keys of the PROD rows in the
+watermark window are loaded once per client and run, and rows whose key is
+in them are dropped before they are staged. Rows the index doesn't know are
+staged as before and the SQL dedupe still runs, so the index only ever
+removes rows the anti-join would have removed.
+
+Keys are kept as 16-byte digests rather than tuples to bound memory.
+
+    PG_PROD_KEY_INDEX  true | false (default false)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Sequence
+
+# The columns each dedupe anti-join compares (DedupeMixin)
+RESERVATION_KEY = (
+    "event_id",
+    "reservation_start_at",
+    "reservation_created_at",
+    "member_id",
+)
+RESERVATION_CANCELLATION_KEY = (
+    "client_code",
+    "event_id",
+    "reservation_start_at",
+    "cancelled_on",
+    "member_id",
+)
+
+_UNKNOWN = object()
+
+
+def is_prod_key_index_enabled() -> bool:
+    return os.getenv("PG_PROD_KEY_INDEX", "").lower() in ("true", "1", "yes")
+
+
+def _canonical(value):
+    """A key value as Postgres would compare it, or _UNKNOWN if that's unclear."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            # Naive timestamps are interpreted in the session time zone
+            return _UNKNOWN
+        return value.astimezone(timezone.utc).isoformat()
+    if isinstance(value, (str, int)) and not isinstance(value, bool):
+        return str(value)
+    return _UNKNOWN
+
+
+def _digest(values: Iterable) -> Optional[bytes]:
+    parts = []
+    for value in values:
+        if value is None:
+            # Kept apart from '' (IS NOT DISTINCT FROM treats NULLs as equal)
+            parts.append("\x00")
+            continue
+        canonical = _canonical(value)
+        if canonical is _UNKNOWN:
+            return None
+        parts.append("\x01" + canonical)
+    return hashlib.blake2b("\x1f".join(parts).encode(), digest_size=16).digest()
+
+
+class ProdKeyIndex:
+    """Set of PROD dedupe keys over the given columns."""
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = tuple(columns)
+        self._digests: set[bytes] = set()
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def add(self, values: Sequence) -> None:
+        """Add one PROD row's key values, in column order."""
+        digest = _digest(values)
+        if digest is not None:
+            self._digests.add(digest)
+
+    def __contains__(self, record: dict) -> bool:
+        digest = _digest(record.get(column) for column in self.columns)
+        return digest is not None and digest in self._digests
+
+    def filter(self, records: list[dict]) -> list[dict]:
+        """The records whose key is not already in PROD."""
+        if not self._digests:
+            return records
+        return [record for record in records if record not in self]
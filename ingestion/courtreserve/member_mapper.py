@@ -2,6 +2,7 @@ from datetime import date, datetime
 from typing import Optional
 
 from ingestion.utils.normalize import normalize_email, normalize_phone_number
+from ingestion.utils.row_hash import member_row_hash
 
 
 def parse_date(value: Optional[str]) -> Optional[date]:
@@ -38,7 +39,7 @@ def map_member_to_row(member: dict, facility_code: str) -> dict:
     # Extract MembershipStartDate from CourtReserve API
     member_since_date = parse_date(member.get("MembershipStartDate"))
 
-    return {
+    row = {
         "client_code": facility_code,
         "member_id": str(member_id) if member_id is not None else None,
         "club_member_key": str(member_id) if member_id is not None else None,
@@ -52,3 +53,5 @@ def map_member_to_row(member: dict, facility_code: str) -> dict:
         "is_premium_member": is_premium_member,
         "member_since": member_since_date,
     }
+    row["row_hash"] = member_row_hash(row)
+    return row
@@ -14,7 +14,6 @@ def normalize_reservation_cancellations(
         return rows
     
     for cancellation in reservation_cancellations:
-        print(cancellation)
         start_dt = parse_event_time(cancellation.get("StartTime"))
         end_dt = parse_event_time(cancellation.get("EndTime"))
         created_dt = parse_utc_time(cancellation.get("SignedUpOnUtc"))
@@ -0,0 +1,179 @@
+"""Long-running scheduler that replaces one-shot cron invocations.
+
+The daemon stays resident and runs ingestion jobs on an internal UTC schedule
+that mirrors the GitHub Actions cron cadence. Clients (and their HTTP
+sessions), the Postgres pool and the event-category cache stay warm between
+runs; the organization/court metadata snapshot is reloaded at the start of
+every job.
+
+    DAEMON_JOBS                           Jobs to enable (default: 2hour,daily_full,google_reviews)
+    DAEMON_AVAILABILITY_INTERVAL_MINUTES  Also refresh court availability every N minutes
+    DAEMON_DBT_TARGET                     Run dbt against this target after ingestion jobs
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence
+
+DEFAULT_DAEMON_JOBS = ("2hour", "daily_full", "google_reviews")
+
+
+@dataclass(frozen=True)
+class Schedule:
+    """
+    When a job runs. Either at minute 0 of the given UTC hours (optionally only
+    on some weekdays, 0 = Monday), or every ``every_minutes`` minutes.
+    """
+
+    job: str
+    option: str
+    hours: FrozenSet[int] = frozenset()
+    weekdays: Optional[FrozenSet[int]] = None
+    every_minutes: Optional[int] = None
+    run_dbt: bool = False
+
+    def next_run_after(self, now: datetime) -> datetime:
+        if self.every_minutes:
+            return now + timedelta(minutes=self.every_minutes)
+
+        candidate = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        for _ in range(24 * 8):
+            if candidate.hour in self.hours and (
+                self.weekdays is None or candidate.weekday() in self.weekdays
+            ):
+                return candidate
+            candidate += timedelta(hours=1)
+        raise ValueError(f"Schedule for {self.job} never fires")
+
+
+# Mirrors .github/workflows/ingestion.yml
+CRON_SCHEDULES: Dict[str, Schedule] = {
+    "2hour": Schedule(
+        job="2hour",
+        option="2hour",
+        hours=frozenset({14, 16, 18, 20, 22, 0, 2, 4}),
+        run_dbt=True,
+    ),
+    "daily_full": Schedule(
+        job="daily_full", option="daily_full", hours=frozenset({2}), run_dbt=True
+    ),
+    "google_reviews": Schedule(
+        job="google_reviews",
+        option="google_reviews",
+        hours=frozenset({2}),
+        weekdays=frozenset({0}),
+    ),
+    # Staging writes to a different schema: run a separate daemon with
+    # PG_SCHEMA set to the staging schema and DAEMON_JOBS=staging
+    "staging": Schedule(
+        job="staging", option="staging", hours=frozenset({13}), run_dbt=True
+    ),
+}
+
+
+def get_schedules() -> List[Schedule]:
+    raw = os.getenv("DAEMON_JOBS")
+    jobs = (
+        [job.strip() for job in raw.split(",") if job.strip()]
+        if raw
+        else list(DEFAULT_DAEMON_JOBS)
+    )
+    unknown = [job for job in jobs if job not in CRON_SCHEDULES]
+    if unknown:
+        raise RuntimeError(f"Unknown DAEMON_JOBS: {', '.join(unknown)}")
+    schedules = [CRON_SCHEDULES[job] for job in jobs]
+
+    raw_interval = os.getenv("DAEMON_AVAILABILITY_INTERVAL_MINUTES")
+    if raw_interval:
+        try:
+            interval = int(raw_interval)
+        except ValueError:
+            interval = 0
+        if interval > 0:
+            schedules.append(
+                Schedule(
+                    job="availability", option="availability", every_minutes=interval
+                )
+            )
+    return schedules
+
+
+def _run_dbt(target: str) -> None:
+    print(f"[DAEMON] Running dbt (target={target})")
+    subprocess.run(
+        [sys.executable, "-m", "scripts.run_dbt", "deps"], check=True
+    )
+    subprocess.run(
+        [sys.executable, "-m", "scripts.run_dbt", "run", "--target", target],
+        check=True,
+    )
+
+
+def run_daemon(
+    run_option: Callable[[str], object],
+    schedules: Sequence[Schedule],
+    stop_event: Optional[threading.Event] = None,
+    now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+) -> None:
+    """
+    Run jobs on their schedules until stop_event is set (SIGINT/SIGTERM).
+
+    Jobs run one at a time in schedule order; a job that comes due while
+    another is running starts right after it. A failing job is logged and
+    retried at its next scheduled time.
+
+    Args:
+        run_option: Runs one RUN_OPTIONS entry by name
+        schedules: Jobs to run
+        stop_event: Set to stop after the current job
+        now: Clock, overridable for benchmarks
+    """
+    if not schedules:
+        raise RuntimeError("No daemon jobs configured")
+
+    stop_event = stop_event or threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: stop_event.set())
+
+    dbt_target = os.getenv("DAEMON_DBT_TARGET")
+    started = now()
+    next_runs = {schedule.job: schedule.next_run_after(started) for schedule in schedules}
+
+    print("=" * 80)
+    print("[DAEMON] Started")
+    for schedule in schedules:
+        print(f"[DAEMON] {schedule.job:<15} next run {next_runs[schedule.job].isoformat()}")
+    print("=" * 80)
+
+    while not stop_event.is_set():
+        current = now()
+        due = [s for s in schedules if next_runs[s.job] <= current]
+        if not due:
+            wake_at = min(next_runs.values())
+            stop_event.wait(max(1.0, (wake_at - current).total_seconds()))
+            continue
+
+        for schedule in due:
+            if stop_event.is_set():
+                break
+            print(f"\n[DAEMON] Running {schedule.job} (option={schedule.option})")
+            try:
+                run_option(schedule.option)
+                if schedule.run_dbt and dbt_target:
+                    _run_dbt(dbt_target)
+            except (Exception, SystemExit) as e:
+                print(f"[DAEMON] Job {schedule.job} failed: {e}", file=sys.stderr)
+            next_runs[schedule.job] = schedule.next_run_after(now())
+            print(
+                f"[DAEMON] {schedule.job} next run {next_runs[schedule.job].isoformat()}"
+            )
+
+    print("[DAEMON] Stopped")
@@ -1,7 +1,9 @@
 """Normalize CourtReserve events for database storage."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional
 
+from ingestion.events.skill_levels import detect_skill_level
+from ingestion.utils.row_hash import event_row_hash
 from ingestion.utils.datetime import to_utc_datetime
 from ingestion.utils.timezones import resolve_timezone
 
@@ -50,6 +52,7 @@ def _load_event_categories(client_code: str, source_system: str = "courtreserve"
 def normalize_courtreserve_events(
     events: List[Dict],
     client_code: str,
+    event_categories: Optional[Mapping[str, str]] = None,
 ) -> List[Dict]:
     """
     Normalize CourtReserve events to database format.
@@ -57,12 +60,15 @@ def normalize_courtreserve_events(
     Args:
         events: List of event dictionaries from CourtReserve API
         client_code: Client code (e.g., 'pklyn')
+        event_categories: category_id -> event_category_name map, typically from
+            an EventCategoryCache. Loaded from the database when not provided.
     
     Returns:
         List of normalized event dictionaries
     """
     # Load event categories once for all events
-    event_categories = _load_event_categories(client_code, "courtreserve")
+    if event_categories is None:
+        event_categories = _load_event_categories(client_code, "courtreserve")
     
     normalized = []
     
@@ -141,7 +147,7 @@ def normalize_courtreserve_events(
                     except (ValueError, TypeError):
                         pass
         
-        normalized.append({
+        row = {
             "client_code": client_code.lower(),
             "source_system": "courtreserve",
             "event_id": event_id,
@@ -153,7 +159,10 @@ def normalize_courtreserve_events(
             "max_registrants": max_registrants,
             "admission_rate_regular": admission_rate_regular,
             "admission_rate_member": admission_rate_member,
-        })
+            "skill_level": detect_skill_level(event_name),
+        }
+        row["row_hash"] = event_row_hash(row)
+        normalized.append(row)
     
     return normalized
 
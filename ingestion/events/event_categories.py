@@ -0,0 +1,97 @@
+"""TTL cache for facility_event_categories lookups.
+
+Event categories change rarely, but normalize_courtreserve_events needs the
+full category map for every client on every run. The cache keeps one map per
+(client_code, source_system) for ``ttl_seconds`` and reloads it early when an
+event references a category id the cached map does not know about (a new
+category was added since it was loaded). Ids still missing after a reload are
+remembered so they don't trigger another reload until the entry expires.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+DEFAULT_EVENT_CATEGORY_TTL_SECONDS = 900
+
+CategoryLoader = Callable[[str, str], Dict[str, str]]
+
+
+class EventCategoryCache:
+    def __init__(
+        self,
+        loader: CategoryLoader,
+        ttl_seconds: float = DEFAULT_EVENT_CATEGORY_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            loader: Callable (client_code, source_system) -> {category_id: name},
+                e.g. PostgresClient.get_event_categories
+            ttl_seconds: How long a loaded map stays fresh
+            clock: Monotonic clock, overridable for benchmarks
+        """
+        self._loader = loader
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # (client_code, source_system) -> (loaded_at, categories, missing ids)
+        self._entries: Dict[
+            Tuple[str, str], Tuple[float, Mapping[str, str], FrozenSet[str]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        client_code: str,
+        source_system: str = "courtreserve",
+        expected_ids: Optional[Iterable] = None,
+    ) -> Mapping[str, str]:
+        """
+        Return the category map for a facility, loading it if missing or stale.
+
+        Args:
+            client_code: Facility client code
+            source_system: Source system code
+            expected_ids: Category ids the caller is about to look up. If any
+                are missing from a cached map, the map is reloaded once.
+        """
+        key = (client_code.lower(), source_system.lower())
+        wanted = frozenset(
+            str(category_id)
+            for category_id in expected_ids or ()
+            if category_id is not None
+        )
+        now = self._clock()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None:
+            loaded_at, categories, missing = entry
+            fresh = now - loaded_at < self.ttl_seconds
+            if fresh and not (wanted - categories.keys() - missing):
+                return categories
+
+        categories = MappingProxyType(dict(self._loader(*key)))
+        missing = frozenset(wanted - categories.keys())
+        with self._lock:
+            self._entries[key] = (now, categories, missing)
+        return categories
+
+    def invalidate(
+        self, client_code: Optional[str] = None, source_system: Optional[str] = None
+    ) -> None:
+        """Drop cached maps: all of them, or only those matching the filters."""
+        with self._lock:
+            if client_code is None and source_system is None:
+                self._entries.clear()
+                return
+            for code, system in list(self._entries):
+                if client_code is not None and code != client_code.lower():
+                    continue
+                if source_system is not None and system != source_system.lower():
+                    continue
+                del self._entries[(code, system)]
@@ -2,6 +2,8 @@
 
 from typing import Dict, List
 
+from ingestion.events.skill_levels import detect_skill_level
+from ingestion.utils.row_hash import event_row_hash
 from ingestion.utils.datetime import to_utc_datetime
 from ingestion.utils.timezones import resolve_timezone
 
@@ -96,7 +98,7 @@ def normalize_podplay_events(
                 except (ValueError, TypeError):
                     admission_rate_member = None
         
-        normalized.append({
+        row = {
             "client_code": client_code.lower(),
             "source_system": "podplay",
             "event_id": event_id,
@@ -109,7 +111,10 @@ def normalize_podplay_events(
             "max_registrants": max_registrants,
             "admission_rate_regular": admission_rate_regular,
             "admission_rate_member": admission_rate_member,
-        })
+            "skill_level": detect_skill_level(event_name),
+        }
+        row["row_hash"] = event_row_hash(row)
+        normalized.append(row)
     
     return normalized
 
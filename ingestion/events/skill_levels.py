@@ -0,0 +1,133 @@
+"""Skill level classification for facility events.
+
+Skill levels are detected from the event name only. The rules are compiled once
+into an ordered list of tiers; each tier's patterns are folded into a single
+alternation so an event name is scanned once per tier instead of once per
+pattern. Events in a series share the same name, so results are memoized.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Pattern, Tuple
+
+ALL_LEVELS = "All Levels"
+BEGINNER = "Beginner"
+ADVANCED_BEGINNER = "Advanced Beginner"
+INTERMEDIATE = "Intermediate"
+HIGH_INTERMEDIATE = "High Intermediate"
+ADVANCED = "Advanced"
+
+SKILL_LEVEL_CACHE_SIZE = 4096
+
+# Skill level patterns (using Python regex)
+SKILL_RULES = {
+    "advanced_beginner": [
+        r"\b201\b",
+        r"Advanced\s*Beginner",
+        r"\b3\.0\+?\b",
+        r"Experienced\s*Beginner",
+        r"\bAdv(?:anced)?\s*Beg(?:inner)?\b",
+        r"Experienced\s+Beg",  # "Experienced Beg" (e.g., "Experienced Beg / Intermediate")
+        r"\bExp\s*Beg\b",  # Standalone "Exp Beg" shorthand
+    ],
+    "beginner": [
+        r"\b101\b",
+        r"\bIntro",
+        r"\bBeginner\b",
+        r"\b2\.0\b",
+        r"\b2\.25\b",
+        r"\b2\.5\b",
+        r"\b2\.75\b",
+        r"Try[ -]?[Ii]t",  # Try it / Try-it / Try It / Try-It
+        r"Try-?It",  # $5 Pickleball Try-It
+    ],
+    "high_intermediate": [
+        r"High\s*Intermediate",
+        r"Advanced\s*Intermediate",
+        r"\b3\.75\+?\b",
+    ],
+    "intermediate": [
+        r"\b301\b",
+        r"\b302\b",
+        r"\bIntermediate\b",
+        r"\b3\.25\+?\b",
+        r"\b3\.5\+?\b",
+        r"Paddle\s*Battle",
+        r"\bDrill\s*Hour\b",
+        r"Fixed\s*Partner",
+    ],
+    "advanced": [
+        r"\b401\b",
+        r"\b501\b",
+        r"\bAdvanced\b",
+        r"\b4\.0\+?\b",
+        r"\b4\.25\+?\b",
+        r"\b4\.5\+?\b",
+        r"\b5\.0\b",
+        r"\bExpert\b",
+        r"Live\s*Match\s*Play",
+    ],
+}
+
+
+def _compile(*patterns: str) -> Pattern:
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# Ordered (skill_level, pattern, exclusion) tiers, most specific first. A tier
+# matches when its pattern is found and its exclusion (if any) is not.
+_SKILL_TIERS: List[Tuple[str, Pattern, Optional[Pattern]]] = [
+    # 0. Explicit "All Levels"
+    (ALL_LEVELS, _compile(r"\bAll\s+Levels\b"), None),
+    # 1. High Intermediate ("High"/"Advanced" before "Intermediate", or 3.75+)
+    (
+        HIGH_INTERMEDIATE,
+        _compile(r"\b(High|Advanced)\s+Intermediate\b", r"\b3\.75\+?\b"),
+        None,
+    ),
+    # 2. Advanced Beginner - explicit phrases first
+    (ADVANCED_BEGINNER, _compile(r"\b(Advanced|Experienced)\s+Beginner\b"), None),
+    # ... then codes/ratings, unless it's part of "Advanced Intermediate"
+    (
+        ADVANCED_BEGINNER,
+        _compile(*SKILL_RULES["advanced_beginner"]),
+        _compile(r"Advanced\s+Intermediate"),
+    ),
+    # 3. Advanced (standalone "Advanced" not followed by Intermediate/Beginner)
+    (
+        ADVANCED,
+        _compile(*SKILL_RULES["advanced"]),
+        _compile(r"Advanced\s+(Intermediate|Beginner)"),
+    ),
+    # 4. Intermediate - "High/Advanced Intermediate" already returned in tier 1
+    (INTERMEDIATE, _compile(*SKILL_RULES["intermediate"]), None),
+    # 5. Beginner - "Advanced/Experienced Beginner" already returned in tier 2
+    (BEGINNER, _compile(*SKILL_RULES["beginner"]), None),
+]
+
+
+@lru_cache(maxsize=SKILL_LEVEL_CACHE_SIZE)
+def _classify_event_name(event_name_text: str) -> str:
+    for skill_level, pattern, exclusion in _SKILL_TIERS:
+        if pattern.search(event_name_text) and not (
+            exclusion and exclusion.search(event_name_text)
+        ):
+            return skill_level
+    return ALL_LEVELS
+
+
+def detect_skill_level(
+    event_name: Optional[str], event_description: Optional[str] = None
+) -> str:
+    """
+    Detect skill level from event_name ONLY.
+    Returns skill level string or "All Levels" if no match.
+    """
+    event_name_text = (event_name or "").strip()
+
+    if not event_name_text:
+        return ALL_LEVELS
+
+    return _classify_event_name(event_name_text)
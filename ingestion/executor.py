@@ -0,0 +1,214 @@
+"""Run a pipeline's per-client work concurrently.
+
+Each facility is independent (own credentials, own watermark key), so a
+pipeline hands its per-client function to ``run_for_clients`` and gets back
+one ``ClientResult`` per client. A failing client is recorded and logged
+without stopping the others; pipelines that should fail the run call
+``raise_for_failures`` once they have finished their own bookkeeping.
+
+Configuration:
+    INGEST_EXECUTOR     thread (default) | process | serial
+    INGEST_MAX_WORKERS  Global cap on clients in flight across all pipelines
+                        (default 4). 1 behaves like the old serial loops.
+                        A PG_POOL_SIZE below this is raised to it, since
+                        every client in flight holds a pooled connection.
+
+Process mode needs a picklable (module-level) function and picklable
+arguments/results.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+from ingestion import metrics
+
+EXECUTOR_KINDS = ("thread", "process", "serial")
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class ClientResult:
+    client_code: str
+    value: Any = None
+    error: Optional[BaseException] = None
+    traceback: Optional[str] = None
+    duration_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class PipelineError(RuntimeError):
+    """Raised after all clients finished when at least one of them failed."""
+
+    def __init__(self, label: str, failures: Sequence[ClientResult]):
+        self.label = label
+        self.failures = list(failures)
+        codes = ", ".join(result.client_code for result in self.failures)
+        super().__init__(f"{label}: {len(self.failures)} client(s) failed: {codes}")
+
+
+def get_max_workers() -> int:
+    raw = os.getenv("INGEST_MAX_WORKERS")
+    if not raw:
+        return DEFAULT_MAX_WORKERS
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_MAX_WORKERS
+    return max(1, value)
+
+
+def get_executor_kind() -> str:
+    kind = os.getenv("INGEST_EXECUTOR", "thread").strip().lower()
+    return kind if kind in EXECUTOR_KINDS else "thread"
+
+
+_slots_lock = threading.Lock()
+_slots: Optional[threading.BoundedSemaphore] = None
+_slots_size = 0
+
+
+def _global_slots() -> threading.BoundedSemaphore:
+    """Process-wide limit on clients in flight, shared by concurrent pipelines."""
+    global _slots, _slots_size
+    with _slots_lock:
+        size = get_max_workers()
+        if _slots is None or _slots_size != size:
+            _slots = threading.BoundedSemaphore(size)
+            _slots_size = size
+        return _slots
+
+
+def _client_code(item: Any) -> str:
+    if isinstance(item, (tuple, list)):
+        return str(item[0])
+    return str(item)
+
+
+def _call(func: Callable, item: Any) -> Any:
+    return func(*item) if isinstance(item, tuple) else func(item)
+
+
+def _make_executor(kind: str, workers: int) -> Executor:
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest")
+
+
+def run_for_clients(
+    label: str,
+    items: Iterable[Any],
+    func: Callable[..., Any],
+    *,
+    max_workers: Optional[int] = None,
+    kind: Optional[str] = None,
+) -> List[ClientResult]:
+    """
+    Run ``func`` once per client and collect results in input order.
+
+    Args:
+        label: Log prefix, e.g. "COURTRESERVE MEMBERS"
+        items: Client codes, or tuples whose first element is the client code
+            (tuples are unpacked into positional arguments)
+        func: Per-client function
+        max_workers: Override INGEST_MAX_WORKERS for this call
+        kind: Override INGEST_EXECUTOR for this call
+
+    Returns:
+        One ClientResult per item, in the order given
+    """
+    items = list(items)
+    kind = kind or get_executor_kind()
+    workers = min(max_workers or get_max_workers(), len(items)) if items else 0
+
+    if kind == "serial" or workers <= 1:
+        results = [_run_one(func, item) for item in items]
+    else:
+        results = _run_concurrently(label, items, func, kind, workers)
+
+    failures = [result for result in results if not result.ok]
+    for result in failures:
+        print(
+            f"[{label}] Error processing {result.client_code}: {result.error}",
+            file=sys.stderr,
+        )
+        if result.traceback:
+            print(result.traceback, file=sys.stderr)
+    return results
+
+
+def raise_for_failures(label: str, results: Sequence[ClientResult]) -> None:
+    """Raise PipelineError if any client failed."""
+    failures = [result for result in results if not result.ok]
+    if failures:
+        raise PipelineError(label, failures)
+
+
+def _run_one(func: Callable, item: Any) -> ClientResult:
+    start = time.perf_counter()
+    try:
+        with metrics.client_scope(_client_code(item)):
+            value = _call(func, item)
+    except Exception as exc:
+        return ClientResult(
+            client_code=_client_code(item),
+            error=exc,
+            traceback=traceback.format_exc(),
+            duration_seconds=time.perf_counter() - start,
+        )
+    return ClientResult(
+        client_code=_client_code(item),
+        value=value,
+        duration_seconds=time.perf_counter() - start,
+    )
+
+
+def _run_concurrently(
+    label: str, items: list, func: Callable, kind: str, workers: int
+) -> List[ClientResult]:
+    slots = _global_slots()
+    print(f"[{label}] Running {len(items)} client(s) with {workers} {kind} worker(s)")
+
+    futures: List[Future] = []
+    with _make_executor(kind, workers) as executor:
+        for item in items:
+            slots.acquire()
+            if kind == "process":
+                future = executor.submit(_run_one, func, item)
+            else:
+                # Carry the caller's context variables into the worker thread
+                context = contextvars.copy_context()
+                future = executor.submit(context.run, _run_one, func, item)
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+
+    results = []
+    for item, future in zip(items, futures):
+        try:
+            results.append(future.result())
+        except Exception as exc:
+            # Worker process died or the result could not be unpickled
+            results.append(
+                ClientResult(
+                    client_code=_client_code(item),
+                    error=exc,
+                    traceback=traceback.format_exc(),
+                )
+            )
+    return results
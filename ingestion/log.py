@@ -0,0 +1,94 @@
+"""Leveled, low-overhead logging for ingestion hot loops.
+
+Per-page, per-batch and per-record progress goes through these loggers
+instead of print(). Messages take %-style arguments, so nothing is formatted
+unless the level is enabled. Debug-only work (scanning a page just to log its
+date range) is guarded with ``logger.isEnabledFor(logging.DEBUG)``, and
+repetitive progress lines are sampled. Run-level summaries stay on print().
+
+    INGEST_LOG_LEVEL         DEBUG | INFO (default) | WARNING | ERROR
+    INGEST_LOG_SAMPLE_EVERY  Below DEBUG, log 1 in N sampled progress lines
+                             per call site (default 10, 1 = log every line)
+
+Output goes to stdout as plain lines (no timestamps), like the print()
+output it replaces. Loggers live under "elt" so they don't propagate into
+the dedupe.log file handler that PostgresClient installs on the root logger.
+Settings are read when the first logger is created and again by
+``configure()``, which ingestion.main calls after loading .env.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import sys
+import threading
+from typing import Dict, Iterator
+
+DEFAULT_SAMPLE_EVERY = 10
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+
+_root = logging.getLogger("elt")
+_configure_lock = threading.Lock()
+_configured = False
+_sample_every = DEFAULT_SAMPLE_EVERY
+_counters: Dict[str, Iterator[int]] = {}
+
+
+def _get_level() -> int:
+    raw = os.getenv("INGEST_LOG_LEVEL", "INFO").strip().upper()
+    level = logging.getLevelName(raw)
+    return level if isinstance(level, int) else logging.INFO
+
+
+def _get_sample_every() -> int:
+    raw = os.getenv("INGEST_LOG_SAMPLE_EVERY")
+    if not raw:
+        return DEFAULT_SAMPLE_EVERY
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_SAMPLE_EVERY
+    return max(1, value)
+
+
+def configure() -> None:
+    """Install the stdout handler (once) and apply INGEST_LOG_* settings."""
+    global _configured, _sample_every
+    with _configure_lock:
+        if not _configured:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            _root.addHandler(handler)
+            _root.propagate = False
+            _configured = True
+        _root.setLevel(_get_level())
+        _sample_every = _get_sample_every()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for one component, e.g. get_logger("podplay")."""
+    if not _configured:
+        configure()
+    return _root.getChild(name)
+
+
+def sampled(logger: logging.Logger, key: str, level: int = logging.INFO) -> bool:
+    """
+    Whether this occurrence of a repetitive progress line should be logged.
+
+    Always true at DEBUG; otherwise true for the 1st, (N+1)th, ... call with
+    the same key, and false without counting when the level is disabled.
+    """
+    if not logger.isEnabledFor(level):
+        return False
+    if _sample_every == 1 or logger.isEnabledFor(logging.DEBUG):
+        return True
+    counter = _counters.get(key)
+    if counter is None:
+        counter = _counters.setdefault(key, itertools.count())
+    return next(counter) % _sample_every == 0
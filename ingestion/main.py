@@ -2,50 +2,175 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional, Iterator
-
-from dotenv import load_dotenv
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Optional, Iterator
 
 from constants import EltWatermarks, Tables
-from ingestion.clients import CourtReserveClient, PodplayClient, PostgresClient
-from ingestion.courtreserve.member_mapper import map_member_to_row as map_cr_member
-from ingestion.courtreserve.reservation_helpers import (
-    normalize_reservations as normalize_cr_reservations,
-)
-from ingestion.courtreserve.reservation_cancellation_helpers import (
-    normalize_reservation_cancellations as normalize_cr_cancellations,
-)
-from ingestion.podplay.members import normalize_members as normalize_podplay_members
-from ingestion.podplay.reservations import (
-    normalize_event_reservations as normalize_podplay_reservations,
-)
-from ingestion.events.podplay_events import normalize_podplay_events
-from ingestion.events.courtreserve_events import normalize_courtreserve_events
-from ingestion.events.podplay_sessions import normalize_podplay_sessions
-from ingestion.events.courtreserve_court_availability import calculate_available_slots
-from ingestion.clients import GooglePlacesClient
-
-load_dotenv()
-
-pg_schema = os.getenv("PG_SCHEMA")
-pg_dsn = os.getenv("PG_DSN")
-
-if not pg_schema or not pg_dsn:
-    raise RuntimeError(
-        "Postgres DSN and schema must be configured via PG_DSN and PG_SCHEMA"
-    )
+from ingestion import log, metrics
+from ingestion.executor import get_max_workers, raise_for_failures, run_for_clients
+from ingestion.metadata import FacilityMetadata, MetadataSnapshot, load_metadata_snapshot
+from ingestion.scheduler import Task, report_and_exit_on_failure, run_dag
+
+if TYPE_CHECKING:
+    from ingestion.archive import RawArchiveWriter
+    from ingestion.clients import CourtReserveClient, PodplayClient, PostgresClient
+    from ingestion.clients.prod_key_index import ProdKeyIndex
+    from ingestion.events.event_categories import EventCategoryCache
+
+# Importing this module has no side effects: .env loading, the Postgres client,
+# the event-category cache and the output directory are all created on first
+# use, and each pipeline imports its clients/normalizers inside its own
+# functions, so a cron invocation only pays for the pipelines it runs.
 
-pg_client = PostgresClient(pg_dsn, pg_schema)
-
-# Create output directory for JSON files
 OUTPUT_DIR = "elt_output_jsons"
-os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+logger = log.get_logger("main")
+
+_env_loaded = False
+_init_lock = threading.Lock()
+_pg_client: Optional[PostgresClient] = None
+_event_category_cache: Optional[EventCategoryCache] = None
 _courtreserve_clients: Dict[str, CourtReserveClient] = {}
 _podplay_clients: Dict[str, PodplayClient] = {}
+_metadata: Optional[MetadataSnapshot] = None
+_run_id: Optional[str] = None
+# (prod table, client code) -> PROD dedupe keys, loaded once per run
+_prod_key_indexes: Dict[tuple, ProdKeyIndex] = {}
+
+
+def _load_env() -> None:
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        # Pick up INGEST_LOG_LEVEL / INGEST_LOG_SAMPLE_EVERY from .env
+        log.configure()
+        _env_loaded = True
+
+
+def _get_pg_pool_size() -> Optional[int]:
+    """
+    Size of the run-wide Postgres connection pool (PG_POOL_SIZE, unset = no
+    pool). Every client in flight holds a connection while it loads, so the
+    pool is never smaller than INGEST_MAX_WORKERS.
+    """
+    raw = os.getenv("PG_POOL_SIZE")
+    if not raw:
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        return None
+    if value <= 0:
+        return None
+    max_workers = get_max_workers()
+    if value < max_workers:
+        print(
+            f"[POSTGRES] PG_POOL_SIZE={value} is below INGEST_MAX_WORKERS={max_workers}; "
+            f"using a pool of {max_workers}"
+        )
+        return max_workers
+    return value
+
+
+def _get_event_category_ttl_seconds() -> float:
+    from ingestion.events.event_categories import DEFAULT_EVENT_CATEGORY_TTL_SECONDS
+
+    raw = os.getenv("EVENT_CATEGORY_CACHE_TTL_SECONDS")
+    if not raw:
+        return DEFAULT_EVENT_CATEGORY_TTL_SECONDS
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return DEFAULT_EVENT_CATEGORY_TTL_SECONDS
+
+
+def _get_pg_client() -> PostgresClient:
+    """Create the run-wide PostgresClient on first use."""
+    global _pg_client
+    if _pg_client is None:
+        with _init_lock:
+            if _pg_client is None:
+                from ingestion.clients.postgres_client import PostgresClient
+
+                _load_env()
+                pg_schema = os.getenv("PG_SCHEMA")
+                pg_dsn = os.getenv("PG_DSN")
+                if not pg_schema or not pg_dsn:
+                    raise RuntimeError(
+                        "Postgres DSN and schema must be configured via PG_DSN and PG_SCHEMA"
+                    )
+                _pg_client = PostgresClient(
+                    pg_dsn, pg_schema, pool_size=_get_pg_pool_size()
+                )
+    return _pg_client
+
+
+def _get_event_category_cache() -> EventCategoryCache:
+    """
+    Category maps are shared by every CourtReserve client in the run and reloaded
+    after the TTL, or early when an event references an unknown category id.
+    """
+    global _event_category_cache
+    pg_client = _get_pg_client()
+    if _event_category_cache is None:
+        with _init_lock:
+            if _event_category_cache is None:
+                from ingestion.events.event_categories import EventCategoryCache
+
+                _event_category_cache = EventCategoryCache(
+                    pg_client.get_event_categories,
+                    ttl_seconds=_get_event_category_ttl_seconds(),
+                )
+    return _event_category_cache
+
+
+def _output_path(filename: str) -> str:
+    """Path of a JSON dump in OUTPUT_DIR, creating the directory if needed."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    return os.path.join(OUTPUT_DIR, filename)
+
+
+def _get_run_id() -> str:
+    """Id of the current run (sortable: UTC start time plus a random suffix)."""
+    global _run_id
+    if _run_id is None:
+        import uuid
+
+        started = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        _run_id = f"{started}-{uuid.uuid4().hex[:8]}"
+    return _run_id
+
+
+def _raw_archive(source: str, client_code: str) -> RawArchiveWriter:
+    """Writer for this run's raw payloads of one client (no-op unless SAVE_TO_JSON)."""
+    from ingestion.archive import RawArchiveWriter
 
-DEFAULT_LOOKBACK_DAYS = int(os.getenv("DEFAULT_LOOKBACK_DAYS", "30"))
+    if not _should_save_to_json():
+        return RawArchiveWriter.disabled()
+    return RawArchiveWriter.open(
+        os.path.join(OUTPUT_DIR, "raw"), source, client_code, _get_run_id()
+    )
+
+
+def _get_default_lookback_days() -> int:
+    return int(os.getenv("DEFAULT_LOOKBACK_DAYS", "30"))
+
+
+DEFAULT_WATERMARK_OVERLAP_SECONDS = 300
+
+
+def _get_watermark_overlap() -> timedelta:
+    """How far before the watermark the next incremental pull starts."""
+    raw = os.getenv("WATERMARK_OVERLAP_SECONDS")
+    try:
+        seconds = float(raw) if raw else DEFAULT_WATERMARK_OVERLAP_SECONDS
+    except ValueError:
+        seconds = DEFAULT_WATERMARK_OVERLAP_SECONDS
+    return timedelta(seconds=max(0.0, seconds))
 
 
 def _is_running_locally() -> bool:
@@ -66,8 +191,15 @@ def _should_write_to_db() -> bool:
     return write_to_db in ("true", "1", "yes")
 
 
+def _should_profile() -> bool:
+    """Check if the run should be profiled (--profile or INGEST_PROFILE)."""
+    if "--profile" in sys.argv[2:]:
+        return True
+    return os.getenv("INGEST_PROFILE", "").lower() in ("true", "1", "yes")
+
+
 def _should_save_to_json() -> bool:
-    """Check if we should save raw API responses to JSON files."""
+    """Check if we should archive raw API responses (see ingestion.archive)."""
     # Default to saving only when running locally (not in CI)
     default_value = "true" if _is_running_locally() else "false"
     save_to_json = os.getenv("SAVE_TO_JSON", default_value).lower()
@@ -108,23 +240,40 @@ def _get_sample_size() -> Optional[int]:
 
 
 def _get_courtreserve_client(client_code: str) -> CourtReserveClient:
-    global _courtreserve_clients
     code = client_code.lower()
     if code not in _courtreserve_clients:
-        code_upper = code.upper()
-        username = os.getenv(f"{code_upper}_USERNAME")
-        password = os.getenv(f"{code_upper}_PASSWORD")
-        if not username or not password:
-            raise RuntimeError(
-                f"CourtReserve credentials are not configured for client '{client_code}'. "
-                f"Set {code_upper}_USERNAME and {code_upper}_PASSWORD."
-            )
-        _courtreserve_clients[code] = CourtReserveClient(username, password)
+        # Pipelines run concurrently for the same client; build it once
+        with _init_lock:
+            if code not in _courtreserve_clients:
+                from ingestion.clients.courtreserve_client import CourtReserveClient
+
+                _load_env()
+                code_upper = code.upper()
+                username = os.getenv(f"{code_upper}_USERNAME")
+                password = os.getenv(f"{code_upper}_PASSWORD")
+                if not username or not password:
+                    raise RuntimeError(
+                        f"CourtReserve credentials are not configured for client '{client_code}'. "
+                        f"Set {code_upper}_USERNAME and {code_upper}_PASSWORD."
+                    )
+                client = CourtReserveClient(username, password)
+                metrics.instrument_session(client.session)
+                _courtreserve_clients[code] = client
     return _courtreserve_clients[code]
 
 
-def _get_courtreserve_client_codes() -> list[str]:
-    """Get CourtReserve client codes from database."""
+def _get_metadata(refresh: bool = False) -> MetadataSnapshot:
+    """Load the organization/court metadata snapshot once per run."""
+    global _metadata
+    if _metadata is None or refresh:
+        _metadata = load_metadata_snapshot(_get_pg_client())
+    return _metadata
+
+
+def _get_courtreserve_client_codes(
+    metadata: Optional[MetadataSnapshot] = None,
+) -> list[str]:
+    """Get CourtReserve client codes from the metadata snapshot."""
     # Try environment variable first (for backward compatibility)
     raw_codes = os.getenv("CR_CLIENT_CODES")
     if raw_codes:
@@ -132,50 +281,38 @@ def _get_courtreserve_client_codes() -> list[str]:
         if codes:
             return codes
 
-    # Query database for customer organizations
-    if not pg_schema:
-        raise RuntimeError("PG_SCHEMA environment variable must be set")
-
-    import psycopg2
-
-    conn = psycopg2.connect(pg_dsn)
-    cur = conn.cursor()
-
-    query = f"""
-    SELECT client_code
-    FROM "{pg_schema}".organizations
-    WHERE is_customer = true AND source_system_code = 'courtreserve'
-    ORDER BY client_code
-    """
-
-    cur.execute(query)
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-
-    codes = [row[0].strip().lower() for row in rows if row[0]]
+    codes = (metadata or _get_metadata()).client_codes("courtreserve")
     if not codes:
         raise RuntimeError("No CourtReserve client codes found in organizations table")
     return codes
 
 
 def _get_podplay_client(client_code: str) -> PodplayClient:
-    global _podplay_clients
     code = client_code.lower()
     if code not in _podplay_clients:
-        code_upper = code.upper()
-        api_key = os.getenv(f"{code_upper}_API_KEY")
-        if not api_key:
-            raise RuntimeError(
-                f"Podplay API key is not configured for client '{client_code}'. "
-                f"Set {code_upper}_API_KEY."
-            )
-        _podplay_clients[code] = PodplayClient(api_key)
+        # Pipelines run concurrently for the same client; build it once
+        with _init_lock:
+            if code not in _podplay_clients:
+                from ingestion.clients.podplay_client import PodplayClient
+
+                _load_env()
+                code_upper = code.upper()
+                api_key = os.getenv(f"{code_upper}_API_KEY")
+                if not api_key:
+                    raise RuntimeError(
+                        f"Podplay API key is not configured for client '{client_code}'. "
+                        f"Set {code_upper}_API_KEY."
+                    )
+                client = PodplayClient(api_key)
+                metrics.instrument_session(client.session)
+                _podplay_clients[code] = client
     return _podplay_clients[code]
 
 
-def _get_podplay_client_codes() -> list[str]:
-    """Get Podplay client codes from database."""
+def _get_podplay_client_codes(
+    metadata: Optional[MetadataSnapshot] = None,
+) -> list[str]:
+    """Get Podplay client codes from the metadata snapshot."""
     # Try environment variable first (for backward compatibility)
     raw_codes = os.getenv("PODPLAY_CLIENT_CODES")
     if raw_codes:
@@ -183,360 +320,526 @@ def _get_podplay_client_codes() -> list[str]:
         if codes:
             return codes
 
-    # Query database for customer organizations
-    if not pg_schema:
-        raise RuntimeError("PG_SCHEMA environment variable must be set")
-
-    import psycopg2
-
-    conn = psycopg2.connect(pg_dsn)
-    cur = conn.cursor()
-
-    query = f"""
-    SELECT client_code
-    FROM "{pg_schema}".organizations
-    WHERE is_customer = true AND source_system_code = 'podplay'
-    ORDER BY client_code
-    """
-
-    cur.execute(query)
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-
-    codes = [row[0].strip().lower() for row in rows if row[0]]
+    codes = (metadata or _get_metadata()).client_codes("podplay")
     if not codes:
         raise RuntimeError("No Podplay client codes found in organizations table")
     return codes
 
 
-def _get_podplay_clients_with_pod_ids() -> list[tuple[str, Optional[str]]]:
-    """Get Podplay client codes and pod IDs from database.
+def _get_podplay_clients_with_pod_ids(
+    metadata: Optional[MetadataSnapshot] = None,
+) -> list[tuple[str, Optional[str]]]:
+    """Get Podplay client codes and pod IDs from the metadata snapshot.
 
     Returns:
         List of tuples (client_code, podplay_pod_id)
     """
-    # Query database for customer organizations
-    if not pg_schema:
-        raise RuntimeError("PG_SCHEMA environment variable must be set")
-
-    import psycopg2
-
-    conn = psycopg2.connect(pg_dsn)
-    cur = conn.cursor()
-
-    query = f"""
-    SELECT client_code, podplay_pod_id
-    FROM "{pg_schema}".organizations
-    WHERE is_customer = true AND source_system_code = 'podplay'
-    ORDER BY client_code
-    """
-
-    cur.execute(query)
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-
-    result = [
-        (row[0].strip().lower(), row[1] if row[1] else None) for row in rows if row[0]
-    ]
-    return result
+    return (metadata or _get_metadata()).podplay_clients_with_pod_ids()
 
 
 def _resolve_watermark(
-    source_name: str, fallback_days: int = DEFAULT_LOOKBACK_DAYS
+    source_name: str, fallback_days: Optional[int] = None
 ) -> datetime:
-    record = pg_client.get_elt_watermark(source_name)
+    """
+    Start of the next incremental pull: the newest source timestamp loaded so
+    far (last_record_created_at), falling back to when the last run finished
+    for sources that don't record one, minus WATERMARK_OVERLAP_SECONDS.
+    """
+    record = _get_pg_client().get_elt_watermark(source_name)
     candidate = None
 
     if record:
-        last_loaded_at, _ = record
-        candidate = last_loaded_at
+        last_loaded_at, last_record_at = record
+        candidate = last_record_at or last_loaded_at
 
     if not candidate:
-        candidate = datetime.now(timezone.utc) - timedelta(days=fallback_days)
+        if fallback_days is None:
+            fallback_days = _get_default_lookback_days()
+        return datetime.now(timezone.utc) - timedelta(days=fallback_days)
 
     if candidate.tzinfo is None:
         candidate = candidate.replace(tzinfo=timezone.utc)
 
-    return candidate.astimezone(timezone.utc)
+    return candidate.astimezone(timezone.utc) - _get_watermark_overlap()
 
 
-def refresh_courtreserve_members():
-    print("=" * 80)
-    print("[COURTRESERVE MEMBERS] Starting CourtReserve members ingestion")
-    print("=" * 80)
-
-    # Determine mode and flags
-    dev_mode = _is_dev_mode()
-    write_to_db = _should_write_to_db()
-    save_to_json = _should_save_to_json()
-    
-    if dev_mode:
-        mode_str = "DEV MODE (limited records)"
-    else:
-        mode_str = "FULL REFRESH MODE"
-    
-    print(f"[COURTRESERVE MEMBERS] Mode: {mode_str}")
-    print(f"[COURTRESERVE MEMBERS] Write to DB: {write_to_db}")
-    print(f"[COURTRESERVE MEMBERS] Save to JSON: {save_to_json}")
-    print("=" * 80)
+def _high_water_mark(
+    records: list[dict], fields: tuple[str, ...], current: Optional[datetime] = None
+) -> Optional[datetime]:
+    """Newest value of the given timestamp fields across records (and current)."""
+    from ingestion.courtreserve.date_helpers import parse_utc_time
 
-    all_raw_members = []  # Store raw API responses
+    high = current
+    for record in records:
+        for field in fields:
+            value = record.get(field)
+            if not value:
+                continue
+            if isinstance(value, str):
+                try:
+                    value = parse_utc_time(value)
+                except ValueError:
+                    continue
+            if high is None or value > high:
+                high = value
+            break
+    return high
+
+
+def _drop_known_rows(
+    records: list[dict], prod_table: str, client_code: str, since: datetime, label: str
+) -> list[dict]:
+    """
+    Drop records whose dedupe key is already in PROD before they are staged
+    (PG_PROD_KEY_INDEX); the STG → PROD dedupe would delete them anyway.
+    """
+    from ingestion.clients.prod_key_index import is_prod_key_index_enabled
 
-    for client_code in _get_courtreserve_client_codes():
-        print(f"\n[COURTRESERVE MEMBERS] Processing client: {client_code}")
-        print("-" * 80)
+    if not records or not is_prod_key_index_enabled():
+        return records
 
-        client = _get_courtreserve_client(client_code)
-        sample_size = _get_sample_size()
-        
-        # In dev mode, limit to 2000 records
-        if dev_mode:
-            max_results = 2000  # 2000 records for dev mode
-            record_window_days = 7  # Shorter window for dev
-            print(
-                f"[COURTRESERVE MEMBERS] DEV MODE: Pulling up to {max_results} members (last 7 days)"
-            )
-        else:
-            max_results = sample_size
-            record_window_days = 21 if not sample_size else 7
-        
-        watermark_key = f"{EltWatermarks.MEMBERS}__{client_code}"
-        watermark = _resolve_watermark(watermark_key)
-        print(f"[COURTRESERVE MEMBERS] Watermark for {client_code}: {watermark}")
-        
-        # Add 90-minute buffer before watermark to avoid missing members between runs
-        # Similar to Podplay incremental mode
-        if watermark:
-            buffer_minutes = 90
-            start = watermark - timedelta(minutes=buffer_minutes)
-            print(
-                f"[COURTRESERVE MEMBERS] Adjusted start: {start.isoformat()} "
-                f"(watermark - {buffer_minutes} minutes buffer)"
-            )
-        else:
-            start = watermark
+    key = (prod_table, client_code.lower())
+    with _init_lock:
+        index = _prod_key_indexes.get(key)
+    if index is None:
+        index = _get_pg_client().load_prod_key_index(prod_table, client_code, since)
+        with _init_lock:
+            _prod_key_indexes[key] = index
 
-        if sample_size or dev_mode:
-            recent_start = datetime.now(timezone.utc) - timedelta(days=7)
-            start = max(start, recent_start)
-            print(
-                f"[COURTRESERVE MEMBERS] Further adjusted start to {start} "
-                f"(last 7 days limit for dev/sample mode)"
-            )
+    kept = index.filter(records)
+    print(
+        f"[{label}] Skipped {len(records) - len(kept)} of {len(records)} rows "
+        f"already in PROD for {client_code}"
+    )
+    return kept
 
-        page_size = max_results or 1000
-        page_size = max(1, min(page_size, 1000))
 
+def _resume_from_checkpoint(pipeline: str, client_code: str, start: datetime) -> datetime:
+    """Skip windows an earlier, failed run already committed."""
+    resume_at = _get_pg_client().get_resume_point(pipeline, client_code)
+    if resume_at and resume_at > start:
         print(
-            f"[COURTRESERVE MEMBERS] Configuration: page_size={page_size}, "
-            f"max_results={max_results}, record_window_days={record_window_days}, "
-            f"sample_size={sample_size}"
+            f"[CHECKPOINT] Resuming {pipeline} for {client_code} from "
+            f"{resume_at.isoformat()} (last committed window)"
         )
+        return resume_at
+    return start
 
-        print(f"\n[COURTRESERVE MEMBERS] Starting API calls to get members...")
-        raw_members = client.get_members_since(
-            start=start,
-            record_window_days=record_window_days,
-            page_size=page_size,
-            max_results=max_results,
-        )
+
+# Source timestamps behind each CourtReserve incremental filter, newest first
+COURTRESERVE_MEMBER_UPDATED_FIELDS = ("UpdatedOnUtc", "UpdatedOn", "CreatedOnUtc", "CreatedOn")
+COURTRESERVE_RESERVATION_UPDATED_FIELDS = ("UpdatedOnUtc", "CreatedOnUtc")
+COURTRESERVE_CANCELLATION_FIELDS = ("CancelledOnUtc", "CancelledOn")
+
+
+def _refresh_courtreserve_members_client(
+    client_code: str, dev_mode: bool, write_to_db: bool
+) -> None:
+    """Fetch, archive, normalize and load one CourtReserve client's members."""
+    from ingestion.courtreserve.member_mapper import map_member_to_row as map_cr_member
+
+    print(f"\n[COURTRESERVE MEMBERS] Processing client: {client_code}")
+    print("-" * 80)
+
+    client = _get_courtreserve_client(client_code)
+    sample_size = _get_sample_size()
+
+    # In dev mode, limit to 2000 records
+    if dev_mode:
+        max_results = 2000  # 2000 records for dev mode
+        record_window_days = 7  # Shorter window for dev
         print(
-            f"\n[COURTRESERVE MEMBERS] API calls complete: {len(raw_members)} total members retrieved"
+            f"[COURTRESERVE MEMBERS] DEV MODE: Pulling up to {max_results} members (last 7 days)"
         )
-        
-        # Store raw API responses
-        all_raw_members.extend(raw_members)
+    else:
+        max_results = sample_size
+        record_window_days = 21 if not sample_size else 7
 
-        print(f"\n[COURTRESERVE MEMBERS] Normalizing members...")
-        normalized_members = [
-            map_cr_member(m, facility_code=client_code) for m in raw_members
-        ]
+    watermark_key = f"{EltWatermarks.MEMBERS}__{client_code}"
+    watermark = _resolve_watermark(watermark_key)
+    print(f"[COURTRESERVE MEMBERS] Watermark for {client_code}: {watermark}")
+    start = watermark
+
+    if sample_size or dev_mode:
+        recent_start = datetime.now(timezone.utc) - timedelta(days=7)
+        start = max(start, recent_start)
         print(
-            f"[COURTRESERVE MEMBERS] Normalization complete: {len(raw_members)} raw → "
-            f"{len(normalized_members)} normalized"
+            f"[COURTRESERVE MEMBERS] Further adjusted start to {start} "
+            f"(last 7 days limit for dev/sample mode)"
         )
 
-        if max_results:
-            original_count = len(normalized_members)
-            normalized_members = normalized_members[:max_results]
-            if original_count > max_results:
-                print(
-                    f"[COURTRESERVE MEMBERS] Limited from {original_count} to {max_results} "
-                    f"due to max_results"
-                )
+    page_size = max_results or 1000
+    page_size = max(1, min(page_size, 1000))
 
-        if not normalized_members:
-            print(
-                f"[COURTRESERVE MEMBERS] No normalized members for {client_code}, skipping"
-            )
-            continue
+    print(
+        f"[COURTRESERVE MEMBERS] Configuration: page_size={page_size}, "
+        f"max_results={max_results}, record_window_days={record_window_days}, "
+        f"sample_size={sample_size}"
+    )
 
-        # Handle database operations based on flags
-        if not write_to_db:
-            print(
-                f"\n[COURTRESERVE MEMBERS] WRITE_TO_DB=false: Skipping database operations"
+    # Each window is loaded and checkpointed before the next one is fetched, so
+    # a failed run resumes at the first uncommitted window. Capped (dev/sample)
+    # pulls don't cover whole windows and are never checkpointed.
+    use_checkpoints = write_to_db and not max_results
+    if use_checkpoints:
+        start = _resume_from_checkpoint(EltWatermarks.MEMBERS, client_code, start)
+
+    if not write_to_db:
+        print(
+            f"\n[COURTRESERVE MEMBERS] WRITE_TO_DB=false: Skipping database operations"
+        )
+
+    print(f"\n[COURTRESERVE MEMBERS] Starting API calls to get members...")
+    raw_count = 0
+    normalized_count = 0
+    high_water_mark = None
+    with _raw_archive("courtreserve_members", client_code) as archive:
+        windows = client.iter_member_windows(
+            start,
+            record_window_days=record_window_days,
+            page_size=page_size,
+            max_results=max_results,
+        )
+        for window_start, window_end, window_members, pages in metrics.iter_stage(
+            metrics.FETCH, windows, count=lambda window: len(window[2])
+        ):
+            archive.write(window_members)
+            raw_count += len(window_members)
+            high_water_mark = _high_water_mark(
+                window_members, COURTRESERVE_MEMBER_UPDATED_FIELDS, high_water_mark
             )
-        else:
-            print(f"\n[COURTRESERVE MEMBERS] Replacing members in database...")
-            pg_client.replace_members_for_client(client_code, normalized_members)
+            with metrics.stage(metrics.NORMALIZE) as stage:
+                normalized_members = [
+                    map_cr_member(m, facility_code=client_code) for m in window_members
+                ]
+                stage.rows = len(normalized_members)
+            normalized_count += len(normalized_members)
+
+            if write_to_db and normalized_members:
+                print(f"\n[COURTRESERVE MEMBERS] Replacing members in database...")
+                _get_pg_client().replace_members_for_client(client_code, normalized_members)
+            if use_checkpoints:
+                _get_pg_client().save_checkpoint(
+                    EltWatermarks.MEMBERS,
+                    client_code,
+                    window_start,
+                    window_end,
+                    "committed",
+                    page=pages,
+                )
 
-            print(f"\n[COURTRESERVE MEMBERS] Updating watermark...")
-            pg_client.update_elt_watermark(watermark_key)
+    print(
+        f"\n[COURTRESERVE MEMBERS] API calls complete: {raw_count} raw → "
+        f"{normalized_count} normalized members"
+    )
 
+    if not normalized_count:
         print(
-            f"\n[COURTRESERVE MEMBERS] ✓ Complete for {client_code}: {len(normalized_members)} members processed"
+            f"[COURTRESERVE MEMBERS] No normalized members for {client_code}, skipping"
         )
-        print("-" * 80)
+        return
 
-    # Save raw API responses to JSON file for inspection (if enabled)
-    if save_to_json and all_raw_members:
-        import json
-        from pathlib import Path
+    if write_to_db:
+        print(f"\n[COURTRESERVE MEMBERS] Updating watermark to {high_water_mark}...")
+        _get_pg_client().update_elt_watermark(watermark_key, high_water_mark)
+        if use_checkpoints:
+            _get_pg_client().clear_checkpoints(EltWatermarks.MEMBERS, client_code)
 
-        Path(OUTPUT_DIR).mkdir(exist_ok=True)
-        output_file = Path(OUTPUT_DIR) / "courtreserve_members_raw_api_response.json"
-        
-        print(f"\n[COURTRESERVE MEMBERS] Saving raw API response to {output_file}...")
-        with open(output_file, "w") as f:
-            json.dump(all_raw_members, f, indent=2, default=str)
-        print(f"[COURTRESERVE MEMBERS] Saved {len(all_raw_members)} raw members to {output_file}")
+    print(
+        f"\n[COURTRESERVE MEMBERS] ✓ Complete for {client_code}: {normalized_count} members processed"
+    )
+    print("-" * 80)
 
-    print("\n" + "=" * 80)
-    print("[COURTRESERVE MEMBERS] All clients processed")
+
+def refresh_courtreserve_members(metadata: Optional[MetadataSnapshot] = None):
+    print("=" * 80)
+    print("[COURTRESERVE MEMBERS] Starting CourtReserve members ingestion")
     print("=" * 80)
 
+    # Determine mode and flags
+    dev_mode = _is_dev_mode()
+    write_to_db = _should_write_to_db()
+    save_to_json = _should_save_to_json()
+    
+    if dev_mode:
+        mode_str = "DEV MODE (limited records)"
+    else:
+        mode_str = "FULL REFRESH MODE"
+    
+    print(f"[COURTRESERVE MEMBERS] Mode: {mode_str}")
+    print(f"[COURTRESERVE MEMBERS] Write to DB: {write_to_db}")
+    print(f"[COURTRESERVE MEMBERS] Save to JSON: {save_to_json}")
+    print("=" * 80)
 
-def refresh_courtreserve_reservations():
-    for client_code in _get_courtreserve_client_codes():
-        client = _get_courtreserve_client(client_code)
-        watermark_key = f"{EltWatermarks.RESERVATIONS}__{client_code}"
-        watermark = _resolve_watermark(watermark_key)
+    results = run_for_clients(
+        "COURTRESERVE MEMBERS",
+        [
+            (client_code, dev_mode, write_to_db)
+            for client_code in _get_courtreserve_client_codes(metadata)
+        ],
+        _refresh_courtreserve_members_client,
+    )
 
-        reservations = client.get_reservations_by_updated_date(watermark)
+    print("\n" + "=" * 80)
+    print("[COURTRESERVE MEMBERS] All clients processed")
+    print("=" * 80)
+    raise_for_failures("COURTRESERVE MEMBERS", results)
+
+
+def _load_courtreserve_reservations_window(
+    client_code: str,
+    reservations: list[dict],
+    watermark: datetime,
+    watermark_key: str,
+    drop_known: bool = False,
+) -> None:
+    """Normalize and load one createdOrUpdatedOn window of CourtReserve reservations."""
+    from ingestion.courtreserve.reservation_helpers import (
+        normalize_reservations as normalize_cr_reservations,
+    )
 
-        # Log first 3 API results
-        print(f"\n[COURTRESERVE RESERVATIONS] First 3 API results:")
-        for i, res in enumerate(reservations[:1], 1):
-            print(f"  Result {i}: {res}")
-        if len(reservations) > 1:
-            print(f"  ... and {len(reservations) - 1} more results")
+    # Dump the first raw API result only when debugging
+    if reservations and logger.isEnabledFor(log.DEBUG):
+        logger.debug("[COURTRESERVE RESERVATIONS] First API result: %s", reservations[0])
 
+    with metrics.stage(metrics.NORMALIZE) as stage:
         normalized_reservations = normalize_cr_reservations(
             reservations, facility_code=client_code
         )
+        stage.rows = len(normalized_reservations)
+
+    cancelled_reservations_by_client: dict[str, set[str]] = {}
+    for record in normalized_reservations:
+        reservation_id = record.get("reservation_id")
+        cancelled_at = record.get("reservation_cancelled_at")
+        if reservation_id and cancelled_at:
+            key_client = record.get("client_code", client_code).lower()
+            cancelled_reservations_by_client.setdefault(key_client, set()).add(
+                reservation_id
+            )
 
-        cancelled_reservations_by_client: dict[str, set[str]] = {}
-        for record in normalized_reservations:
-            reservation_id = record.get("reservation_id")
-            cancelled_at = record.get("reservation_cancelled_at")
-            if reservation_id and cancelled_at:
-                key_client = record.get("client_code", client_code).lower()
-                cancelled_reservations_by_client.setdefault(key_client, set()).add(
-                    reservation_id
-                )
+    for (
+        cancelled_client,
+        reservation_ids,
+    ) in cancelled_reservations_by_client.items():
+        _get_pg_client().delete_reservations_for_ids(
+            cancelled_client, sorted(reservation_ids)
+        )
 
-        for (
-            cancelled_client,
-            reservation_ids,
-        ) in cancelled_reservations_by_client.items():
-            pg_client.delete_reservations_for_ids(
-                cancelled_client, sorted(reservation_ids)
+    if cancelled_reservations_by_client:
+        normalized_reservations = [
+            record
+            for record in normalized_reservations
+            if not (
+                record.get("reservation_id")
+                and record.get("client_code", client_code).lower()
+                in cancelled_reservations_by_client
+                and record.get("reservation_id")
+                in cancelled_reservations_by_client[
+                    record.get("client_code", client_code).lower()
+                ]
             )
+        ]
 
-        if cancelled_reservations_by_client:
-            normalized_reservations = [
-                record
-                for record in normalized_reservations
-                if not (
-                    record.get("reservation_id")
-                    and record.get("client_code", client_code).lower()
-                    in cancelled_reservations_by_client
-                    and record.get("reservation_id")
-                    in cancelled_reservations_by_client[
-                        record.get("client_code", client_code).lower()
-                    ]
-                )
-            ]
+    if drop_known:
+        normalized_reservations = _drop_known_rows(
+            normalized_reservations,
+            Tables.RESERVATIONS_RAW,
+            client_code,
+            watermark,
+            "COURTRESERVE RESERVATIONS",
+        )
 
-        if not normalized_reservations:
-            print(f"No reservations found for {client_code}")
-            pg_client.update_elt_watermark(watermark_key)
-            continue
+    if not normalized_reservations:
+        print(f"No reservations found for {client_code} in this window")
+        return
 
-        pg_client.insert_reservations(
-            normalized_reservations, Tables.RESERVATIONS_RAW_STG
-        )
-        pg_client.clean_stg_records_and_insert_prod(
+    # The STG table is shared by all clients and truncated after each load
+    with _get_pg_client().stg_lock(Tables.RESERVATIONS_RAW_STG):
+        with metrics.stage(metrics.STAGE_LOAD, rows=len(normalized_reservations)):
+            _get_pg_client().insert_reservations(
+                normalized_reservations, Tables.RESERVATIONS_RAW_STG
+            )
+        _get_pg_client().clean_stg_records_and_insert_prod(
             watermark,
             watermark_key,
             Tables.RESERVATIONS_RAW_STG,
             Tables.RESERVATIONS_RAW,
+            update_watermark=False,
         )
 
 
-def refresh_courtreserve_reservation_cancellations():
-    for client_code in _get_courtreserve_client_codes():
-        client = _get_courtreserve_client(client_code)
-        watermark_key = f"{EltWatermarks.RESERVATION_CANCELLATIONS}__{client_code}"
-        watermark = _resolve_watermark(watermark_key)
+def _refresh_courtreserve_reservations_client(client_code: str) -> None:
+    client = _get_courtreserve_client(client_code)
+    watermark_key = f"{EltWatermarks.RESERVATIONS}__{client_code}"
+    watermark = _resolve_watermark(watermark_key)
+
+    # Load and checkpoint window by window so a failed backfill resumes at the
+    # first uncommitted window; the watermark only moves once all are loaded
+    start = _resume_from_checkpoint(EltWatermarks.RESERVATIONS, client_code, watermark)
+    high_water_mark = None
+    with _raw_archive("courtreserve_reservations", client_code) as archive:
+        windows = client.iter_reservation_windows(start)
+        for window_start, window_end, reservations in metrics.iter_stage(
+            metrics.FETCH, windows, count=lambda window: len(window[2])
+        ):
+            archive.write(reservations)
+            high_water_mark = _high_water_mark(
+                reservations, COURTRESERVE_RESERVATION_UPDATED_FIELDS, high_water_mark
+            )
+            _load_courtreserve_reservations_window(
+                client_code, reservations, watermark, watermark_key, drop_known=True
+            )
+            _get_pg_client().save_checkpoint(
+                EltWatermarks.RESERVATIONS,
+                client_code,
+                window_start,
+                window_end,
+                "committed",
+            )
 
-        reservation_cancellations = client.get_reservation_cancellations(watermark)
-        normalized_reservation_cancellations = normalize_cr_cancellations(
-            reservation_cancellations, facility_code=client_code
-        )
+    _get_pg_client().update_elt_watermark(watermark_key, high_water_mark)
+    _get_pg_client().clear_checkpoints(EltWatermarks.RESERVATIONS, client_code)
 
-        if not normalized_reservation_cancellations:
-            print(f"No reservation cancellations found for {client_code}")
-            pg_client.update_elt_watermark(watermark_key)
-            continue
 
-        pg_client.insert_reservation_cancellations(
-            normalized_reservation_cancellations,
-            Tables.RESERVATION_CANCELLATIONS_RAW_STG,
-        )
-        pg_client.clean_stg_records_and_insert_prod(
+def refresh_courtreserve_reservations(metadata: Optional[MetadataSnapshot] = None):
+    results = run_for_clients(
+        "COURTRESERVE RESERVATIONS",
+        _get_courtreserve_client_codes(metadata),
+        _refresh_courtreserve_reservations_client,
+    )
+    raise_for_failures("COURTRESERVE RESERVATIONS", results)
+
+
+def _load_courtreserve_cancellations(
+    normalized_cancellations: list[dict], watermark: datetime, watermark_key: str
+) -> None:
+    """Stage normalized CourtReserve cancellations and promote them to PROD."""
+    # The STG table is shared by all clients and truncated after each load
+    with _get_pg_client().stg_lock(Tables.RESERVATION_CANCELLATIONS_RAW_STG):
+        with metrics.stage(metrics.STAGE_LOAD, rows=len(normalized_cancellations)):
+            _get_pg_client().insert_reservation_cancellations(
+                normalized_cancellations,
+                Tables.RESERVATION_CANCELLATIONS_RAW_STG,
+            )
+        _get_pg_client().clean_stg_records_and_insert_prod(
             watermark,
             watermark_key,
             Tables.RESERVATION_CANCELLATIONS_RAW_STG,
             Tables.RESERVATION_CANCELLATIONS_RAW,
+            update_watermark=False,
         )
 
 
-def refresh_podplay_reservations():
-    print("=" * 80)
-    print("[PODPLAY RESERVATIONS] Starting Podplay reservations ingestion")
-    print("=" * 80)
+def _refresh_courtreserve_reservation_cancellations_client(client_code: str) -> None:
+    from ingestion.courtreserve.reservation_cancellation_helpers import (
+        normalize_reservation_cancellations as normalize_cr_cancellations,
+    )
+
+    client = _get_courtreserve_client(client_code)
+    watermark_key = f"{EltWatermarks.RESERVATION_CANCELLATIONS}__{client_code}"
+    watermark = _resolve_watermark(watermark_key)
+
+    with metrics.stage(metrics.FETCH) as stage:
+        reservation_cancellations = client.get_reservation_cancellations(watermark)
+        stage.rows = len(reservation_cancellations)
+    with _raw_archive("courtreserve_reservation_cancellations", client_code) as archive:
+        archive.write(reservation_cancellations)
+    high_water_mark = _high_water_mark(
+        reservation_cancellations, COURTRESERVE_CANCELLATION_FIELDS
+    )
+    with metrics.stage(metrics.NORMALIZE) as stage:
+        normalized_reservation_cancellations = normalize_cr_cancellations(
+            reservation_cancellations, facility_code=client_code
+        )
+        stage.rows = len(normalized_reservation_cancellations)
+
+    normalized_reservation_cancellations = _drop_known_rows(
+        normalized_reservation_cancellations,
+        Tables.RESERVATION_CANCELLATIONS_RAW,
+        client_code,
+        watermark,
+        "COURTRESERVE RESERVATION CANCELLATIONS",
+    )
 
-    for client_code in _get_podplay_client_codes():
-        print(f"\n[PODPLAY RESERVATIONS] Processing client: {client_code}")
-        print("-" * 80)
+    if not normalized_reservation_cancellations:
+        print(f"No reservation cancellations found for {client_code}")
+        _get_pg_client().update_elt_watermark(watermark_key, high_water_mark)
+        return
 
-        client = _get_podplay_client(client_code)
-        watermark_key = f"{EltWatermarks.RESERVATIONS}__{client_code}"
-        watermark = _resolve_watermark(watermark_key)
-        print(f"[PODPLAY RESERVATIONS] Watermark for {client_code}: {watermark}")
+    _load_courtreserve_cancellations(
+        normalized_reservation_cancellations, watermark, watermark_key
+    )
+    _get_pg_client().update_elt_watermark(watermark_key, high_water_mark)
 
-        sample_size = _get_sample_size()
-        max_results = sample_size
-        page_size = max_results or 500
-        page_size = max(1, min(page_size, 500))
 
-        print(
-            f"[PODPLAY RESERVATIONS] Configuration: page_size={page_size}, "
-            f"max_results={max_results}, sample_size={sample_size}"
+def refresh_courtreserve_reservation_cancellations(metadata: Optional[MetadataSnapshot] = None):
+    results = run_for_clients(
+        "COURTRESERVE RESERVATION CANCELLATIONS",
+        _get_courtreserve_client_codes(metadata),
+        _refresh_courtreserve_reservation_cancellations_client,
+    )
+    raise_for_failures("COURTRESERVE RESERVATION CANCELLATIONS", results)
+
+
+def _load_podplay_reservations(
+    normalized_reservations: list[dict],
+    watermark: datetime,
+    watermark_key: str,
+    update_watermark: bool = True,
+) -> None:
+    """Stage normalized Podplay reservations and promote them to PROD."""
+    # The STG table is shared by all clients and truncated after each load
+    with _get_pg_client().stg_lock(Tables.RESERVATIONS_RAW_STG):
+        print(f"\n[PODPLAY RESERVATIONS] Inserting reservations into STG...")
+        with metrics.stage(metrics.STAGE_LOAD, rows=len(normalized_reservations)):
+            _get_pg_client().insert_reservations(
+                normalized_reservations, Tables.RESERVATIONS_RAW_STG
+            )
+
+        print(f"\n[PODPLAY RESERVATIONS] Cleaning STG and moving to PROD...")
+        _get_pg_client().clean_stg_records_and_insert_prod(
+            watermark,
+            watermark_key,
+            Tables.RESERVATIONS_RAW_STG,
+            Tables.RESERVATIONS_RAW,
+            update_watermark=update_watermark,
         )
 
-        if sample_size:
-            print(
-                f"[PODPLAY RESERVATIONS] Sample mode: will delete existing reservations for {client_code}"
-            )
 
-        print(f"\n[PODPLAY RESERVATIONS] Starting API calls to get events...")
+def _refresh_podplay_reservations_client(client_code: str) -> None:
+    from ingestion.podplay.reservations import (
+        normalize_event_reservations as normalize_podplay_reservations,
+    )
+
+    print(f"\n[PODPLAY RESERVATIONS] Processing client: {client_code}")
+    print("-" * 80)
+
+    client = _get_podplay_client(client_code)
+    watermark_key = f"{EltWatermarks.RESERVATIONS}__{client_code}"
+    watermark = _resolve_watermark(watermark_key)
+    print(f"[PODPLAY RESERVATIONS] Watermark for {client_code}: {watermark}")
+
+    sample_size = _get_sample_size()
+    max_results = sample_size
+    page_size = max_results or 500
+    page_size = max(1, min(page_size, 500))
+
+    print(
+        f"[PODPLAY RESERVATIONS] Configuration: page_size={page_size}, "
+        f"max_results={max_results}, sample_size={sample_size}"
+    )
+
+    if sample_size:
         print(
-            f"[PODPLAY RESERVATIONS] Filtering for type=REGULAR (court reservations only)"
+            f"[PODPLAY RESERVATIONS] Sample mode: will delete existing reservations for {client_code}"
         )
+
+    print(f"\n[PODPLAY RESERVATIONS] Starting API calls to get events...")
+    print(
+        f"[PODPLAY RESERVATIONS] Filtering for type=REGULAR (court reservations only)"
+    )
+    with metrics.stage(metrics.FETCH) as stage:
         events = client.get_reservations(
             start_time=watermark,
             page_size=page_size,
@@ -549,179 +852,172 @@ def refresh_podplay_reservations():
             ],
             event_type="REGULAR",  # Only get court reservations
         )
-        print(
-            f"\n[PODPLAY RESERVATIONS] API calls complete: {len(events)} total events retrieved"
-        )
-
-        # Log first 3 API results
-        print(f"\n[PODPLAY RESERVATIONS] First API results")
-        for i, event in enumerate(events[:1], 1):
-            print(f"  Result {i}: {event}")
-        if len(events) > 1:
-            print(f"  ... and {len(events) - 1} more results")
+        stage.rows = len(events)
+    print(
+        f"\n[PODPLAY RESERVATIONS] API calls complete: {len(events)} total events retrieved"
+    )
+    with _raw_archive("podplay_reservations", client_code) as archive:
+        archive.write(events)
 
-        print(f"\n[PODPLAY RESERVATIONS] Normalizing events to reservations...")
+    # Dump the first raw API result only when debugging
+    if events and logger.isEnabledFor(log.DEBUG):
+        logger.debug("[PODPLAY RESERVATIONS] First API result: %s", events[0])
+
+    print(f"\n[PODPLAY RESERVATIONS] Normalizing events to reservations...")
+    with metrics.stage(metrics.NORMALIZE) as stage:
         normalized_reservations = normalize_podplay_reservations(
             events, facility_code=client_code
         )
-        print(
-            f"[PODPLAY RESERVATIONS] Normalization complete: {len(events)} events → "
-            f"{len(normalized_reservations)} reservations"
-        )
-
-        if max_results:
-            original_count = len(normalized_reservations)
-            normalized_reservations = normalized_reservations[:max_results]
-            if original_count > max_results:
-                print(
-                    f"[PODPLAY RESERVATIONS] Limited from {original_count} to {max_results} "
-                    f"due to max_results"
-                )
-
-        if sample_size:
-            print(
-                f"\n[PODPLAY RESERVATIONS] Deleting existing reservations for {client_code} (sample mode)..."
-            )
-            pg_client.delete_reservations_for_client(client_code)
+        stage.rows = len(normalized_reservations)
+    print(
+        f"[PODPLAY RESERVATIONS] Normalization complete: {len(events)} events → "
+        f"{len(normalized_reservations)} reservations"
+    )
 
-        if not normalized_reservations:
+    if max_results:
+        original_count = len(normalized_reservations)
+        normalized_reservations = normalized_reservations[:max_results]
+        if original_count > max_results:
             print(
-                f"[PODPLAY RESERVATIONS] No normalized reservations for {client_code}, skipping"
+                f"[PODPLAY RESERVATIONS] Limited from {original_count} to {max_results} "
+                f"due to max_results"
             )
-            pg_client.update_elt_watermark(watermark_key)
-            continue
 
-        print(f"\n[PODPLAY RESERVATIONS] Inserting reservations into STG...")
-        pg_client.insert_reservations(
-            normalized_reservations, Tables.RESERVATIONS_RAW_STG
+    if sample_size:
+        print(
+            f"\n[PODPLAY RESERVATIONS] Deleting existing reservations for {client_code} (sample mode)..."
         )
-
-        print(f"\n[PODPLAY RESERVATIONS] Cleaning STG and moving to PROD...")
-        pg_client.clean_stg_records_and_insert_prod(
-            watermark,
-            watermark_key,
-            Tables.RESERVATIONS_RAW_STG,
+        _get_pg_client().delete_reservations_for_client(client_code)
+    else:
+        normalized_reservations = _drop_known_rows(
+            normalized_reservations,
             Tables.RESERVATIONS_RAW,
+            client_code,
+            watermark,
+            "PODPLAY RESERVATIONS",
         )
 
+    if not normalized_reservations:
         print(
-            f"\n[PODPLAY RESERVATIONS] ✓ Complete for {client_code}: {len(normalized_reservations)} reservations processed"
+            f"[PODPLAY RESERVATIONS] No normalized reservations for {client_code}, skipping"
         )
-        print("-" * 80)
+        _get_pg_client().update_elt_watermark(watermark_key)
+        return
+
+    _load_podplay_reservations(normalized_reservations, watermark, watermark_key)
+
+    print(
+        f"\n[PODPLAY RESERVATIONS] ✓ Complete for {client_code}: {len(normalized_reservations)} reservations processed"
+    )
+    print("-" * 80)
+
+
+def refresh_podplay_reservations(metadata: Optional[MetadataSnapshot] = None):
+    print("=" * 80)
+    print("[PODPLAY RESERVATIONS] Starting Podplay reservations ingestion")
+    print("=" * 80)
+
+    results = run_for_clients(
+        "PODPLAY RESERVATIONS",
+        _get_podplay_client_codes(metadata),
+        _refresh_podplay_reservations_client,
+    )
 
     print("\n" + "=" * 80)
     print("[PODPLAY RESERVATIONS] All clients processed")
     print("=" * 80)
+    raise_for_failures("PODPLAY RESERVATIONS", results)
 
 
-def refresh_podplay_members():
-    print("=" * 80)
-    print("[PODPLAY MEMBERS] Starting Podplay members ingestion")
-    print("=" * 80)
+def _refresh_podplay_members_client(
+    client_code: str, dev_mode: bool, incremental_mode: bool, write_to_db: bool
+) -> None:
+    """Fetch, archive, normalize and load one Podplay client's members."""
+    from ingestion.podplay.members import normalize_members as normalize_podplay_members
 
-    # Determine mode upfront for header
-    dev_mode = _is_dev_mode()
-    incremental_mode = _is_incremental_mode()
-    write_to_db = _should_write_to_db()
-    save_to_json = _should_save_to_json()
-    
+    print(f"\n[PODPLAY MEMBERS] Processing client: {client_code}")
+    print("-" * 80)
+
+    client = _get_podplay_client(client_code)
+    watermark_key = f"{EltWatermarks.MEMBERS}__{client_code}"
+    watermark = _resolve_watermark(watermark_key)
+    print(f"[PODPLAY MEMBERS] Watermark for {client_code}: {watermark}")
+
+    sample_size = _get_sample_size()
+
+    # In dev mode, limit to 2000 records
     if dev_mode:
-        mode_str = "DEV MODE (first page only)"
-    elif incremental_mode:
-        mode_str = "INCREMENTAL MODE (recent members only)"
+        page_size = 500  # Default page size
+        max_results = 2000  # 2000 records for dev mode
+        print(
+            f"[PODPLAY MEMBERS] DEV MODE: Pulling up to {max_results} members"
+        )
     else:
-        mode_str = "FULL REFRESH MODE (all members)"
-    
-    print(f"[PODPLAY MEMBERS] Mode: {mode_str}")
-    print(f"[PODPLAY MEMBERS] Write to DB: {write_to_db}")
-    print(f"[PODPLAY MEMBERS] Save to JSON: {save_to_json}")
-    print("=" * 80)
+        max_results = sample_size
+        # Use larger page size for full pulls to reduce API calls (14k members = ~28 calls at 500/page)
+        page_size = max_results or 500
+        page_size = max(1, min(page_size, 500))  # Cap at 500 to be safe
+
+    print(
+        f"[PODPLAY MEMBERS] Configuration: page_size={page_size}, "
+        f"max_results={max_results}, sample_size={sample_size}"
+    )
 
-    all_raw_users = []  # Store raw API responses
+    # Set up incremental mode processing
+    if incremental_mode and not dev_mode:
+        recent_minutes = _get_recent_members_minutes()
+        now = datetime.now(timezone.utc)
 
-    for client_code in _get_podplay_client_codes():
-        print(f"\n[PODPLAY MEMBERS] Processing client: {client_code}")
-        print("-" * 80)
+        # Use watermark as reference point, look back 90 minutes before it for the start
+        watermark_ref = watermark if watermark else now
+        window_start = watermark_ref - timedelta(minutes=recent_minutes)
 
-        client = _get_podplay_client(client_code)
-        watermark_key = f"{EltWatermarks.MEMBERS}__{client_code}"
-        watermark = _resolve_watermark(watermark_key)
-        print(f"[PODPLAY MEMBERS] Watermark for {client_code}: {watermark}")
+        # Process in 30-day windows to avoid huge date ranges
+        window_days = 30
+        all_users = []
+        window_num = 0
 
-        sample_size = _get_sample_size()
-        
-        # In dev mode, limit to 2000 records
-        if dev_mode:
-            page_size = 500  # Default page size
-            max_results = 2000  # 2000 records for dev mode
+        print(f"\n[PODPLAY MEMBERS] INCREMENTAL MODE Configuration:")
+        print(f"  - Using tenureMin/tenureMax (membership tenure) for incremental filtering")
+        print(f"  - This filters by when their current membership started (catches membership changes/updates)")
+        print(f"  - Processing in {window_days}-day windows to handle large time gaps")
+        if watermark:
+            print(
+                f"  - Watermark: {watermark.isoformat()}"
+            )
             print(
-                f"[PODPLAY MEMBERS] DEV MODE: Pulling up to {max_results} members"
+                f"  - Start: {window_start.isoformat()} (watermark - {recent_minutes} min)"
             )
         else:
-            max_results = sample_size
-            # Use larger page size for full pulls to reduce API calls (14k members = ~28 calls at 500/page)
-            page_size = max_results or 500
-            page_size = max(1, min(page_size, 500))  # Cap at 500 to be safe
-
-        print(
-            f"[PODPLAY MEMBERS] Configuration: page_size={page_size}, "
-            f"max_results={max_results}, sample_size={sample_size}"
-        )
-        
-        # Set up incremental mode processing
-        if incremental_mode and not dev_mode:
-            recent_minutes = _get_recent_members_minutes()
-            now = datetime.now(timezone.utc)
-            
-            # Use watermark as reference point, look back 90 minutes before it for the start
-            watermark_ref = watermark if watermark else now
-            window_start = watermark_ref - timedelta(minutes=recent_minutes)
-            
-            # Process in 30-day windows to avoid huge date ranges
-            window_days = 30
-            all_users = []
-            window_num = 0
-            
-            print(f"\n[PODPLAY MEMBERS] INCREMENTAL MODE Configuration:")
-            print(f"  - Using tenureMin/tenureMax (membership tenure) for incremental filtering")
-            print(f"  - This filters by when their current membership started (catches membership changes/updates)")
-            print(f"  - Processing in {window_days}-day windows to handle large time gaps")
-            if watermark:
-                print(
-                    f"  - Watermark: {watermark.isoformat()}"
-                )
-                print(
-                    f"  - Start: {window_start.isoformat()} (watermark - {recent_minutes} min)"
-                )
-            else:
-                print(
-                    f"  - Watermark: None (first run)"
-                )
-                print(
-                    f"  - Start: {window_start.isoformat()} (now - {recent_minutes} min)"
-                )
             print(
-                f"  - End: {now.isoformat()} (now)"
+                f"  - Watermark: None (first run)"
             )
             print(
-                f"  - Pagination: page_size={page_size}, max_results={max_results if max_results else 'unlimited'}"
+                f"  - Start: {window_start.isoformat()} (now - {recent_minutes} min)"
             )
-            
-            # Process date windows
-            for window_start_date in _generate_date_windows(window_start, window_days):
-                if window_start_date > now:
-                    break
-                    
-                window_num += 1
-                window_end_date = min(now, window_start_date + timedelta(days=window_days))
-                
-                print(
-                    f"\n[PODPLAY MEMBERS] Processing window {window_num}: "
-                    f"{window_start_date.isoformat()} to {window_end_date.isoformat()} "
-                    f"(so far {len(all_users)} total users)"
-                )
-                
-                # Get users for this window
+        print(
+            f"  - End: {now.isoformat()} (now)"
+        )
+        print(
+            f"  - Pagination: page_size={page_size}, max_results={max_results if max_results else 'unlimited'}"
+        )
+
+        # Process date windows
+        for window_start_date in _generate_date_windows(window_start, window_days):
+            if window_start_date > now:
+                break
+
+            window_num += 1
+            window_end_date = min(now, window_start_date + timedelta(days=window_days))
+
+            print(
+                f"\n[PODPLAY MEMBERS] Processing window {window_num}: "
+                f"{window_start_date.isoformat()} to {window_end_date.isoformat()} "
+                f"(so far {len(all_users)} total users)"
+            )
+
+            # Get users for this window
+            with metrics.stage(metrics.FETCH) as stage:
                 window_users = client.get_users(
                     page_size=page_size,
                     max_results=max_results,  # This will limit per window, but we'll collect all
@@ -729,155 +1025,223 @@ def refresh_podplay_members():
                     tenure_min=window_start_date,
                     tenure_max=window_end_date,
                 )
-                
-                all_users.extend(window_users)
-                print(
-                    f"[PODPLAY MEMBERS] Window {window_num}: added {len(window_users)} users | "
-                    f"total so far: {len(all_users)}"
-                )
-                
-                # If we hit max_results across all windows, stop
-                if max_results and len(all_users) >= max_results:
-                    all_users = all_users[:max_results]
-                    print(
-                        f"[PODPLAY MEMBERS] Reached max_results limit ({max_results}), stopping window processing"
-                    )
-                    break
-            
-            users = all_users
-            
-            print(
-                f"\n[PODPLAY MEMBERS] INCREMENTAL MODE API Summary:"
-            )
-            print(
-                f"  - Processed {window_num} date window(s)"
-            )
-            print(
-                f"  - Total users retrieved: {len(users)}"
-            )
+                stage.rows = len(window_users)
+
+            all_users.extend(window_users)
             print(
-                f"  - These users will be upserted (existing members preserved)"
+                f"[PODPLAY MEMBERS] Window {window_num}: added {len(window_users)} users | "
+                f"total so far: {len(all_users)}"
             )
-        else:
-            # For full refresh or dev mode, process normally
-            if not dev_mode:
-                print(f"\n[PODPLAY MEMBERS] FULL REFRESH MODE Configuration:")
-                print(f"  - Filtering: None (pulling ALL members)")
-                if not max_results:
-                    estimated_calls = 14000 // page_size + 1
-                    print(
-                        f"  - Estimated API calls: ~{estimated_calls} (for ~14k members at {page_size} per page)"
-                    )
+
+            # If we hit max_results across all windows, stop
+            if max_results and len(all_users) >= max_results:
+                all_users = all_users[:max_results]
+                print(
+                    f"[PODPLAY MEMBERS] Reached max_results limit ({max_results}), stopping window processing"
+                )
+                break
+
+        users = all_users
+
+        print(
+            f"\n[PODPLAY MEMBERS] INCREMENTAL MODE API Summary:"
+        )
+        print(
+            f"  - Processed {window_num} date window(s)"
+        )
+        print(
+            f"  - Total users retrieved: {len(users)}"
+        )
+        print(
+            f"  - These users will be upserted (existing members preserved)"
+        )
+    else:
+        # For full refresh or dev mode, process normally
+        if not dev_mode:
+            print(f"\n[PODPLAY MEMBERS] FULL REFRESH MODE Configuration:")
+            print(f"  - Filtering: None (pulling ALL members)")
+            if not max_results:
+                estimated_calls = 14000 // page_size + 1
                 print(
-                    f"  - Pagination: page_size={page_size}, max_results={max_results if max_results else 'unlimited'}"
+                    f"  - Estimated API calls: ~{estimated_calls} (for ~14k members at {page_size} per page)"
                 )
-            
-            print(f"\n[PODPLAY MEMBERS] Starting API calls to get users...")
+            print(
+                f"  - Pagination: page_size={page_size}, max_results={max_results if max_results else 'unlimited'}"
+            )
+
+        print(f"\n[PODPLAY MEMBERS] Starting API calls to get users...")
+        with metrics.stage(metrics.FETCH) as stage:
             users = client.get_users(
                 page_size=page_size,
                 max_results=max_results,
                 expand=["items._links.phoneNumber", "items._links.profile"],
             )
-            
-            if not dev_mode:
-                print(
-                    f"\n[PODPLAY MEMBERS] API calls complete: {len(users)} total users retrieved"
-                )
+            stage.rows = len(users)
 
+        if not dev_mode:
+            print(
+                f"\n[PODPLAY MEMBERS] API calls complete: {len(users)} total users retrieved"
+            )
 
-        # Save raw API response for inspection (only when running locally)
-        all_raw_users.extend(users)
+    with _raw_archive("podplay_members", client_code) as archive:
+        archive.write(users)
 
-        print(f"\n[PODPLAY MEMBERS] Normalizing users...")
+    print(f"\n[PODPLAY MEMBERS] Normalizing users...")
+    with metrics.stage(metrics.NORMALIZE) as stage:
         normalized_members = normalize_podplay_members(users, facility_code=client_code)
-        
-        # Deduplicate members by (client_code, member_id) to avoid ON CONFLICT errors
-        # This can happen when processing multiple date windows - same member can appear in multiple windows
+        stage.rows = len(normalized_members)
+
+    # Deduplicate members by (client_code, member_id) to avoid ON CONFLICT errors
+    # This can happen when processing multiple date windows - same member can appear in multiple windows
+    original_count = len(normalized_members)
+    seen = {}
+    deduplicated_members = []
+    for member in normalized_members:
+        key = (member["client_code"], member["member_id"])
+        if key not in seen:
+            seen[key] = True
+            deduplicated_members.append(member)
+        # If duplicate, keep the last one (or we could keep the first - doesn't matter much)
+
+    if len(deduplicated_members) < original_count:
+        print(
+            f"[PODPLAY MEMBERS] Deduplicated: {original_count} → {len(deduplicated_members)} members "
+            f"({original_count - len(deduplicated_members)} duplicates removed)"
+        )
+    normalized_members = deduplicated_members
+
+    if max_results:
         original_count = len(normalized_members)
-        seen = {}
-        deduplicated_members = []
-        for member in normalized_members:
-            key = (member["client_code"], member["member_id"])
-            if key not in seen:
-                seen[key] = True
-                deduplicated_members.append(member)
-            # If duplicate, keep the last one (or we could keep the first - doesn't matter much)
-        
-        if len(deduplicated_members) < original_count:
+        normalized_members = normalized_members[:max_results]
+        if original_count > max_results:
             print(
-                f"[PODPLAY MEMBERS] Deduplicated: {original_count} → {len(deduplicated_members)} members "
-                f"({original_count - len(deduplicated_members)} duplicates removed)"
+                f"[PODPLAY MEMBERS] Limited from {original_count} to {max_results} "
+                f"due to max_results"
             )
-        normalized_members = deduplicated_members
-
-        if max_results:
-            original_count = len(normalized_members)
-            normalized_members = normalized_members[:max_results]
-            if original_count > max_results:
-                print(
-                    f"[PODPLAY MEMBERS] Limited from {original_count} to {max_results} "
-                    f"due to max_results"
-                )
 
-        # Handle database operations based on flags
-        if not write_to_db:
+    # Handle database operations based on flags
+    if not write_to_db:
+        print(
+            f"\n[PODPLAY MEMBERS] WRITE_TO_DB=false: Skipping database operations"
+        )
+    else:
+        if not normalized_members:
             print(
-                f"\n[PODPLAY MEMBERS] WRITE_TO_DB=false: Skipping database operations"
+                f"[PODPLAY MEMBERS] No normalized members for {client_code}, skipping database insert"
             )
         else:
-            if not normalized_members:
-                print(
-                    f"[PODPLAY MEMBERS] No normalized members for {client_code}, skipping database insert"
-                )
+            if incremental_mode:
+                # For incremental mode, use STG → PROD pattern with upsert (ON CONFLICT) 
+                # to update/add members without deleting others
+                print(f"\n[PODPLAY MEMBERS] Upserting members in database (incremental mode, via STG)...")
+                # Use replace_members_for_client which follows STG → PROD pattern
+                # It clears STG for client, inserts batch into STG, then upserts into PROD
+                _get_pg_client().replace_members_for_client(client_code, normalized_members)
+                print(f"[PODPLAY MEMBERS] Upserted {len(normalized_members)} members via STG (existing members preserved)")
             else:
-                if incremental_mode:
-                    # For incremental mode, use STG → PROD pattern with upsert (ON CONFLICT) 
-                    # to update/add members without deleting others
-                    print(f"\n[PODPLAY MEMBERS] Upserting members in database (incremental mode, via STG)...")
-                    # Use replace_members_for_client which follows STG → PROD pattern
-                    # It clears STG for client, inserts batch into STG, then upserts into PROD
-                    pg_client.replace_members_for_client(client_code, normalized_members)
-                    print(f"[PODPLAY MEMBERS] Upserted {len(normalized_members)} members via STG (existing members preserved)")
-                else:
-                    # For full refresh, replace all members for this client (also via STG → PROD)
-                    print(f"\n[PODPLAY MEMBERS] Replacing members in database (full refresh, via STG)...")
-                    pg_client.replace_members_for_client(client_code, normalized_members)
-
-            # Always update watermark if writing to DB, even if no new members - tracks that we ran successfully
-            if write_to_db:
-                print(f"\n[PODPLAY MEMBERS] Updating watermark...")
-                pg_client.update_elt_watermark(watermark_key)
+                # For full refresh, replace all members for this client (also via STG → PROD)
+                print(f"\n[PODPLAY MEMBERS] Replacing members in database (full refresh, via STG)...")
+                _get_pg_client().replace_members_for_client(client_code, normalized_members)
 
-        print(
-            f"\n[PODPLAY MEMBERS] ✓ Complete for {client_code}: {len(normalized_members)} members processed"
-        )
-        print("-" * 80)
+        # Always update watermark if writing to DB, even if no new members - tracks that we ran successfully
+        if write_to_db:
+            print(f"\n[PODPLAY MEMBERS] Updating watermark...")
+            _get_pg_client().update_elt_watermark(watermark_key)
 
-    # Save raw API responses to JSON file for inspection (if enabled)
-    if save_to_json and all_raw_users:
-        import json
+    print(
+        f"\n[PODPLAY MEMBERS] ✓ Complete for {client_code}: {len(normalized_members)} members processed"
+    )
+    print("-" * 80)
 
-        raw_output_file = os.path.join(
-            OUTPUT_DIR, "podplay_members_raw_api_response.json"
-        )
-        with open(raw_output_file, "w") as f:
-            json.dump(all_raw_users, f, indent=2, default=str)
-        print(
-            f"\n[PODPLAY MEMBERS] Saved {len(all_raw_users)} raw API users to {raw_output_file}"
-        )
+
+def refresh_podplay_members(
+    metadata: Optional[MetadataSnapshot] = None, incremental: Optional[bool] = None
+):
+    print("=" * 80)
+    print("[PODPLAY MEMBERS] Starting Podplay members ingestion")
+    print("=" * 80)
+
+    # Determine mode upfront for header
+    dev_mode = _is_dev_mode()
+    incremental_mode = _is_incremental_mode() if incremental is None else incremental
+    write_to_db = _should_write_to_db()
+    save_to_json = _should_save_to_json()
+    
+    if dev_mode:
+        mode_str = "DEV MODE (first page only)"
+    elif incremental_mode:
+        mode_str = "INCREMENTAL MODE (recent members only)"
+    else:
+        mode_str = "FULL REFRESH MODE (all members)"
+    
+    print(f"[PODPLAY MEMBERS] Mode: {mode_str}")
+    print(f"[PODPLAY MEMBERS] Write to DB: {write_to_db}")
+    print(f"[PODPLAY MEMBERS] Save to JSON: {save_to_json}")
+    print("=" * 80)
+
+    results = run_for_clients(
+        "PODPLAY MEMBERS",
+        [
+            (client_code, dev_mode, incremental_mode, write_to_db)
+            for client_code in _get_podplay_client_codes(metadata)
+        ],
+        _refresh_podplay_members_client,
+    )
 
     print("\n" + "=" * 80)
     print("[PODPLAY MEMBERS] All clients processed")
     print("=" * 80)
+    raise_for_failures("PODPLAY MEMBERS", results)
+
+
+def _refresh_podplay_events_client(
+    client_code: str, pod_id: Optional[str], start_time: datetime, end_time: datetime
+) -> list[dict]:
+    """Fetch, archive and normalize one Podplay client's events; returns normalized."""
+    from ingestion.events.podplay_events import normalize_podplay_events
+
+    print(f"\n[PODPLAY EVENTS] Processing {client_code} (pod_id: {pod_id})...")
+
+    client = _get_podplay_client(client_code)
+
+    # Get events with all types
+    with metrics.stage(metrics.FETCH) as stage:
+        events = client.get_events(
+            start_time=start_time,
+            end_time=end_time,
+            event_types=["REGULAR", "CLASS", "EVENT"],
+            pod_id=pod_id,
+        )
+        stage.rows = len(events)
+
+    print(f"[PODPLAY EVENTS] Retrieved {len(events)} events for {client_code}")
+    with _raw_archive("podplay_events", client_code) as archive:
+        archive.write(events)
+
+    # Normalize events
+    with metrics.stage(metrics.NORMALIZE) as stage:
+        normalized = normalize_podplay_events(events, client_code)
+        stage.rows = len(normalized)
+
+    print(
+        f"[PODPLAY EVENTS] Normalized {len(normalized)} events for {client_code}"
+    )
+
+    # Update watermark for this client
+    watermark_key = f"events__{client_code}"
+    _get_pg_client().update_elt_watermark(watermark_key)
+    print(f"[PODPLAY EVENTS] Updated watermark for {watermark_key}")
+
+    return normalized
 
 
-def refresh_podplay_events():
+def refresh_podplay_events(metadata: Optional[MetadataSnapshot] = None):
     """Refresh Podplay events for all participating facilities."""
     print("=" * 80)
     print("[PODPLAY EVENTS] Starting Podplay events ingestion")
     print("=" * 80)
 
-    clients_with_pod_ids = _get_podplay_clients_with_pod_ids()
+    clients_with_pod_ids = _get_podplay_clients_with_pod_ids(metadata)
     if not clients_with_pod_ids:
         print("[PODPLAY EVENTS] No Podplay clients found, skipping")
         return
@@ -887,61 +1251,24 @@ def refresh_podplay_events():
     end_time = now + timedelta(days=7)
 
     all_events = []
-    all_raw_events = []  # Store raw API responses
-
-    for client_code, pod_id in clients_with_pod_ids:
-        print(f"\n[PODPLAY EVENTS] Processing {client_code} (pod_id: {pod_id})...")
-
-        try:
-            client = _get_podplay_client(client_code)
-
-            # Get events with all types
-            events = client.get_events(
-                start_time=now,
-                end_time=end_time,
-                event_types=["REGULAR", "CLASS", "EVENT"],
-                pod_id=pod_id,
-            )
 
-            print(f"[PODPLAY EVENTS] Retrieved {len(events)} events for {client_code}")
-
-            # Save raw API response for inspection
-            all_raw_events.extend(events)
-
-            # Normalize events
-            normalized = normalize_podplay_events(events, client_code)
-            all_events.extend(normalized)
-
-            print(
-                f"[PODPLAY EVENTS] Normalized {len(normalized)} events for {client_code}"
-            )
-
-            # Update watermark for this client
-            watermark_key = f"events__{client_code}"
-            pg_client.update_elt_watermark(watermark_key)
-            print(f"[PODPLAY EVENTS] Updated watermark for {watermark_key}")
-
-        except Exception as e:
-            print(
-                f"[PODPLAY EVENTS] Error processing {client_code}: {e}", file=sys.stderr
-            )
-            continue
+    results = run_for_clients(
+        "PODPLAY EVENTS",
+        [
+            (client_code, pod_id, now, end_time)
+            for client_code, pod_id in clients_with_pod_ids
+        ],
+        _refresh_podplay_events_client,
+    )
+    for result in results:
+        if result.ok:
+            all_events.extend(result.value)
 
-    # Save raw API responses to JSON file for inspection (only when running locally)
+    # Save normalized events to JSON file for inspection (only when running locally)
     if _is_running_locally():
         import json
 
-        raw_output_file = os.path.join(
-            OUTPUT_DIR, "podplay_events_raw_api_response.json"
-        )
-        with open(raw_output_file, "w") as f:
-            json.dump(all_raw_events, f, indent=2, default=str)
-        print(
-            f"\n[PODPLAY EVENTS] Saved {len(all_raw_events)} raw API events to {raw_output_file}"
-        )
-
-        # Save normalized events to JSON file for inspection
-        output_file = os.path.join(OUTPUT_DIR, "podplay_events_output.json")
+        output_file = _output_path("podplay_events_output.json")
         with open(output_file, "w") as f:
             json.dump(all_events, f, indent=2, default=str)
         print(
@@ -951,22 +1278,71 @@ def refresh_podplay_events():
     # Insert into database
     if all_events:
         print(f"\n[PODPLAY EVENTS] Inserting {len(all_events)} events into database...")
-        pg_client.insert_events(all_events)
+        _get_pg_client().insert_events(all_events)
         print(f"[PODPLAY EVENTS] ✓ Complete: {len(all_events)} events inserted")
     else:
         print("[PODPLAY EVENTS] No events to insert")
 
     print("[PODPLAY EVENTS] All clients processed")
     print("=" * 80)
+    raise_for_failures("PODPLAY EVENTS", results)
+
+
+def _refresh_courtreserve_events_client(
+    client_code: str, start_date: datetime, end_date: datetime
+) -> list[dict]:
+    """Fetch, archive and normalize one CourtReserve client's events; returns normalized."""
+    from ingestion.events.courtreserve_events import normalize_courtreserve_events
+
+    print(f"\n[COURTRESERVE EVENTS] Processing {client_code}...")
+
+    client = _get_courtreserve_client(client_code)
+
+    # Get events
+    with metrics.stage(metrics.FETCH) as stage:
+        events = client.get_events(
+            start_date=start_date,
+            end_date=end_date,
+        )
+        stage.rows = len(events)
+
+    print(
+        f"[COURTRESERVE EVENTS] Retrieved {len(events)} events for {client_code}"
+    )
+    with _raw_archive("courtreserve_events", client_code) as archive:
+        archive.write(events)
+
+    # Normalize events
+    with metrics.stage(metrics.NORMALIZE) as stage:
+        event_categories = _get_event_category_cache().get(
+            client_code,
+            "courtreserve",
+            expected_ids=[event.get("EventCategoryId") for event in events],
+        )
+        normalized = normalize_courtreserve_events(
+            events, client_code, event_categories=event_categories
+        )
+        stage.rows = len(normalized)
+
+    print(
+        f"[COURTRESERVE EVENTS] Normalized {len(normalized)} events for {client_code}"
+    )
+
+    # Update watermark for this client
+    watermark_key = f"events__{client_code}"
+    _get_pg_client().update_elt_watermark(watermark_key)
+    print(f"[COURTRESERVE EVENTS] Updated watermark for {watermark_key}")
+
+    return normalized
 
 
-def refresh_courtreserve_events():
+def refresh_courtreserve_events(metadata: Optional[MetadataSnapshot] = None):
     """Refresh CourtReserve events for all participating facilities."""
     print("=" * 80)
     print("[COURTRESERVE EVENTS] Starting CourtReserve events ingestion")
     print("=" * 80)
 
-    client_codes = _get_courtreserve_client_codes()
+    client_codes = _get_courtreserve_client_codes(metadata)
     if not client_codes:
         print("[COURTRESERVE EVENTS] No CourtReserve clients found, skipping")
         return
@@ -976,62 +1352,21 @@ def refresh_courtreserve_events():
     end_date = now + timedelta(days=7)
 
     all_events = []
-    all_raw_events = []  # Store raw API responses
-
-    for client_code in client_codes:
-        print(f"\n[COURTRESERVE EVENTS] Processing {client_code}...")
-
-        try:
-            client = _get_courtreserve_client(client_code)
-
-            # Get events
-            events = client.get_events(
-                start_date=now,
-                end_date=end_date,
-            )
-
-            print(
-                f"[COURTRESERVE EVENTS] Retrieved {len(events)} events for {client_code}"
-            )
 
-            # Save raw API response for inspection
-            all_raw_events.extend(events)
-
-            # Normalize events
-            normalized = normalize_courtreserve_events(events, client_code)
-            all_events.extend(normalized)
-
-            print(
-                f"[COURTRESERVE EVENTS] Normalized {len(normalized)} events for {client_code}"
-            )
-
-            # Update watermark for this client
-            watermark_key = f"events__{client_code}"
-            pg_client.update_elt_watermark(watermark_key)
-            print(f"[COURTRESERVE EVENTS] Updated watermark for {watermark_key}")
-
-        except Exception as e:
-            print(
-                f"[COURTRESERVE EVENTS] Error processing {client_code}: {e}",
-                file=sys.stderr,
-            )
-            continue
+    results = run_for_clients(
+        "COURTRESERVE EVENTS",
+        [(client_code, now, end_date) for client_code in client_codes],
+        _refresh_courtreserve_events_client,
+    )
+    for result in results:
+        if result.ok:
+            all_events.extend(result.value)
 
-    # Save raw API responses to JSON file for inspection (only when running locally)
+    # Save normalized events to JSON file for inspection (only when running locally)
     if _is_running_locally():
         import json
 
-        raw_output_file = os.path.join(
-            OUTPUT_DIR, "courtreserve_events_raw_api_response.json"
-        )
-        with open(raw_output_file, "w") as f:
-            json.dump(all_raw_events, f, indent=2, default=str)
-        print(
-            f"\n[COURTRESERVE EVENTS] Saved {len(all_raw_events)} raw API events to {raw_output_file}"
-        )
-
-        # Save normalized events to JSON file for inspection
-        output_file = os.path.join(OUTPUT_DIR, "courtreserve_events_output.json")
+        output_file = _output_path("courtreserve_events_output.json")
         with open(output_file, "w") as f:
             json.dump(all_events, f, indent=2, default=str)
         print(
@@ -1078,7 +1413,7 @@ def refresh_courtreserve_events():
                     {"key": key, "count": len(duplicates), "events": duplicates}
                 )
 
-            dup_file = os.path.join(OUTPUT_DIR, "courtreserve_events_duplicates.json")
+            dup_file = _output_path("courtreserve_events_duplicates.json")
             with open(dup_file, "w") as f:
                 json.dump(duplicate_analysis, f, indent=2, default=str)
             print(f"[COURTRESERVE EVENTS] Saved duplicate analysis to {dup_file}")
@@ -1088,154 +1423,271 @@ def refresh_courtreserve_events():
         print(
             f"\n[COURTRESERVE EVENTS] Inserting {len(all_events)} events into database..."
         )
-        pg_client.insert_events(all_events)
+        _get_pg_client().insert_events(all_events)
         print(f"[COURTRESERVE EVENTS] ✓ Complete: {len(all_events)} events inserted")
     else:
         print("[COURTRESERVE EVENTS] No events to insert")
 
     print("[COURTRESERVE EVENTS] All clients processed")
     print("=" * 80)
+    raise_for_failures("COURTRESERVE EVENTS", results)
+
+
+def _replace_court_availability(
+    label: str, client_code: str, source_system: str, slots: list[dict]
+) -> None:
+    """Replace one client's rows in facility_court_availabilities with slots."""
+    pg_client = _get_pg_client()
+    with metrics.stage(metrics.PROMOTE, rows=len(slots)):
+        # Each client's rows live in their own list partition, cleared with
+        # TRUNCATE rather than a DELETE
+        pg_client.ensure_client_partition(
+            Tables.FACILITY_COURT_AVAILABILITIES, client_code
+        )
+        # One transaction: the clear commits with the new slots (or on its own
+        # when there are none), and an error rolls it back, releasing the
+        # TRUNCATE's lock on the partition
+        with pg_client._connect() as conn, conn.cursor() as cur:
+            deleted_count = pg_client.clear_client_partition(
+                cur, Tables.FACILITY_COURT_AVAILABILITIES, client_code, source_system
+            )
+            print(f"[{label}] Deleted {deleted_count} old records for {client_code}")
 
+            # Insert new records for this client
+            if slots:
+                rows = [
+                    (
+                        slot["client_code"],
+                        slot["source_system"],
+                        slot["court_id"],
+                        slot["court_name"],
+                        slot["slot_start"],
+                        slot["slot_end"],
+                        slot.get("period_type"),
+                    )
+                    for slot in slots
+                ]
 
-def refresh_podplay_court_availability():
-    """Refresh Podplay court availability for all participating facilities."""
-    print("=" * 80)
-    print("[PODPLAY COURT AVAILABILITY] Starting Podplay court availability ingestion")
-    print("=" * 80)
+                pg_client.bulk_insert(
+                    cur,
+                    Tables.FACILITY_COURT_AVAILABILITIES,
+                    (
+                        "client_code",
+                        "source_system",
+                        "court_id",
+                        "court_name",
+                        "slot_start",
+                        "slot_end",
+                        "period_type",
+                    ),
+                    rows,
+                )
 
-    clients_with_pod_ids = _get_podplay_clients_with_pod_ids()
-    if not clients_with_pod_ids:
-        print("[PODPLAY COURT AVAILABILITY] No Podplay clients found, skipping")
-        return
+        if slots:
+            print(f"[{label}] ✓ Complete: {len(slots)} slots inserted for {client_code}")
+        else:
+            print(f"[{label}] No slots to insert for {client_code}")
 
-    # Calculate date range: now to 7 days from now
-    now = datetime.now(timezone.utc)
-    end_time = now + timedelta(days=7)
+
+def _refresh_podplay_court_availability_client(
+    client_code: str, pod_id: Optional[str], start_time: datetime, end_time: datetime
+) -> None:
+    """Archive raw sessions and replace one Podplay client's court availability."""
+    from ingestion.events.podplay_sessions import normalize_podplay_sessions
 
     print(
-        f"[PODPLAY COURT AVAILABILITY] Date range: {now.isoformat()} to {end_time.isoformat()}"
+        f"\n[PODPLAY COURT AVAILABILITY] Processing {client_code} (pod_id: {pod_id})..."
     )
 
-    all_sessions = []
-    all_raw_sessions = []  # Store raw API responses
+    client = _get_podplay_client(client_code)
 
-    for client_code, pod_id in clients_with_pod_ids:
-        print(
-            f"\n[PODPLAY COURT AVAILABILITY] Processing {client_code} (pod_id: {pod_id})..."
+    # Get sessions
+    with metrics.stage(metrics.FETCH) as stage:
+        sessions = client.get_sessions(
+            start_time=start_time,
+            end_time=end_time,
+            pod_id=pod_id,
         )
+        stage.rows = len(sessions)
 
-        try:
-            client = _get_podplay_client(client_code)
+    print(
+        f"[PODPLAY COURT AVAILABILITY] Retrieved {len(sessions)} sessions for {client_code}"
+    )
 
-            # Get sessions
-            sessions = client.get_sessions(
-                start_time=now,
-                end_time=end_time,
-                pod_id=pod_id,
-            )
+    with _raw_archive("podplay_court_availability", client_code) as archive:
+        archive.write(sessions)
 
-            print(
-                f"[PODPLAY COURT AVAILABILITY] Retrieved {len(sessions)} sessions for {client_code}"
-            )
-
-            # Save raw API response for inspection
-            all_raw_sessions.extend(sessions)
+    # Normalize sessions (pass end_time for date filtering)
+    with metrics.stage(metrics.NORMALIZE) as stage:
+        normalized = normalize_podplay_sessions(sessions, client_code, end_time)
+        stage.rows = len(normalized)
 
-            # Normalize sessions (pass end_time for date filtering)
-            normalized = normalize_podplay_sessions(sessions, client_code, end_time)
+    print(
+        f"[PODPLAY COURT AVAILABILITY] Normalized {len(normalized)} sessions for {client_code}"
+    )
 
-            print(
-                f"[PODPLAY COURT AVAILABILITY] Normalized {len(normalized)} sessions for {client_code}"
-            )
+    # Per-client full refresh
+    _replace_court_availability(
+        "PODPLAY COURT AVAILABILITY", client_code, "podplay", normalized
+    )
 
-            # Save raw API response for inspection
-            all_raw_sessions.extend(sessions)
+    # Update watermark for this client
+    watermark_key = f"{client_code}__court_availability"
+    _get_pg_client().update_elt_watermark(watermark_key)
+    print(f"[PODPLAY COURT AVAILABILITY] Updated watermark for {watermark_key}")
 
-            # Delete existing records for this specific client (per-client full refresh)
-            import psycopg2
 
-            conn = psycopg2.connect(pg_dsn)
-            cur = conn.cursor()
-            cur.execute(
-                f"""
-                DELETE FROM "{pg_schema}".facility_court_availabilities
-                WHERE client_code = %s AND source_system = 'podplay'
-                """,
-                (client_code,),
-            )
-            deleted_count = cur.rowcount
-            print(
-                f"[PODPLAY COURT AVAILABILITY] Deleted {deleted_count} old records for {client_code}"
-            )
+def refresh_podplay_court_availability(metadata: Optional[MetadataSnapshot] = None):
+    """Refresh Podplay court availability for all participating facilities."""
+    print("=" * 80)
+    print("[PODPLAY COURT AVAILABILITY] Starting Podplay court availability ingestion")
+    print("=" * 80)
 
-            # Insert new records for this client
-            if normalized:
-                insert_query = f"""
-                    INSERT INTO "{pg_schema}".facility_court_availabilities (
-                        client_code, source_system, court_id, court_name,
-                        slot_start, slot_end, period_type
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """
+    clients_with_pod_ids = _get_podplay_clients_with_pod_ids(metadata)
+    if not clients_with_pod_ids:
+        print("[PODPLAY COURT AVAILABILITY] No Podplay clients found, skipping")
+        return
 
-                rows = [
-                    (
-                        session["client_code"],
-                        session["source_system"],
-                        session["court_id"],
-                        session["court_name"],
-                        session["slot_start"],
-                        session["slot_end"],
-                        session.get("period_type"),
-                    )
-                    for session in normalized
-                ]
+    # Calculate date range: now to 7 days from now
+    now = datetime.now(timezone.utc)
+    end_time = now + timedelta(days=7)
 
-                from psycopg2.extras import execute_batch
+    print(
+        f"[PODPLAY COURT AVAILABILITY] Date range: {now.isoformat()} to {end_time.isoformat()}"
+    )
 
-                execute_batch(cur, insert_query, rows, page_size=1000)
+    results = run_for_clients(
+        "PODPLAY COURT AVAILABILITY",
+        [
+            (client_code, pod_id, now, end_time)
+            for client_code, pod_id in clients_with_pod_ids
+        ],
+        _refresh_podplay_court_availability_client,
+    )
 
-                conn.commit()
-                print(
-                    f"[PODPLAY COURT AVAILABILITY] ✓ Complete: {len(normalized)} sessions inserted for {client_code}"
-                )
-            else:
-                print(
-                    f"[PODPLAY COURT AVAILABILITY] No sessions to insert for {client_code}"
-                )
+    print("[PODPLAY COURT AVAILABILITY] All clients processed")
+    print("=" * 80)
+    raise_for_failures("PODPLAY COURT AVAILABILITY", results)
 
-            cur.close()
-            conn.close()
 
-            # Update watermark for this client
-            watermark_key = f"{client_code}__court_availability"
-            pg_client.update_elt_watermark(watermark_key)
-            print(f"[PODPLAY COURT AVAILABILITY] Updated watermark for {watermark_key}")
+def _refresh_courtreserve_court_availability_client(
+    client_code: str,
+    facility: Optional[FacilityMetadata],
+    start_date: datetime,
+    end_date: datetime,
+) -> None:
+    """Archive raw events/reservations and replace one CourtReserve client's court availability."""
+    from ingestion.events.courtreserve_court_availability import calculate_available_slots
 
-        except Exception as e:
-            print(
-                f"[PODPLAY COURT AVAILABILITY] Error processing {client_code}: {e}",
-                file=sys.stderr,
-            )
-            continue
+    print(f"\n[COURTRESERVE COURT AVAILABILITY] Processing {client_code}...")
 
-    # Save raw API responses to JSON file for inspection (only when running locally)
-    if _is_running_locally():
-        import json
+    client = _get_courtreserve_client(client_code)
 
-        raw_output_file = os.path.join(
-            OUTPUT_DIR, "podplay_sessions_raw_api_response.json"
+    # Operating hours and courts come from the run's metadata snapshot
+    if not facility or not facility.operating_hours:
+        print(
+            f"[COURTRESERVE COURT AVAILABILITY] No operating hours found for {client_code}, skipping"
         )
-        with open(raw_output_file, "w") as f:
-            json.dump(all_raw_sessions, f, indent=2, default=str)
+        return
+
+    operating_hours = facility.operating_hours
+    courts = facility.courts
+
+    if not courts:
         print(
-            f"\n[PODPLAY COURT AVAILABILITY] Saved {len(all_raw_sessions)} raw API sessions to {raw_output_file}"
+            f"[COURTRESERVE COURT AVAILABILITY] No courts found for {client_code}, skipping"
         )
+        return
 
-    print("[PODPLAY COURT AVAILABILITY] All clients processed")
-    print("=" * 80)
+    print(
+        f"[COURTRESERVE COURT AVAILABILITY] Found {len(courts)} courts for {client_code}"
+    )
+
+    # Fetch events for next 7 days - capture full raw API response
+    events_url = f"{client.BASE_URL}/api/v1/eventcalendar/eventlist"
+    events_start = client._get_utc_datetime(start_date)
+    events_end = client._get_utc_datetime(end_date)
+
+    events_params = {
+        "startDate": events_start.strftime("%Y-%m-%d"),
+        "endDate": events_end.strftime("%Y-%m-%d"),
+        "includeRegisteredPlayersCount": True,
+        "includePriceInfo": True,
+        "includeRatingRestrictions": True,
+        "includeTags": True,
+    }
+
+    with metrics.stage(metrics.FETCH) as stage:
+        events_resp = client.session.get(events_url, params=events_params)
+        events_resp.raise_for_status()
+        events_raw_response = events_resp.json()
+        events = events_raw_response.get("Data") or []
+        stage.rows = len(events)
+    print(f"[COURTRESERVE COURT AVAILABILITY] Retrieved {len(events)} events")
+
+    # Fetch reservations that START in the next 7 days - capture full raw API response
+    reservations_url = (
+        f"{client.BASE_URL}/api/v1/reservationreport/listactive"
+    )
+    reservations_start = client._get_utc_datetime(start_date)
+    reservations_end = client._get_utc_datetime(end_date)
+
+    reservations_params = {
+        "reservationsFromDate": reservations_start.strftime("%Y-%m-%d"),
+        "reservationsToDate": reservations_end.strftime("%Y-%m-%d"),
+        "includeUserDefinedFields": False,
+    }
+
+    with metrics.stage(metrics.FETCH) as stage:
+        reservations_resp = client.session.get(
+            reservations_url, params=reservations_params
+        )
+        reservations_resp.raise_for_status()
+        reservations_raw_response = reservations_resp.json()
+        reservations = reservations_raw_response.get("Data") or []
+        stage.rows = len(reservations)
+    print(
+        f"[COURTRESERVE COURT AVAILABILITY] Retrieved {len(reservations)} reservations starting in next 7 days"
+    )
+
+    with _raw_archive("courtreserve_court_availability_events", client_code) as archive:
+        archive.write(events)
+    with _raw_archive(
+        "courtreserve_court_availability_reservations", client_code
+    ) as archive:
+        archive.write(reservations)
+
+    # Calculate available slots
+    with metrics.stage(metrics.NORMALIZE) as stage:
+        available_slots = calculate_available_slots(
+            client_code=client_code,
+            courts=courts,
+            operating_hours=operating_hours,
+            events=events,
+            reservations=reservations,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        stage.rows = len(available_slots)
 
+    print(
+        f"[COURTRESERVE COURT AVAILABILITY] Calculated {len(available_slots)} available slots for {client_code}"
+    )
 
-def refresh_courtreserve_court_availability():
+    # Per-client full refresh
+    _replace_court_availability(
+        "COURTRESERVE COURT AVAILABILITY", client_code, "courtreserve", available_slots
+    )
+
+    # Update watermark for this client
+    watermark_key = f"{client_code}__court_availability"
+    _get_pg_client().update_elt_watermark(watermark_key)
+    print(
+        f"[COURTRESERVE COURT AVAILABILITY] Updated watermark for {watermark_key}"
+    )
+
+
+def refresh_courtreserve_court_availability(metadata: Optional[MetadataSnapshot] = None):
     """
     Refresh CourtReserve court availability for all participating facilities.
     This does a FULL refresh of availability for the next 7 days.
@@ -1246,10 +1698,8 @@ def refresh_courtreserve_court_availability():
     )
     print("=" * 80)
 
-    import psycopg2
-    import json
-
-    client_codes = _get_courtreserve_client_codes()
+    metadata = metadata or _get_metadata()
+    client_codes = _get_courtreserve_client_codes(metadata)
     if not client_codes:
         print(
             "[COURTRESERVE COURT AVAILABILITY] No CourtReserve clients found, skipping"
@@ -1264,238 +1714,28 @@ def refresh_courtreserve_court_availability():
         f"[COURTRESERVE COURT AVAILABILITY] Date range: {now.isoformat()} to {end_date.isoformat()}"
     )
 
-    # Store raw API responses
-    all_raw_api_responses = []
-
-    for client_code in client_codes:
-        print(f"\n[COURTRESERVE COURT AVAILABILITY] Processing {client_code}...")
-
-        try:
-            client = _get_courtreserve_client(client_code)
-
-            # Fetch operating hours and courts from database
-            conn = psycopg2.connect(pg_dsn)
-            cur = conn.cursor()
-
-            # Get operating hours
-            cur.execute(
-                f"""
-                SELECT operating_hours
-                FROM "{pg_schema}".organizations
-                WHERE client_code = %s AND source_system_code = 'courtreserve'
-                """,
-                (client_code,),
-            )
-            result = cur.fetchone()
-            if not result or not result[0]:
-                print(
-                    f"[COURTRESERVE COURT AVAILABILITY] No operating hours found for {client_code}, skipping"
-                )
-                cur.close()
-                conn.close()
-                continue
-
-            operating_hours = result[0]
-
-            # Get courts
-            cur.execute(
-                f"""
-                SELECT id, client_code, label, type_name, order_index
-                FROM "{pg_schema}".courts
-                WHERE client_code = %s
-                ORDER BY order_index
-                """,
-                (client_code,),
-            )
-            courts = []
-            for row in cur.fetchall():
-                courts.append(
-                    {
-                        "id": row[0],
-                        "client_code": row[1],
-                        "label": row[2],
-                        "type_name": row[3],
-                        "order_index": row[4],
-                    }
-                )
-
-            cur.close()
-            conn.close()
-
-            if not courts:
-                print(
-                    f"[COURTRESERVE COURT AVAILABILITY] No courts found for {client_code}, skipping"
-                )
-                continue
-
-            print(
-                f"[COURTRESERVE COURT AVAILABILITY] Found {len(courts)} courts for {client_code}"
-            )
-
-            # Fetch events for next 7 days - capture full raw API response
-            import requests
-
-            events_url = f"{CourtReserveClient.BASE_URL}/api/v1/eventcalendar/eventlist"
-            events_start = client._get_utc_datetime(now)
-            events_end = client._get_utc_datetime(end_date)
-
-            events_params = {
-                "startDate": events_start.strftime("%Y-%m-%d"),
-                "endDate": events_end.strftime("%Y-%m-%d"),
-                "includeRegisteredPlayersCount": True,
-                "includePriceInfo": True,
-                "includeRatingRestrictions": True,
-                "includeTags": True,
-            }
-
-            events_resp = requests.get(
-                events_url, params=events_params, auth=client.auth
-            )
-            events_resp.raise_for_status()
-            events_raw_response = events_resp.json()
-            events = events_raw_response.get("Data") or []
-            print(f"[COURTRESERVE COURT AVAILABILITY] Retrieved {len(events)} events")
-
-            # Fetch reservations that START in the next 7 days - capture full raw API response
-            reservations_url = (
-                f"{CourtReserveClient.BASE_URL}/api/v1/reservationreport/listactive"
-            )
-            reservations_start = client._get_utc_datetime(now)
-            reservations_end = client._get_utc_datetime(end_date)
-
-            reservations_params = {
-                "reservationsFromDate": reservations_start.strftime("%Y-%m-%d"),
-                "reservationsToDate": reservations_end.strftime("%Y-%m-%d"),
-                "includeUserDefinedFields": False,
-            }
-
-            reservations_resp = requests.get(
-                reservations_url, params=reservations_params, auth=client.auth
-            )
-            reservations_resp.raise_for_status()
-            reservations_raw_response = reservations_resp.json()
-            reservations = reservations_raw_response.get("Data") or []
-            print(
-                f"[COURTRESERVE COURT AVAILABILITY] Retrieved {len(reservations)} reservations starting in next 7 days"
-            )
-
-            # Store raw API responses for this client (full HTTP response, not just Data)
-            all_raw_api_responses.append(
-                {
-                    "client_code": client_code,
-                    "reservations_api_response": reservations_raw_response,
-                }
-            )
-
-            # Calculate available slots
-            available_slots = calculate_available_slots(
-                client_code=client_code,
-                courts=courts,
-                operating_hours=operating_hours,
-                events=events,
-                reservations=reservations,
-                start_date=now,
-                end_date=end_date,
-            )
-
-            print(
-                f"[COURTRESERVE COURT AVAILABILITY] Calculated {len(available_slots)} available slots for {client_code}"
-            )
-
-            # Delete existing records for this specific client (per-client full refresh)
-            conn = psycopg2.connect(pg_dsn)
-            cur = conn.cursor()
-            cur.execute(
-                f"""
-                DELETE FROM "{pg_schema}".facility_court_availabilities
-                WHERE client_code = %s AND source_system = 'courtreserve'
-                """,
-                (client_code,),
-            )
-            deleted_count = cur.rowcount
-            print(
-                f"[COURTRESERVE COURT AVAILABILITY] Deleted {deleted_count} old records for {client_code}"
-            )
-
-            # Insert new records for this client
-            if available_slots:
-                insert_query = f"""
-                    INSERT INTO "{pg_schema}".facility_court_availabilities (
-                        client_code, source_system, court_id, court_name,
-                        slot_start, slot_end, period_type
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """
-
-                rows = [
-                    (
-                        slot["client_code"],
-                        slot["source_system"],
-                        slot["court_id"],
-                        slot["court_name"],
-                        slot["slot_start"],
-                        slot["slot_end"],
-                        slot["period_type"],
-                    )
-                    for slot in available_slots
-                ]
-
-                from psycopg2.extras import execute_batch
-
-                execute_batch(cur, insert_query, rows, page_size=1000)
-
-                conn.commit()
-                print(
-                    f"[COURTRESERVE COURT AVAILABILITY] ✓ Complete: {len(available_slots)} slots inserted for {client_code}"
-                )
-            else:
-                print(
-                    f"[COURTRESERVE COURT AVAILABILITY] No available slots to insert for {client_code}"
-                )
-
-            cur.close()
-            conn.close()
-
-            # Update watermark for this client
-            watermark_key = f"{client_code}__court_availability"
-            pg_client.update_elt_watermark(watermark_key)
-            print(
-                f"[COURTRESERVE COURT AVAILABILITY] Updated watermark for {watermark_key}"
-            )
-
-        except Exception as e:
-            print(
-                f"[COURTRESERVE COURT AVAILABILITY] Error processing {client_code}: {e}",
-                file=sys.stderr,
-            )
-            import traceback
-
-            traceback.print_exc()
-            continue
-
-    # Save raw API responses to JSON file for inspection (only when running locally)
-    if _is_running_locally():
-        import json
-
-        raw_output_file = os.path.join(
-            OUTPUT_DIR, "courtreserve_court_availability_raw_api_response.json"
-        )
-        with open(raw_output_file, "w") as f:
-            json.dump(all_raw_api_responses, f, indent=2, default=str)
-        print(
-            f"\n[COURTRESERVE COURT AVAILABILITY] Saved raw reservations API responses to {raw_output_file}"
-        )
+    results = run_for_clients(
+        "COURTRESERVE COURT AVAILABILITY",
+        [
+            (client_code, metadata.get(client_code, "courtreserve"), now, end_date)
+            for client_code in client_codes
+        ],
+        _refresh_courtreserve_court_availability_client,
+    )
 
     print("[COURTRESERVE COURT AVAILABILITY] All clients processed")
     print("=" * 80)
+    raise_for_failures("COURTRESERVE COURT AVAILABILITY", results)
 
 
-def sync_google_reviews():
+def sync_google_reviews(metadata: Optional[MetadataSnapshot] = None):
     """Sync Google reviews for all facilities with google_place_id."""
     print("=" * 80)
     print("[GOOGLE REVIEWS] Starting Google reviews sync")
     print("=" * 80)
 
     import psycopg2
+    from ingestion.clients.google_places_client import GooglePlacesClient
     from datetime import datetime, timezone
 
     try:
@@ -1506,24 +1746,16 @@ def sync_google_reviews():
         return
 
     # Get all organizations with google_place_id
-    conn = psycopg2.connect(pg_dsn)
-    cur = conn.cursor()
-
-    cur.execute(
-        f"""
-        SELECT client_code, google_place_id
-        FROM "{pg_schema}".organizations
-        WHERE google_place_id IS NOT NULL
-        """
-    )
-    facilities = cur.fetchall()
+    facilities = (metadata or _get_metadata()).google_place_ids()
 
     if not facilities:
         print("[GOOGLE REVIEWS] No facilities with google_place_id found")
-        cur.close()
-        conn.close()
         return
 
+    pg_client = _get_pg_client()
+    conn = psycopg2.connect(pg_client.dsn)
+    cur = conn.cursor()
+
     print(f"[GOOGLE REVIEWS] Found {len(facilities)} facilities with Google Place IDs")
 
     for client_code, place_id in facilities:
@@ -1531,7 +1763,9 @@ def sync_google_reviews():
 
         try:
             # Get place details from Google (includes rating and review count)
-            place_details = google_client.get_place_details(place_id)
+            with metrics.stage(metrics.FETCH, client_code=client_code) as stage:
+                place_details = google_client.get_place_details(place_id)
+                stage.rows = 1 if place_details else 0
 
             if not place_details:
                 print(f"[GOOGLE REVIEWS] No place details found for {client_code}")
@@ -1548,36 +1782,37 @@ def sync_google_reviews():
             )
 
             # Upsert aggregate review data
-            cur.execute(
-                f"""
-                INSERT INTO "{pg_schema}".facility_reviews (
-                    client_code,
-                    review_service,
-                    num_reviews,
-                    avg_review,
-                    link_to_reviews,
-                    last_updated_at,
-                    updated_at
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (client_code, review_service) DO UPDATE SET
-                    num_reviews = EXCLUDED.num_reviews,
-                    avg_review = EXCLUDED.avg_review,
-                    link_to_reviews = EXCLUDED.link_to_reviews,
-                    last_updated_at = EXCLUDED.last_updated_at,
-                    updated_at = EXCLUDED.updated_at
-                """,
-                (
-                    client_code,
-                    "google",
-                    num_reviews,
-                    avg_review,
-                    link_to_reviews,
-                    datetime.now(timezone.utc),
-                    datetime.now(timezone.utc),
-                ),
-            )
+            with metrics.stage(metrics.PROMOTE, rows=1, client_code=client_code):
+                cur.execute(
+                    f"""
+                    INSERT INTO "{pg_client.schema}".facility_reviews (
+                        client_code,
+                        review_service,
+                        num_reviews,
+                        avg_review,
+                        link_to_reviews,
+                        last_updated_at,
+                        updated_at
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (client_code, review_service) DO UPDATE SET
+                        num_reviews = EXCLUDED.num_reviews,
+                        avg_review = EXCLUDED.avg_review,
+                        link_to_reviews = EXCLUDED.link_to_reviews,
+                        last_updated_at = EXCLUDED.last_updated_at,
+                        updated_at = EXCLUDED.updated_at
+                    """,
+                    (
+                        client_code,
+                        "google",
+                        num_reviews,
+                        avg_review,
+                        link_to_reviews,
+                        datetime.now(timezone.utc),
+                        datetime.now(timezone.utc),
+                    ),
+                )
 
-            conn.commit()
+                conn.commit()
             print(
                 f"[GOOGLE REVIEWS] ✓ Synced review data for {client_code}: {num_reviews} reviews, {avg_review} avg rating"
             )
@@ -1601,37 +1836,492 @@ def sync_google_reviews():
     print("=" * 80)
 
 
-def _run(option: str) -> None:
-    if option == "courtreserve_reservations":
-        refresh_courtreserve_reservations()
-        refresh_courtreserve_reservation_cancellations()
-    elif option == "courtreserve_members":
-        refresh_courtreserve_members()
-    elif option == "podplay_members":
-        refresh_podplay_members()
-    elif option == "podplay_reservations":
-        refresh_podplay_reservations()
-    elif option == "podplay_events":
-        refresh_podplay_events()
-    elif option == "courtreserve_events":
-        refresh_courtreserve_events()
-    elif option == "podplay_court_availability":
-        refresh_podplay_court_availability()
-    elif option == "courtreserve_court_availability":
-        refresh_courtreserve_court_availability()
-    elif option == "google_reviews":
-        sync_google_reviews()
-    elif option == "all":
-        refresh_courtreserve_reservations()
-        refresh_courtreserve_reservation_cancellations()
-        refresh_podplay_members()
-        refresh_podplay_reservations()
-    else:
+def add_skill_levels(metadata: Optional[MetadataSnapshot] = None):
+    """Backfill skill_level on facility_events_raw (scripts.add_skill_level_to_events)."""
+    from scripts.add_skill_level_to_events import main as add_skill_levels_main
+
+    add_skill_levels_main()
+
+
+# ---------------------------------------------------------------------------
+# Replay: rebuild tables from archived raw payloads (see ingestion.archive)
+# ---------------------------------------------------------------------------
+
+DEFAULT_REPLAY_CHUNK_SIZE = 5000
+
+
+def _get_replay_chunk_size() -> int:
+    raw = os.getenv("REPLAY_CHUNK_SIZE")
+    if not raw:
+        return DEFAULT_REPLAY_CHUNK_SIZE
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_REPLAY_CHUNK_SIZE
+    return max(1, value)
+
+
+def _read_archive_chunks(path: str) -> Iterator[list[dict]]:
+    """Stream an archive in chunks of REPLAY_CHUNK_SIZE records (timed as fetch)."""
+    from ingestion.archive import iter_records
+
+    def chunks() -> Iterator[list[dict]]:
+        size = _get_replay_chunk_size()
+        chunk: list[dict] = []
+        for record in iter_records(path):
+            chunk.append(record)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    return metrics.iter_stage(metrics.FETCH, chunks(), count=len)
+
+
+def _read_archive(path: str) -> list[dict]:
+    """Whole archive, for normalizers that need every record of a client at once."""
+    return [record for chunk in _read_archive_chunks(path) for record in chunk]
+
+
+def _replay_courtreserve_members(client_code: str, path: str, run_started: datetime) -> None:
+    from ingestion.courtreserve.member_mapper import map_member_to_row as map_cr_member
+
+    for chunk in _read_archive_chunks(path):
+        with metrics.stage(metrics.NORMALIZE) as stage:
+            rows = [map_cr_member(m, facility_code=client_code) for m in chunk]
+            stage.rows = len(rows)
+        if _should_write_to_db() and rows:
+            _get_pg_client().replace_members_for_client(client_code, rows)
+
+
+def _replay_podplay_members(client_code: str, path: str, run_started: datetime) -> None:
+    from ingestion.podplay.members import normalize_members as normalize_podplay_members
+
+    for chunk in _read_archive_chunks(path):
+        with metrics.stage(metrics.NORMALIZE) as stage:
+            normalized = normalize_podplay_members(chunk, facility_code=client_code)
+            # Same member can appear in several tenure windows
+            rows = list(
+                {(m["client_code"], m["member_id"]): m for m in normalized}.values()
+            )
+            stage.rows = len(rows)
+        if _should_write_to_db() and rows:
+            _get_pg_client().replace_members_for_client(client_code, rows)
+
+
+def _replay_courtreserve_reservations(
+    client_code: str, path: str, run_started: datetime
+) -> None:
+    from ingestion.courtreserve.reservation_helpers import (
+        normalize_reservations as normalize_cr_reservations,
+    )
+
+    watermark_key = f"{EltWatermarks.RESERVATIONS}__{client_code}"
+    for chunk in _read_archive_chunks(path):
+        if _should_write_to_db():
+            _load_courtreserve_reservations_window(
+                client_code, chunk, run_started, watermark_key
+            )
+        else:
+            with metrics.stage(metrics.NORMALIZE) as stage:
+                stage.rows = len(
+                    normalize_cr_reservations(chunk, facility_code=client_code)
+                )
+
+
+def _replay_courtreserve_reservation_cancellations(
+    client_code: str, path: str, run_started: datetime
+) -> None:
+    from ingestion.courtreserve.reservation_cancellation_helpers import (
+        normalize_reservation_cancellations as normalize_cr_cancellations,
+    )
+
+    watermark_key = f"{EltWatermarks.RESERVATION_CANCELLATIONS}__{client_code}"
+    for chunk in _read_archive_chunks(path):
+        with metrics.stage(metrics.NORMALIZE) as stage:
+            normalized = normalize_cr_cancellations(chunk, facility_code=client_code)
+            stage.rows = len(normalized)
+        if _should_write_to_db() and normalized:
+            _load_courtreserve_cancellations(normalized, run_started, watermark_key)
+
+
+def _replay_podplay_reservations(client_code: str, path: str, run_started: datetime) -> None:
+    from ingestion.podplay.reservations import (
+        normalize_event_reservations as normalize_podplay_reservations,
+    )
+
+    watermark_key = f"{EltWatermarks.RESERVATIONS}__{client_code}"
+    for chunk in _read_archive_chunks(path):
+        with metrics.stage(metrics.NORMALIZE) as stage:
+            normalized = normalize_podplay_reservations(chunk, facility_code=client_code)
+            stage.rows = len(normalized)
+        if _should_write_to_db() and normalized:
+            _load_podplay_reservations(
+                normalized, run_started, watermark_key, update_watermark=False
+            )
+
+
+def _replay_podplay_events(client_code: str, path: str, run_started: datetime) -> None:
+    from ingestion.events.podplay_events import normalize_podplay_events
+
+    events = _read_archive(path)
+    with metrics.stage(metrics.NORMALIZE) as stage:
+        normalized = normalize_podplay_events(events, client_code)
+        stage.rows = len(normalized)
+    # insert_events replaces the client's whole event set, so load it in one go
+    if _should_write_to_db() and normalized:
+        _get_pg_client().insert_events(normalized)
+
+
+def _replay_courtreserve_events(client_code: str, path: str, run_started: datetime) -> None:
+    from ingestion.events.courtreserve_events import normalize_courtreserve_events
+
+    events = _read_archive(path)
+    with metrics.stage(metrics.NORMALIZE) as stage:
+        event_categories = _get_event_category_cache().get(
+            client_code,
+            "courtreserve",
+            expected_ids=[event.get("EventCategoryId") for event in events],
+        )
+        normalized = normalize_courtreserve_events(
+            events, client_code, event_categories=event_categories
+        )
+        stage.rows = len(normalized)
+    if _should_write_to_db() and normalized:
+        _get_pg_client().insert_events(normalized)
+
+
+def _replay_podplay_court_availability(
+    client_code: str, path: str, run_started: datetime
+) -> None:
+    from ingestion.events.podplay_sessions import normalize_podplay_sessions
+
+    sessions = _read_archive(path)
+    # The live run fetched now → now + 7 days
+    end_time = run_started + timedelta(days=7)
+    with metrics.stage(metrics.NORMALIZE) as stage:
+        normalized = normalize_podplay_sessions(sessions, client_code, end_time)
+        stage.rows = len(normalized)
+    if _should_write_to_db():
+        _replace_court_availability(
+            "REPLAY PODPLAY COURT AVAILABILITY", client_code, "podplay", normalized
+        )
+
+
+def _replay_courtreserve_court_availability(
+    client_code: str, path: str, run_started: datetime
+) -> None:
+    from ingestion.archive import find_archives, run_id_of
+    from ingestion.events.courtreserve_court_availability import calculate_available_slots
+
+    facility = _get_metadata().get(client_code, "courtreserve")
+    if not facility or not facility.operating_hours:
+        print(f"[REPLAY] No operating hours found for {client_code}, skipping")
+        return
+
+    # Events and reservations of the same run are archived side by side
+    root = os.path.dirname(os.path.dirname(os.path.dirname(path)))
+    reservations_archives = find_archives(
+        root,
+        "courtreserve_court_availability_reservations",
+        run_id=run_id_of(path),
+        client_codes=[client_code],
+    )
+    events = _read_archive(path)
+    reservations = (
+        _read_archive(reservations_archives[0][1]) if reservations_archives else []
+    )
+
+    with metrics.stage(metrics.NORMALIZE) as stage:
+        available_slots = calculate_available_slots(
+            client_code=client_code,
+            courts=facility.courts,
+            operating_hours=facility.operating_hours,
+            events=events,
+            reservations=reservations,
+            start_date=run_started,
+            end_date=run_started + timedelta(days=7),
+        )
+        stage.rows = len(available_slots)
+    if _should_write_to_db():
+        _replace_court_availability(
+            "REPLAY COURTRESERVE COURT AVAILABILITY",
+            client_code,
+            "courtreserve",
+            available_slots,
+        )
+
+
+# replay source -> (archive source, replay function)
+REPLAY_SOURCES = {
+    "courtreserve_members": ("courtreserve_members", _replay_courtreserve_members),
+    "podplay_members": ("podplay_members", _replay_podplay_members),
+    "courtreserve_reservations": (
+        "courtreserve_reservations",
+        _replay_courtreserve_reservations,
+    ),
+    "courtreserve_reservation_cancellations": (
+        "courtreserve_reservation_cancellations",
+        _replay_courtreserve_reservation_cancellations,
+    ),
+    "podplay_reservations": ("podplay_reservations", _replay_podplay_reservations),
+    "podplay_events": ("podplay_events", _replay_podplay_events),
+    "courtreserve_events": ("courtreserve_events", _replay_courtreserve_events),
+    "podplay_court_availability": (
+        "podplay_court_availability",
+        _replay_podplay_court_availability,
+    ),
+    "courtreserve_court_availability": (
+        "courtreserve_court_availability_events",
+        _replay_courtreserve_court_availability,
+    ),
+}
+
+
+def _replay_client(client_code: str, source: str, path: str) -> None:
+    from ingestion.archive import run_id_of, run_started_at
+
+    print(f"[REPLAY] {source} / {client_code} from {path}")
+    run_started = run_started_at(run_id_of(path)) or datetime.now(timezone.utc)
+    _, replay = REPLAY_SOURCES[source]
+    replay(client_code, path, run_started)
+
+
+def replay_source(
+    source: str,
+    root: str,
+    run_id: Optional[str] = None,
+    client_codes: Optional[list[str]] = None,
+) -> None:
+    """Reprocess one source's archived raw payloads through today's normalizers."""
+    from ingestion.archive import find_archives
+
+    archive_source, _ = REPLAY_SOURCES[source]
+    archives = find_archives(root, archive_source, run_id, client_codes)
+    if not archives:
+        print(f"[REPLAY] No archives for {source} under {root}, skipping")
+        return
+
+    label = f"REPLAY {source.upper()}"
+    results = run_for_clients(
+        label,
+        [(client_code, source, path) for client_code, path in archives],
+        _replay_client,
+    )
+    raise_for_failures(label, results)
+
+
+# name -> (pipeline, kwargs, pipelines it must run after)
+PIPELINES = {
+    "courtreserve_reservations": (refresh_courtreserve_reservations, {}, ()),
+    "courtreserve_reservation_cancellations": (
+        refresh_courtreserve_reservation_cancellations,
+        {},
+        ("courtreserve_reservations",),
+    ),
+    "courtreserve_members": (refresh_courtreserve_members, {}, ()),
+    "podplay_members": (refresh_podplay_members, {}, ()),
+    "podplay_members_incremental": (
+        refresh_podplay_members,
+        {"incremental": True},
+        (),
+    ),
+    "podplay_reservations": (refresh_podplay_reservations, {}, ()),
+    "podplay_events": (refresh_podplay_events, {}, ()),
+    "courtreserve_events": (refresh_courtreserve_events, {}, ()),
+    "podplay_court_availability": (refresh_podplay_court_availability, {}, ()),
+    "courtreserve_court_availability": (
+        refresh_courtreserve_court_availability,
+        {},
+        (),
+    ),
+    "google_reviews": (sync_google_reviews, {}, ()),
+    "add_skill_levels": (
+        add_skill_levels,
+        {},
+        ("courtreserve_events", "podplay_events"),
+    ),
+}
+
+# option -> pipelines to run; dependencies only apply between selected pipelines
+RUN_OPTIONS = {
+    "courtreserve_reservations": [
+        "courtreserve_reservations",
+        "courtreserve_reservation_cancellations",
+    ],
+    "courtreserve_members": ["courtreserve_members"],
+    "podplay_members": ["podplay_members"],
+    "podplay_reservations": ["podplay_reservations"],
+    "podplay_events": ["podplay_events"],
+    "courtreserve_events": ["courtreserve_events"],
+    "podplay_court_availability": ["podplay_court_availability"],
+    "courtreserve_court_availability": ["courtreserve_court_availability"],
+    "google_reviews": ["google_reviews"],
+    "all": [
+        "courtreserve_reservations",
+        "courtreserve_reservation_cancellations",
+        "podplay_members",
+        "podplay_reservations",
+    ],
+    # Everything the 2-hourly GitHub Actions job runs before dbt
+    "2hour": [
+        "courtreserve_events",
+        "podplay_events",
+        "podplay_court_availability",
+        "courtreserve_court_availability",
+        "courtreserve_reservations",
+        "courtreserve_reservation_cancellations",
+        "courtreserve_members",
+        "podplay_reservations",
+        "podplay_members_incremental",
+        "add_skill_levels",
+    ],
+    # Daily 02:00 UTC GitHub Actions job
+    "daily_full": ["podplay_members", "add_skill_levels"],
+    # Sub-hourly availability refresh (daemon mode)
+    "availability": [
+        "podplay_court_availability",
+        "courtreserve_court_availability",
+    ],
+    # Everything `make ingest-staging` runs before dbt
+    "staging": [
+        "courtreserve_events",
+        "podplay_events",
+        "podplay_court_availability",
+        "courtreserve_court_availability",
+        "courtreserve_reservations",
+        "courtreserve_reservation_cancellations",
+        "courtreserve_members",
+        "podplay_reservations",
+        "add_skill_levels",
+    ],
+}
+
+
+def _build_tasks(names: list[str], metadata: MetadataSnapshot) -> list[Task]:
+    tasks = []
+    for name in names:
+        pipeline, kwargs, depends_on = PIPELINES[name]
+        tasks.append(
+            Task(
+                name=name,
+                func=partial(pipeline, metadata, **kwargs),
+                depends_on=tuple(dep for dep in depends_on if dep in names),
+            )
+        )
+    return tasks
+
+
+def _save_run_metrics(option: str, run_id: str, records: list) -> None:
+    """Write the run's per-stage metrics to a JSON summary and, if enabled, Postgres."""
+    metrics.write_summary(_output_path(f"run_metrics_{option}.json"), run_id, option, records)
+    if not _should_write_to_db():
+        return
+    try:
+        _get_pg_client().insert_run_metrics(run_id, option, records)
+    except Exception as e:
+        # Metrics are diagnostics; never fail the run over them
+        print(f"[METRICS] Failed to save run metrics: {e}", file=sys.stderr)
+
+
+def _run(option: str, refresh_metadata: bool = False, profile: bool = False) -> None:
+    global _run_id
+    if option not in RUN_OPTIONS:
         raise SystemExit(f"Unknown option: {option}")
 
+    _load_env()
+    # Fresh id per run: the daemon calls _run once per job
+    _run_id = None
+    _prod_key_indexes.clear()
+    run_id = _get_run_id()
+
+    # Load organization/court metadata once and share it across every pipeline
+    metadata = _get_metadata(refresh=refresh_metadata)
+    tasks = _build_tasks(RUN_OPTIONS[option], metadata)
+    if profile:
+        from ingestion.profiling import RunProfiler
+
+        # cProfile only sees the thread it runs in: keep everything serial
+        os.environ["INGEST_EXECUTOR"] = "serial"
+        with RunProfiler(option) as profiler:
+            report = run_dag(option, tasks, max_parallel=1)
+        records = metrics.drain()
+        profiler.write(_output_path, records)
+    else:
+        report = run_dag(option, tasks)
+        records = metrics.drain()
+    _save_run_metrics(option, run_id, records)
+    report_and_exit_on_failure(report, os.getenv("INGEST_RUN_REPORT_PATH"))
+
+
+def _run_replay(argv: list[str]) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m ingestion.main replay",
+        description="Re-run normalization and loading from archived raw payloads.",
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        choices=sorted(REPLAY_SOURCES) + ["all"],
+        help="Archived sources to replay",
+    )
+    parser.add_argument("--run", help="Run id to replay (default: latest per client)")
+    parser.add_argument(
+        "--client", action="append", help="Only this client (repeatable)"
+    )
+    parser.add_argument(
+        "--dir",
+        default=os.path.join(OUTPUT_DIR, "raw"),
+        help="Archive root (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    _load_env()
+    run_id = _get_run_id()
+    sources = list(REPLAY_SOURCES) if "all" in args.sources else args.sources
+    print(
+        f"[REPLAY] Replaying {', '.join(sources)} from {args.dir} "
+        f"({'run ' + args.run if args.run else 'latest run per client'}, "
+        f"write_to_db={_should_write_to_db()})"
+    )
+    tasks = [
+        Task(
+            name=f"replay_{source}",
+            func=partial(replay_source, source, args.dir, args.run, args.client),
+        )
+        for source in dict.fromkeys(sources)
+    ]
+    report = run_dag("replay", tasks)
+    records = metrics.drain()
+    _save_run_metrics("replay", run_id, records)
+    report_and_exit_on_failure(report, os.getenv("INGEST_RUN_REPORT_PATH"))
+
+
+def _run_daemon() -> None:
+    from ingestion.daemon import get_schedules, run_daemon
+
+    _load_env()
+    # Clients, the Postgres pool and caches live in this module and stay warm;
+    # metadata is reloaded at the start of each job to pick up new facilities
+    run_daemon(partial(_run, refresh_metadata=True), get_schedules())
+
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        raise SystemExit("Usage: python -m ingestion.main <option>")
+        raise SystemExit(
+            "Usage: python -m ingestion.main <option|daemon|replay> [--profile]"
+        )
 
-    _run(sys.argv[1])
+    try:
+        if sys.argv[1] == "daemon":
+            _run_daemon()
+        elif sys.argv[1] == "replay":
+            _run_replay(sys.argv[2:])
+        else:
+            _run(sys.argv[1], profile=_should_profile())
+    finally:
+        if _pg_client is not None:
+            _pg_client.close()
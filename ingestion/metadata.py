@@ -0,0 +1,139 @@
+"""Run-scoped snapshot of organization and court metadata.
+
+The snapshot is loaded once at startup (two queries) and handed to every
+pipeline, so client lists, pod ids, operating hours, courts and Google place
+ids all come from one consistent, read-only view instead of per-client queries.
+"""
+
+from __future__ import annotations
+
+import copyreg
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+def _mappingproxy(data: dict) -> MappingProxyType:
+    return MappingProxyType(data)
+
+
+def _pickle_mappingproxy(proxy: MappingProxyType):
+    return _mappingproxy, (dict(proxy),)
+
+
+# Snapshot pieces are handed to process-pool workers, which requires pickling
+copyreg.pickle(MappingProxyType, _pickle_mappingproxy)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert JSON-like dicts/lists into read-only equivalents."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class FacilityMetadata:
+    client_code: str
+    source_system: str
+    is_customer: bool
+    podplay_pod_id: Optional[str] = None
+    operating_hours: Optional[Mapping] = None
+    peak_hours: Optional[Mapping] = None
+    google_place_id: Optional[str] = None
+    courts: Tuple[Mapping, ...] = ()
+
+
+@dataclass(frozen=True)
+class MetadataSnapshot:
+    facilities: Tuple[FacilityMetadata, ...]
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def get(
+        self, client_code: str, source_system: Optional[str] = None
+    ) -> Optional[FacilityMetadata]:
+        code = client_code.lower()
+        for facility in self.facilities:
+            if facility.client_code != code:
+                continue
+            if source_system and facility.source_system != source_system:
+                continue
+            return facility
+        return None
+
+    def client_codes(self, source_system: str) -> List[str]:
+        """Customer client codes for a source system, sorted."""
+        return sorted(
+            facility.client_code
+            for facility in self.facilities
+            if facility.is_customer and facility.source_system == source_system
+        )
+
+    def podplay_clients_with_pod_ids(self) -> List[Tuple[str, Optional[str]]]:
+        podplay_customers = [
+            facility
+            for facility in self.facilities
+            if facility.is_customer and facility.source_system == "podplay"
+        ]
+        return [
+            (facility.client_code, facility.podplay_pod_id)
+            for facility in sorted(podplay_customers, key=lambda f: f.client_code)
+        ]
+
+    def google_place_ids(self) -> List[Tuple[str, str]]:
+        return [
+            (facility.client_code, facility.google_place_id)
+            for facility in self.facilities
+            if facility.google_place_id
+        ]
+
+
+def build_metadata_snapshot(
+    organizations: List[Dict], courts: List[Dict]
+) -> MetadataSnapshot:
+    """
+    Build a snapshot from organizations rows and courts rows.
+
+    Args:
+        organizations: Rows from the organizations table
+        courts: Rows from the courts table (id, client_code, label, type_name, order_index)
+    """
+    courts_by_client: Dict[str, List[Dict]] = {}
+    for court in sorted(courts, key=lambda c: c.get("order_index") or 0):
+        code = (court.get("client_code") or "").strip().lower()
+        courts_by_client.setdefault(code, []).append(court)
+
+    facilities = []
+    for org in organizations:
+        code = (org.get("client_code") or "").strip().lower()
+        if not code:
+            continue
+        facilities.append(
+            FacilityMetadata(
+                client_code=code,
+                source_system=(org.get("source_system_code") or "").lower(),
+                is_customer=bool(org.get("is_customer")),
+                podplay_pod_id=org.get("podplay_pod_id") or None,
+                operating_hours=_freeze(org.get("operating_hours")),
+                peak_hours=_freeze(org.get("peak_hours")),
+                google_place_id=org.get("google_place_id") or None,
+                courts=_freeze(courts_by_client.get(code, [])),
+            )
+        )
+
+    return MetadataSnapshot(facilities=tuple(facilities))
+
+
+def load_metadata_snapshot(pg_client) -> MetadataSnapshot:
+    """Load organizations and courts once and build an immutable snapshot."""
+    snapshot = build_metadata_snapshot(
+        pg_client.get_organizations(), pg_client.get_courts()
+    )
+    print(
+        f"[METADATA] Loaded snapshot: {len(snapshot.facilities)} organizations "
+        f"at {snapshot.loaded_at.isoformat()}"
+    )
+    return snapshot
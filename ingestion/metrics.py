@@ -0,0 +1,277 @@
+"""Per-stage timing and throughput metrics for ingestion runs.
+
+Pipelines wrap their work in ``stage("fetch")``, ``stage("normalize")``,
+``stage("stage_load")``, ``stage("dedupe")`` and ``stage("promote")``. Each
+stage records wall time, rows, API calls and response bytes under the current
+pipeline (set by the scheduler) and client (set by run_for_clients), so the
+stage code itself only names the stage and reports rows. HTTP sessions passed
+to ``instrument_session`` count calls and bytes into whatever stage is active.
+
+Repeated stages for the same (pipeline, client, stage) are summed, giving one
+row per stage per client per run in ``ingestion_run_metrics`` and in the JSON
+summary. Stages that run inside process-pool workers (INGEST_EXECUTOR=process)
+are recorded in the worker and not collected.
+
+Upsert stages that can tell inserts from updates from no-op rows also set
+``inserted``, ``updated`` and ``unchanged``; they stay None elsewhere.
+
+While a profiled run traces memory (see ingestion.profiling), each stage also
+records the peak traced memory above its starting point. Runs are serial then,
+so the only overlap is a nested stage resetting its parent's peak.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+FETCH = "fetch"
+NORMALIZE = "normalize"
+STAGE_LOAD = "stage_load"
+DEDUPE = "dedupe"
+PROMOTE = "promote"
+
+UPSERT_COUNTS = ("inserted", "updated", "unchanged")
+
+_pipeline: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "ingest_pipeline", default=None
+)
+_client: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "ingest_client", default=None
+)
+_current: contextvars.ContextVar[Optional["StageMetrics"]] = contextvars.ContextVar(
+    "ingest_stage", default=None
+)
+
+
+@dataclass
+class StageMetrics:
+    pipeline: str
+    client_code: str
+    stage: str
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    duration_seconds: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    api_calls: int = 0
+    calls: int = 0
+    inserted: Optional[int] = None
+    updated: Optional[int] = None
+    unchanged: Optional[int] = None
+    peak_memory_bytes: Optional[int] = None
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        if not self.duration_seconds:
+            return None
+        return self.rows / self.duration_seconds
+
+    def _merge(self, other: "StageMetrics") -> None:
+        self.started_at = min(self.started_at, other.started_at)
+        self.duration_seconds += other.duration_seconds
+        self.rows += other.rows
+        self.bytes += other.bytes
+        self.api_calls += other.api_calls
+        self.calls += other.calls
+        for name in UPSERT_COUNTS:
+            value = getattr(other, name)
+            if value is not None:
+                setattr(self, name, (getattr(self, name) or 0) + value)
+        if other.peak_memory_bytes is not None:
+            self.peak_memory_bytes = max(
+                self.peak_memory_bytes or 0, other.peak_memory_bytes
+            )
+
+
+_lock = threading.Lock()
+_records: Dict[Tuple[str, str, str], StageMetrics] = {}
+_track_memory = False
+
+
+def enable_memory_tracking(enabled: bool) -> None:
+    """Record per-stage peak memory; tracemalloc must already be tracing."""
+    global _track_memory
+    _track_memory = enabled
+
+
+def _memory_start() -> Optional[int]:
+    if not _track_memory:
+        return None
+    import tracemalloc
+
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    return current
+
+
+def _memory_stop(metrics: StageMetrics, start: Optional[int]) -> None:
+    if start is None:
+        return
+    import tracemalloc
+
+    peak = tracemalloc.get_traced_memory()[1] - start
+    metrics.peak_memory_bytes = max(metrics.peak_memory_bytes or 0, peak)
+
+
+@contextmanager
+def pipeline_scope(name: str):
+    token = _pipeline.set(name)
+    try:
+        yield
+    finally:
+        _pipeline.reset(token)
+
+
+@contextmanager
+def client_scope(client_code: str):
+    token = _client.set(client_code)
+    try:
+        yield
+    finally:
+        _client.reset(token)
+
+
+def _new_stage(name: str, client_code: Optional[str]) -> StageMetrics:
+    return StageMetrics(
+        pipeline=_pipeline.get() or "adhoc",
+        client_code=(client_code or _client.get() or "*").lower(),
+        stage=name,
+    )
+
+
+def _record(metrics: StageMetrics) -> None:
+    key = (metrics.pipeline, metrics.client_code, metrics.stage)
+    with _lock:
+        existing = _records.get(key)
+        if existing is None:
+            _records[key] = metrics
+        else:
+            existing._merge(metrics)
+
+
+@contextmanager
+def stage(
+    name: str, rows: Optional[int] = None, client_code: Optional[str] = None
+) -> Iterator[StageMetrics]:
+    """
+    Time a stage. Set ``.rows`` on the yielded object (or pass rows=) to
+    record throughput; API calls made inside are counted automatically.
+
+    Args:
+        name: fetch, normalize, stage_load, dedupe or promote
+        rows: Row count, if known up front
+        client_code: Override the client from run_for_clients (for stages that
+            run once per client outside it, e.g. the combined events load)
+    """
+    metrics = _new_stage(name, client_code)
+    if rows is not None:
+        metrics.rows = rows
+    token = _current.set(metrics)
+    memory = _memory_start()
+    start = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.duration_seconds += time.perf_counter() - start
+        _memory_stop(metrics, memory)
+        metrics.calls += 1
+        _current.reset(token)
+        _record(metrics)
+
+
+def iter_stage(
+    name: str, iterable: Iterable[T], count: Callable[[T], int] = lambda _: 1
+) -> Iterator[T]:
+    """
+    Yield from iterable, timing only the time spent producing items (e.g. a
+    paginated API generator), not the caller's work between items.
+    """
+    iterator = iter(iterable)
+    metrics = _new_stage(name, None)
+    try:
+        while True:
+            token = _current.set(metrics)
+            memory = _memory_start()
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                metrics.duration_seconds += time.perf_counter() - start
+                _memory_stop(metrics, memory)
+                _current.reset(token)
+            metrics.rows += count(item)
+            yield item
+    finally:
+        metrics.calls += 1
+        _record(metrics)
+
+
+def record_response(response, *args, **kwargs):
+    """requests response hook: count the call and its size in the active stage."""
+    metrics = _current.get()
+    if metrics is not None:
+        size = response.headers.get("Content-Length")
+        with _lock:
+            metrics.api_calls += 1
+            metrics.bytes += int(size) if size and size.isdigit() else len(response.content)
+    return response
+
+
+def instrument_session(session) -> None:
+    hooks = session.hooks.setdefault("response", [])
+    if record_response not in hooks:
+        hooks.append(record_response)
+
+
+def drain() -> List[StageMetrics]:
+    """Return everything recorded so far and start over (one call per run)."""
+    with _lock:
+        records = list(_records.values())
+        _records.clear()
+    return sorted(records, key=lambda m: (m.pipeline, m.client_code, m.started_at))
+
+
+def summarize(run_id: str, label: str, records: List[StageMetrics]) -> dict:
+    stages = []
+    for metrics in records:
+        row = asdict(metrics)
+        row["started_at"] = metrics.started_at.isoformat()
+        row["duration_seconds"] = round(metrics.duration_seconds, 4)
+        rate = metrics.rows_per_second
+        row["rows_per_second"] = round(rate, 1) if rate is not None else None
+        stages.append(row)
+
+    totals: Dict[str, dict] = {}
+    for metrics in records:
+        total = totals.setdefault(
+            metrics.stage,
+            {"duration_seconds": 0.0, "rows": 0, "bytes": 0, "api_calls": 0},
+        )
+        total["duration_seconds"] = round(
+            total["duration_seconds"] + metrics.duration_seconds, 4
+        )
+        total["rows"] += metrics.rows
+        total["bytes"] += metrics.bytes
+        total["api_calls"] += metrics.api_calls
+        for name in UPSERT_COUNTS:
+            value = getattr(metrics, name)
+            if value is not None:
+                total[name] = total.get(name, 0) + value
+
+    return {"run_id": run_id, "label": label, "stages": stages, "totals": totals}
+
+
+def write_summary(path: str, run_id: str, label: str, records: List[StageMetrics]) -> None:
+    with open(path, "w") as f:
+        json.dump(summarize(run_id, label, records), f, indent=2)
+    print(f"[METRICS] Saved {len(records)} stage metrics to {path}")
@@ -4,6 +4,7 @@ from typing import Dict, Iterable, List, Optional
 
 from ingestion.utils.datetime import format_date, parse_iso_datetime
 from ingestion.utils.normalize import normalize_email, normalize_phone_number
+from ingestion.utils.row_hash import member_row_hash
 
 
 def _resolve_primary_membership(user: Dict) -> Dict:
@@ -71,22 +72,22 @@ def normalize_members(
         # is_premium_member: 1 if membershipType is NOT "NONE", 0 if it is "NONE"
         is_premium_member = 1 if membership_type_name != "NONE" else 0
 
-        normalized.append(
-            {
-                "client_code": facility_code,
-                "member_id": user_id,
-                "club_member_key": user_id,
-                "first_name": user.get("firstName"),
-                "last_name": user.get("lastName"),
-                "gender": user.get("gender"),
-                "date_of_birth": birthday_date,
-                "email": email,
-                "phone_number": phone_number,
-                "membership_type_name": membership_type_name,
-                "is_premium_member": is_premium_member,
-                "member_since": member_since_date,
-            }
-        )
+        row = {
+            "client_code": facility_code,
+            "member_id": user_id,
+            "club_member_key": user_id,
+            "first_name": user.get("firstName"),
+            "last_name": user.get("lastName"),
+            "gender": user.get("gender"),
+            "date_of_birth": birthday_date,
+            "email": email,
+            "phone_number": phone_number,
+            "membership_type_name": membership_type_name,
+            "is_premium_member": is_premium_member,
+            "member_since": member_since_date,
+        }
+        row["row_hash"] = member_row_hash(row)
+        normalized.append(row)
 
     print(
         f"[NORMALIZATION] Input users: {input_count} | "
@@ -0,0 +1,172 @@
+"""cProfile + tracemalloc around one ingestion run.
+
+Enabled with ``python -m ingestion.main <option> --profile`` or
+INGEST_PROFILE=true, so production runners can be profiled without code
+changes. Profiling forces pipelines and clients to run serially in the main
+thread (cProfile only sees the thread it was enabled in). Writes to
+elt_output_jsons/:
+
+    profile_<option>.pstats  Raw cProfile stats (snakeviz, pstats)
+    profile_<option>.txt     Top functions by cumulative and own time
+    profile_<option>.json    Hotspots, top allocation sites and peak
+                             traced memory per stage
+
+    PROFILE_TOP_N           Functions / allocation sites listed (default 30)
+    PROFILE_TRACEMALLOC_FRAMES  Stack depth kept per allocation (default 1)
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from typing import Callable, List, Optional
+
+from ingestion import metrics
+
+DEFAULT_TOP_N = 30
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        return default
+    return max(1, value)
+
+
+def get_top_n() -> int:
+    return _env_int("PROFILE_TOP_N", DEFAULT_TOP_N)
+
+
+class RunProfiler:
+    """Context manager that profiles CPU and memory of the code inside it."""
+
+    def __init__(self, label: str, top_n: Optional[int] = None):
+        self.label = label
+        self.top_n = top_n or get_top_n()
+        self.profile = cProfile.Profile()
+        self.wall_seconds = 0.0
+        self.peak_memory_bytes = 0
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._start = 0.0
+
+    def __enter__(self) -> "RunProfiler":
+        tracemalloc.start(_env_int("PROFILE_TRACEMALLOC_FRAMES", 1))
+        metrics.enable_memory_tracking(True)
+        self._start = time.perf_counter()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.profile.disable()
+        self.wall_seconds = time.perf_counter() - self._start
+        metrics.enable_memory_tracking(False)
+        # Peak since the last per-stage reset; stage peaks cover the rest
+        self.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+        self.snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    def _hotspots(self, stats: pstats.Stats, sort_key: str) -> List[dict]:
+        rows = []
+        for (filename, line, function), (
+            _primitive_calls,
+            ncalls,
+            tottime,
+            cumtime,
+            _callers,
+        ) in stats.stats.items():
+            rows.append(
+                {
+                    "function": f"{filename}:{line}({function})",
+                    "ncalls": ncalls,
+                    "tottime": round(tottime, 4),
+                    "cumtime": round(cumtime, 4),
+                }
+            )
+        rows.sort(key=lambda row: row[sort_key], reverse=True)
+        return rows[: self.top_n]
+
+    def _top_allocations(self) -> List[dict]:
+        if self.snapshot is None:
+            return []
+        snapshot = self.snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            )
+        )
+        return [
+            {
+                "location": str(stat.traceback),
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in snapshot.statistics("lineno")[: self.top_n]
+        ]
+
+    def write(
+        self,
+        output_path: Callable[[str], str],
+        records: List[metrics.StageMetrics],
+    ) -> None:
+        """
+        Save the pstats dump, text hotspot summary and JSON report.
+
+        Args:
+            output_path: Maps a filename to its path in the output directory
+            records: Stage metrics of the profiled run (for per-stage peaks)
+        """
+        pstats_path = output_path(f"profile_{self.label}.pstats")
+        self.profile.dump_stats(pstats_path)
+
+        text = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=text)
+        stats.strip_dirs()
+        for sort_key in ("cumulative", "tottime"):
+            text.write(f"\n=== Top {self.top_n} by {sort_key} ===\n")
+            stats.sort_stats(sort_key).print_stats(self.top_n)
+        with open(output_path(f"profile_{self.label}.txt"), "w") as f:
+            f.write(text.getvalue())
+
+        stages = [
+            {
+                "pipeline": record.pipeline,
+                "client_code": record.client_code,
+                "stage": record.stage,
+                "duration_seconds": round(record.duration_seconds, 4),
+                "rows": record.rows,
+                "peak_memory_bytes": record.peak_memory_bytes,
+            }
+            for record in records
+        ]
+        report = {
+            "label": self.label,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "peak_memory_bytes": max(
+                [self.peak_memory_bytes]
+                + [stage["peak_memory_bytes"] or 0 for stage in stages]
+            ),
+            "hotspots_cumulative": self._hotspots(stats, "cumtime"),
+            "hotspots_own_time": self._hotspots(stats, "tottime"),
+            "top_allocations": self._top_allocations(),
+            "stages": sorted(
+                stages, key=lambda stage: stage["peak_memory_bytes"] or 0, reverse=True
+            ),
+        }
+        json_path = output_path(f"profile_{self.label}.json")
+        with open(json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+        print(
+            f"[PROFILE] {self.label}: {self.wall_seconds:.1f}s, "
+            f"peak traced memory {report['peak_memory_bytes'] / 1e6:.1f} MB"
+        )
+        print(f"[PROFILE] Saved {pstats_path}, {json_path}")
@@ -0,0 +1,255 @@
+"""Small in-process DAG scheduler for ingestion pipelines.
+
+Pipelines declare the pipelines they depend on; anything whose dependencies
+have succeeded is started right away, so independent branches (members,
+events, availability) run in parallel and the run takes as long as its
+longest branch. A pipeline whose dependency failed is skipped, not run.
+With a limit of 1, pipelines run one after another in the calling thread.
+
+    INGEST_MAX_PIPELINES  Pipelines running at once (default 4)
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ingestion import metrics
+
+DEFAULT_MAX_PIPELINES = 4
+
+SUCCESS = "success"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class Task:
+    name: str
+    func: Callable[[], None]
+    depends_on: Tuple[str, ...] = ()
+
+
+@dataclass
+class TaskResult:
+    name: str
+    status: str
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration_seconds: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class RunReport:
+    label: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    tasks: List[TaskResult] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(task.status == SUCCESS for task in self.tasks)
+
+    @property
+    def duration_seconds(self) -> float:
+        if not self.finished_at:
+            return 0.0
+        return (self.finished_at - self.started_at).total_seconds()
+
+    def to_dict(self) -> dict:
+        return {
+            "label": self.label,
+            "ok": self.ok,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "tasks": [
+                {
+                    "name": task.name,
+                    "status": task.status,
+                    "started_at": (
+                        task.started_at.isoformat() if task.started_at else None
+                    ),
+                    "finished_at": (
+                        task.finished_at.isoformat() if task.finished_at else None
+                    ),
+                    "duration_seconds": round(task.duration_seconds, 3),
+                    "error": task.error,
+                }
+                for task in self.tasks
+            ],
+        }
+
+    def print_summary(self) -> None:
+        print("\n" + "=" * 80)
+        status = "OK" if self.ok else "FAILED"
+        print(f"[RUN REPORT] {self.label}: {status} in {self.duration_seconds:.1f}s")
+        print("=" * 80)
+        for task in self.tasks:
+            line = f"  {task.name:<45} {task.status:<8} {task.duration_seconds:8.1f}s"
+            if task.error:
+                line += f"  {task.error}"
+            print(line)
+        print("=" * 80)
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        print(f"[RUN REPORT] Saved run report to {path}")
+
+
+def get_max_pipelines() -> int:
+    raw = os.getenv("INGEST_MAX_PIPELINES")
+    if not raw:
+        return DEFAULT_MAX_PIPELINES
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_MAX_PIPELINES
+    return max(1, value)
+
+
+def _validate(tasks: Sequence[Task]) -> Dict[str, Task]:
+    by_name: Dict[str, Task] = {}
+    for task in tasks:
+        if task.name in by_name:
+            raise ValueError(f"Duplicate task name: {task.name}")
+        by_name[task.name] = task
+
+    for task in tasks:
+        for dependency in task.depends_on:
+            if dependency not in by_name:
+                raise ValueError(
+                    f"Task {task.name} depends on unknown task {dependency}"
+                )
+
+    # Kahn's algorithm: every task must be reachable without a cycle
+    remaining = {task.name: set(task.depends_on) for task in tasks}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle between tasks: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+    return by_name
+
+
+def _run_task(task: Task) -> TaskResult:
+    started_at = datetime.now(timezone.utc)
+    start = time.perf_counter()
+    print(f"\n[SCHEDULER] Starting {task.name}")
+    try:
+        with metrics.pipeline_scope(task.name):
+            task.func()
+    except (Exception, SystemExit) as exc:
+        # SystemExit from a pipeline should fail that task, not the scheduler
+        traceback.print_exc()
+        return TaskResult(
+            name=task.name,
+            status=FAILED,
+            started_at=started_at,
+            finished_at=datetime.now(timezone.utc),
+            duration_seconds=time.perf_counter() - start,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    print(f"[SCHEDULER] Finished {task.name}")
+    return TaskResult(
+        name=task.name,
+        status=SUCCESS,
+        started_at=started_at,
+        finished_at=datetime.now(timezone.utc),
+        duration_seconds=time.perf_counter() - start,
+    )
+
+
+def run_dag(
+    label: str, tasks: Sequence[Task], max_parallel: Optional[int] = None
+) -> RunReport:
+    """
+    Run tasks respecting their dependencies, independent tasks in parallel.
+
+    Args:
+        label: Name of the run, used in the report
+        tasks: Tasks to run; depends_on must only reference tasks in this list
+        max_parallel: Override INGEST_MAX_PIPELINES
+
+    Returns:
+        RunReport with one TaskResult per task, in declaration order
+    """
+    by_name = _validate(tasks)
+    report = RunReport(label=label, started_at=datetime.now(timezone.utc))
+    results: Dict[str, TaskResult] = {}
+    pending = [task.name for task in tasks]
+    running: Dict[Future, str] = {}
+    workers = max_parallel or get_max_pipelines()
+
+    print(
+        f"[SCHEDULER] {label}: {len(tasks)} pipeline(s), up to {workers} in parallel"
+    )
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="pipeline"
+    ) as pool:
+        while pending or running:
+            for name in list(pending):
+                deps = by_name[name].depends_on
+                failed = [
+                    dep
+                    for dep in deps
+                    if dep in results and results[dep].status != SUCCESS
+                ]
+                if failed:
+                    results[name] = TaskResult(
+                        name=name,
+                        status=SKIPPED,
+                        error=f"dependency not successful: {', '.join(failed)}",
+                    )
+                    pending.remove(name)
+                    print(f"[SCHEDULER] Skipping {name} ({results[name].error})")
+                elif all(dep in results for dep in deps):
+                    pending.remove(name)
+                    if workers <= 1:
+                        results[name] = _run_task(by_name[name])
+                        continue
+                    context = contextvars.copy_context()
+                    future = pool.submit(context.run, _run_task, by_name[name])
+                    running[future] = name
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+
+    report.finished_at = datetime.now(timezone.utc)
+    report.tasks = [results[task.name] for task in tasks]
+    return report
+
+
+def report_and_exit_on_failure(
+    report: RunReport, json_path: Optional[str] = None
+) -> None:
+    """Print the combined report, optionally save it, and exit 1 if anything failed."""
+    report.print_summary()
+    if json_path:
+        report.write_json(json_path)
+    if not report.ok:
+        print(
+            f"[RUN REPORT] {report.label} had failed or skipped pipelines",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
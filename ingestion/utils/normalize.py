@@ -1,7 +1,15 @@
 from __future__ import annotations
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+# Both normalizers run for every member on every refresh and most values repeat
+# between runs, so the patterns are compiled once and results are memoized.
+NORMALIZE_CACHE_SIZE = 1 << 17
+
+_PHONE_FORMATTING_RE = re.compile(r'[\s\-\(\)\.]')
+_NON_DIGIT_RE = re.compile(r'\D')
 
 
 def normalize_phone_number(phone: Optional[str]) -> Optional[str]:
@@ -22,7 +30,19 @@ def normalize_phone_number(phone: Optional[str]) -> Optional[str]:
     """
     if not phone:
         return None
-    
+    try:
+        return _normalize_phone_number_cached(phone)
+    except TypeError:
+        # Unhashable input can't be memoized
+        return _normalize_phone_number(phone)
+
+
+def normalize_phone_numbers(phones: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """Normalize a batch of phone numbers, see normalize_phone_number."""
+    return [normalize_phone_number(phone) for phone in phones]
+
+
+def _normalize_phone_number(phone) -> Optional[str]:
     # Convert to string and strip whitespace
     phone_str = str(phone).strip()
     if not phone_str:
@@ -30,7 +50,7 @@ def normalize_phone_number(phone: Optional[str]) -> Optional[str]:
     
     # Remove common formatting characters (spaces, dashes, parentheses, dots)
     # But keep + sign
-    phone_clean = re.sub(r'[\s\-\(\)\.]', '', phone_str)
+    phone_clean = _PHONE_FORMATTING_RE.sub('', phone_str)
     
     # If it's already in +1XXXXXXXXXX format, return as-is
     if phone_clean.startswith('+1') and len(phone_clean) == 12:
@@ -41,7 +61,7 @@ def normalize_phone_number(phone: Optional[str]) -> Optional[str]:
         return phone_clean
     
     # Extract only digits
-    digits_only = re.sub(r'\D', '', phone_clean)
+    digits_only = _NON_DIGIT_RE.sub('', phone_clean)
     
     if not digits_only:
         return None
@@ -80,6 +100,11 @@ def normalize_phone_number(phone: Optional[str]) -> Optional[str]:
     return None
 
 
+_normalize_phone_number_cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE, typed=True)(
+    _normalize_phone_number
+)
+
+
 def normalize_email(email: Optional[str]) -> Optional[str]:
     """
     Normalize email addresses to consistent format.
@@ -96,19 +121,35 @@ def normalize_email(email: Optional[str]) -> Optional[str]:
     """
     if not email:
         return None
-    
+    try:
+        return _normalize_email_cached(email)
+    except TypeError:
+        return _normalize_email(email)
+
+
+def normalize_emails(emails: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """Normalize a batch of email addresses, see normalize_email."""
+    return [normalize_email(email) for email in emails]
+
+
+def _normalize_email(email) -> Optional[str]:
     email_str = str(email).strip().lower()
     
     if not email_str:
         return None
     
-    # Basic email validation (has @ and at least one character before and after)
-    if '@' not in email_str or len(email_str.split('@')) != 2:
+    # Basic email validation (exactly one @ and at least one character before and after)
+    if email_str.count('@') != 1:
         return None
     
-    local, domain = email_str.split('@')
+    local, _, domain = email_str.partition('@')
     if not local or not domain:
         return None
     
     return email_str
 
+
+_normalize_email_cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE, typed=True)(
+    _normalize_email
+)
+
@@ -0,0 +1,54 @@
+"""Content hashes for skipping no-op upserts.
+
+Normalizers store a hash of a row's content columns in ``row_hash``; the
+upserts only rewrite a PROD row when the stored hash differs, so unchanged
+rows cost neither WAL nor dead tuples.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Sequence
+
+# members_raw columns that make up a member's content (not the key or created_at)
+MEMBER_HASH_FIELDS = (
+    "first_name",
+    "last_name",
+    "gender",
+    "phone_number",
+    "date_of_birth",
+    "email",
+    "membership_type_name",
+    "is_premium_member",
+    "member_since",
+)
+
+# facility_events_raw columns that make up an event's content; skill_level is
+# derived from event_name and kept out so reclassification doesn't churn rows
+EVENT_HASH_FIELDS = (
+    "event_name",
+    "event_description",
+    "event_type",
+    "event_end_time",
+    "num_registrants",
+    "max_registrants",
+    "admission_rate_regular",
+    "admission_rate_member",
+)
+
+
+def row_hash(record: dict, fields: Sequence[str]) -> str:
+    """Hex digest of the record's values for these fields, in order."""
+    payload = json.dumps(
+        [record.get(field) for field in fields], default=str, separators=(",", ":")
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def member_row_hash(member: dict) -> str:
+    return row_hash(member, MEMBER_HASH_FIELDS)
+
+
+def event_row_hash(event: dict) -> str:
+    return row_hash(event, EVENT_HASH_FIELDS)
@@ -39,6 +39,57 @@ class EltWatermark(Base):
     )
 
 
+class EltCheckpoint(Base):
+    """Per-window progress of windowed ingestions, used to resume after a failure."""
+
+    __tablename__ = "elt_checkpoints"
+
+    pipeline = Column(Text, nullable=False)
+    client_code = Column(Text, nullable=False)
+    window_start = Column(DateTime(timezone=True), nullable=False)
+    window_end = Column(DateTime(timezone=True), nullable=False)
+    page = Column(Integer)
+    status = Column(Text, nullable=False)  # 'in_progress' or 'committed'
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        PrimaryKeyConstraint("pipeline", "client_code", "window_start"),
+    )
+
+
+class IngestionRunMetric(Base):
+    """Wall time and throughput of one stage of one pipeline for one client per run."""
+
+    __tablename__ = "ingestion_run_metrics"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    run_id = Column(Text, nullable=False)
+    run_label = Column(Text, nullable=False)
+    pipeline = Column(Text, nullable=False)
+    client_code = Column(Text, nullable=False)
+    stage = Column(Text, nullable=False)  # fetch, normalize, stage_load, dedupe, promote
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    duration_seconds = Column(Numeric(12, 4), nullable=False)
+    rows = Column(Integer, nullable=False)
+    bytes = Column(BigInteger, nullable=False)
+    api_calls = Column(Integer, nullable=False)
+    calls = Column(Integer, nullable=False)
+    # Set by upsert stages that count them (member and event promotes)
+    inserted = Column(Integer)
+    updated = Column(Integer)
+    unchanged = Column(Integer)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "ingestion_run_metrics_pipeline_client_started_idx",
+            "pipeline",
+            "client_code",
+            "started_at",
+        ),
+    )
+
+
 class MemberRaw(Base):
     """Raw members table."""
 
@@ -52,6 +103,7 @@ class MemberRaw(Base):
     date_of_birth = Column(Date)
     phone_number = Column(Text)
     email = Column(Text)
+    row_hash = Column(Text)  # ingestion.utils.row_hash.member_row_hash
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
@@ -73,6 +125,7 @@ class MemberRawStg(Base):
     phone_number = Column(Text)
     club_member_key = Column(Text)
     email = Column(Text)
+    row_hash = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
@@ -83,7 +136,13 @@ class MemberRawStg(Base):
 
 
 class ReservationRaw(Base):
-    """Raw reservations table."""
+    """Raw reservations table.
+
+    Note: Range-partitioned by month of reservation_start_at (migration
+    partition_reservation_tables), which drops the primary key; it stays here
+    for SQLAlchemy compatibility. The unique index includes reservation_start_at
+    because unique indexes on a partitioned table must contain the partition key.
+    """
 
     __tablename__ = "reservations_raw"
 
@@ -100,13 +159,15 @@ class ReservationRaw(Base):
 
     __table_args__ = (
         Index(
-            "reservations_raw_client_res_member_idx",
+            "reservations_raw_client_res_member_start_idx",
             "client_code",
             "reservation_id",
             "member_id",
+            "reservation_start_at",
             unique=True,
         ),
         PrimaryKeyConstraint("client_code", "reservation_id"),
+        {"postgresql_partition_by": "RANGE (reservation_start_at)"},
     )
 
 
@@ -149,7 +210,12 @@ class ReservationRawStg(Base):
 
 
 class ReservationCancellationRaw(Base):
-    """Raw reservation cancellations table."""
+    """Raw reservation cancellations table.
+
+    Note: Range-partitioned by month of cancelled_on (migration
+    partition_reservation_tables). The id primary key is kept here for SQLAlchemy
+    compatibility; the table itself has a unique index on (id, cancelled_on).
+    """
 
     __tablename__ = "reservation_cancellations_raw"
 
@@ -178,6 +244,16 @@ class ReservationCancellationRaw(Base):
     source_system = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index(
+            "reservation_cancellations_raw_id_cancelled_on_idx",
+            "id",
+            "cancelled_on",
+            unique=True,
+        ),
+        {"postgresql_partition_by": "RANGE (cancelled_on)"},
+    )
+
 
 class FacilityEventCategory(Base):
     """Facility event categories table."""
@@ -209,16 +285,21 @@ class FacilityEventRaw(Base):
     admission_rate_regular = Column(Numeric)
     admission_rate_member = Column(Numeric)
     skill_level = Column(Text)
+    row_hash = Column(Text)  # ingestion.utils.row_hash.event_row_hash
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
 class FacilityCourtAvailability(Base):
-    """Facility court availabilities table."""
+    """Facility court availabilities table.
+
+    Note: List-partitioned by client_code, one partition per client (migration
+    partition_court_availabilities).
+    """
 
     __tablename__ = "facility_court_availabilities"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    client_code = Column(Text, nullable=False)
+    client_code = Column(Text, nullable=False, primary_key=True)
     source_system = Column(Text, nullable=False)
     court_id = Column(Text, nullable=False)
     court_name = Column(Text, nullable=True)
@@ -227,6 +308,8 @@ class FacilityCourtAvailability(Base):
     period_type = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = ({"postgresql_partition_by": "LIST (client_code)"},)
+
 
 class Organization(Base):
     """Organizations table."""